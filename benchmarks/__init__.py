@@ -0,0 +1 @@
+# This file is needed for the benchmarks to be run as modules (python -m benchmarks.<name>)
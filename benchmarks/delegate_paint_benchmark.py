@@ -0,0 +1,71 @@
+import time
+from qtpy.QtCore import Qt, QAbstractTableModel, QModelIndex
+from qtpy.QtWidgets import QApplication, QTableView, QStyledItemDelegate
+from src.pyqt_phone_input.countries import countries, country_codes
+from src.pyqt_phone_input.phone_input_delegate import PhoneInputDelegate
+
+
+class PhoneNumberModel(QAbstractTableModel):
+
+    def __init__(self, rows: int, parent=None):
+        """Create a new PhoneNumberModel instance (phone numbers are generated from the row)
+
+        :param rows: number of rows
+        :param parent: the parent object
+        """
+
+        super(PhoneNumberModel, self).__init__(parent)
+        self.__rows = rows
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self.__rows
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else 1
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            country = country_codes[index.row() % len(country_codes)]
+            return '{}{:09d}'.format(countries[country][1], index.row())
+        return None
+
+
+def run(rows: int = 50000, frames: int = 200):
+    """Measure frame times while scrolling a QTableView with a PhoneInputDelegate
+    through many rows (compared with the default delegate painting plain text)
+
+    :param rows: number of rows of the model
+    :param frames: number of scroll steps
+    """
+
+    app = QApplication.instance() or QApplication([])
+    model = PhoneNumberModel(rows)
+
+    for name, delegate_class in (('QStyledItemDelegate', QStyledItemDelegate),
+                                 ('PhoneInputDelegate', PhoneInputDelegate)):
+        view = QTableView()
+        view.setItemDelegate(delegate_class(view))
+        view.setModel(model)
+        view.verticalHeader().setDefaultSectionSize(24)
+        view.resize(400, 600)
+        view.show()
+        app.processEvents()
+
+        scroll_bar = view.verticalScrollBar()
+        step = max(1, scroll_bar.maximum() // frames)
+        start = time.perf_counter()
+        for frame in range(frames):
+            scroll_bar.setValue(frame * step)
+            view.viewport().repaint()
+        seconds = time.perf_counter() - start
+
+        visible_rows = view.viewport().height() // view.verticalHeader().defaultSectionSize()
+        print('{:20s} {:6d} rows: {:6.2f} ms per frame, {:8.0f} cells painted per second'.format(
+            name, rows, seconds / frames * 1000, visible_rows * frames / seconds))
+        view.close()
+        view.deleteLater()
+        app.processEvents()
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+import time
+from qtpy.QtCore import Qt
+from qtpy.QtGui import QPixmap
+from qtpy.QtWidgets import QApplication
+from src.pyqt_phone_input import flag_cache
+from src.pyqt_phone_input.countries import countries
+
+# Directory containing the loose flag icons (atlas source, only available in the source tree)
+ICON_DIRECTORY = os.path.join(os.path.dirname(flag_cache.__file__), 'flag_icons')
+
+
+def load_loose_flag(country: str, flag_size: int) -> QPixmap:
+    """Load a flag from its own file (the way flags were loaded before the atlases)
+
+    :param country: country code (i.e. 'us')
+    :param flag_size: flag size in pixels
+    :return: flag pixmap
+    """
+
+    return QPixmap(os.path.join(ICON_DIRECTORY, '{}.png'.format(country))).scaled(
+        flag_size, flag_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+
+def time_load(atlas: bool) -> float:
+    """Load every flag into an empty cache
+
+    :param atlas: whether the flags are sliced from the atlas or loaded from the loose icons
+    :return: seconds spent loading
+    """
+
+    flag_cache.clear_flag_cache()
+
+    start = time.perf_counter()
+    if atlas:
+        flag_cache.warm_up_flag_cache()
+    else:
+        for country in countries:
+            load_loose_flag(country, flag_cache.ICON_FLAG_SIZE)
+    return time.perf_counter() - start
+
+
+def run(repeats: int = 5):
+    """Compare cold (first load in a new process) and warm (reload in the same process)
+    load times of the flag atlas and the loose flag icons
+
+    :param repeats: number of warm loads (the fastest one is reported)
+    """
+
+    for atlas in (False, True):
+        # Cold load in a fresh process (the files may still be in the OS page cache)
+        output = subprocess.check_output([sys.executable, '-m', 'benchmarks.flag_atlas_benchmark',
+                                          'cold', str(int(atlas))])
+        cold = float(output.decode().split()[-1])
+
+        app = QApplication.instance() or QApplication([])
+        warm = min(time_load(atlas) for _ in range(repeats))
+        loads = flag_cache.get_flag_cache_stats()['loads'] if atlas else len(countries)
+        print('{:11s}: {:8.2f} ms cold, {:8.2f} ms warm, {:3d} file loads'.format(
+            'atlas' if atlas else 'loose files', cold * 1000, warm * 1000, loads))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3 and sys.argv[1] == 'cold':
+        app = QApplication([])
+        print(time_load(bool(int(sys.argv[2]))))
+    else:
+        run()
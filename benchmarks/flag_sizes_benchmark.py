@@ -0,0 +1,79 @@
+import os
+import resource
+import subprocess
+import sys
+import time
+from qtpy.QtCore import Qt
+from qtpy.QtWidgets import QApplication
+from src.pyqt_phone_input import flag_cache
+from src.pyqt_phone_input.countries import countries
+from src.pyqt_phone_input.flag_atlas import get_flag_size
+from .flag_atlas_benchmark import ICON_DIRECTORY, load_loose_flag
+
+
+def get_directory_size(directory: str) -> int:
+    """Get the total size of the files in a directory
+
+    :param directory: directory path
+    :return: size in bytes
+    """
+
+    return sum(entry.stat().st_size for entry in os.scandir(directory) if entry.is_file())
+
+
+def measure(atlas: bool, icon_size: int, device_pixel_ratio: float) -> tuple:
+    """Load the item icons and the flags drawn by the dropdowns of all countries
+
+    :param atlas: whether the flags are sliced from the atlases or loaded from the loose icons
+    :param icon_size: size the dropdown flag is drawn at
+    :param device_pixel_ratio: device pixel ratio of the screen
+    :return: tuple of seconds spent decoding and peak resident memory growth in bytes
+    """
+
+    memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    if atlas:
+        flag_cache.warm_up_flag_cache()
+        for country in countries:
+            flag_cache.get_scaled_flag_pixmap(country, icon_size, device_pixel_ratio)
+    else:
+        # Same sizes as the atlas path, every flag decoded from its full-size file
+        device_size = round(icon_size * device_pixel_ratio)
+        flags = []
+        for country in countries:
+            flags.append(load_loose_flag(country, flag_cache.ICON_FLAG_SIZE))
+            flags.append(load_loose_flag(country, get_flag_size(device_size)).scaled(
+                device_size, device_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+    seconds = time.perf_counter() - start
+
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - memory
+    return seconds, memory if sys.platform == 'darwin' else memory * 1024
+
+
+def run():
+    """Compare package size, resident memory and decode time of the full-size loose
+    flag icons and the pre-downscaled flag atlases"""
+
+    directory = os.path.dirname(flag_cache.__file__)
+    print('package size: {:.2f} MB loose icons, {:.2f} MB atlases'.format(
+        get_directory_size(ICON_DIRECTORY) / 1e6, get_directory_size(directory + '/flag_atlases') / 1e6))
+
+    for device_pixel_ratio in (1.0, 2.0):
+        for atlas in (False, True):
+            # Every measurement runs in a fresh process, so caches and memory start empty
+            output = subprocess.check_output([sys.executable, '-m', 'benchmarks.flag_sizes_benchmark',
+                                              str(int(atlas)), str(device_pixel_ratio)])
+            seconds, memory = output.decode().split()[-2:]
+            print('{:11s} @{:.0f}x: {:8.2f} ms decode, {:6.1f} MB peak resident memory growth'.format(
+                'atlases' if atlas else 'loose icons', device_pixel_ratio,
+                float(seconds) * 1000, int(memory) / 1e6))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        app = QApplication([])
+        print(*measure(bool(int(sys.argv[1])), 21, float(sys.argv[2])))
+    else:
+        run()
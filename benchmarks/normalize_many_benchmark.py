@@ -0,0 +1,69 @@
+import random
+import time
+from src.pyqt_phone_input import core
+from src.pyqt_phone_input.countries import country_codes
+
+
+def generate_rows(count: int, seed: int = 0):
+    """Generate random country and local number pairs
+
+    :param count: number of pairs
+    :param seed: random seed
+    :return: tuple of country list and number list
+    """
+
+    rng = random.Random(seed)
+    country_list = [rng.choice(country_codes) for _ in range(count)]
+    number_list = ['{:03d} {:03d} {:04d}'.format(rng.randrange(1000), rng.randrange(1000), rng.randrange(10000))
+                   for _ in range(count)]
+    return country_list, number_list
+
+
+def normalize_per_row(country_list, number_list):
+    """Reference implementation normalizing one pair at a time
+
+    :param country_list: list of country codes
+    :param number_list: list of local numbers
+    :return: tuple of phone numbers and validity flags
+    """
+
+    phone_numbers = []
+    valid = []
+    for country, number in zip(country_list, number_list):
+        phone_number = core.get_phone_number(country, number)
+        is_valid = (phone_number is not None and phone_number[1:].isdigit()
+                    and len(phone_number) - 1 <= core.MAX_PHONE_NUMBER_LENGTH)
+        phone_numbers.append(phone_number if is_valid else '')
+        valid.append(is_valid)
+    return phone_numbers, valid
+
+
+def run(count: int = 1000000):
+    """Compare the throughput of normalize_many and the per-row loop
+
+    :param count: number of pairs
+    """
+
+    country_list, number_list = generate_rows(count)
+
+    start = time.perf_counter()
+    expected, _ = normalize_per_row(country_list, number_list)
+    per_row = time.perf_counter() - start
+
+    numpy = core._get_numpy()
+    if numpy is not None:
+        country_list = numpy.asarray(country_list)
+        number_list = numpy.asarray(number_list)
+
+    start = time.perf_counter()
+    phone_numbers, _ = core.normalize_many(country_list, number_list)
+    batch = time.perf_counter() - start
+
+    assert list(phone_numbers) == expected
+    print('{:,} rows (NumPy: {})'.format(count, 'yes' if numpy is not None else 'no'))
+    print('per-row loop:   {:8.3f} s  {:12,.0f} rows/s'.format(per_row, count / per_row))
+    print('normalize_many: {:8.3f} s  {:12,.0f} rows/s'.format(batch, count / batch))
+
+
+if __name__ == '__main__':
+    run()
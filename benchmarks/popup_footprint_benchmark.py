@@ -0,0 +1,73 @@
+import gc
+import resource
+import subprocess
+import sys
+import time
+from qtpy.QtCore import QObject
+from qtpy.QtWidgets import QApplication, QWidget
+from src.pyqt_phone_input import PhoneInput, CompactPhoneInput
+
+# Widgets compared (name -> function creating a widget with the given parent)
+WIDGETS = {
+    'own popup': lambda parent=None: PhoneInput(parent),
+    'shared popup': lambda parent=None: PhoneInput(parent, shared_popup=True),
+    'compact': lambda parent=None: CompactPhoneInput(parent)
+}
+
+
+def get_peak_memory() -> int:
+    """Get the peak resident memory of the process
+
+    :return: peak resident memory in bytes
+    """
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def measure(widget: str, instances: int) -> tuple:
+    """Create many widgets and measure their footprint
+
+    :param widget: name of the widget in WIDGETS
+    :param instances: number of widgets
+    :return: tuple of bytes, QObjects and seconds per instance
+    """
+
+    app = QApplication([])
+
+    # Shared models, caches and the shared popup aren't part of the per-instance footprint
+    WIDGETS[widget]().deleteLater()
+    window = QWidget()
+    gc.collect()
+    memory = get_peak_memory()
+
+    start = time.perf_counter()
+    widgets = [WIDGETS[widget](window) for _ in range(instances)]
+    seconds = time.perf_counter() - start
+    gc.collect()
+
+    return ((get_peak_memory() - memory) / instances, len(window.findChildren(QObject)) / instances,
+            seconds / instances)
+
+
+def run(instances: int = 1000):
+    """Compare the per-instance footprint of PhoneInputs (with their own and with the shared popup)
+    and CompactPhoneInputs (every widget is measured in a fresh process, so the peak memory only
+    contains the instances)
+
+    :param instances: number of widgets
+    """
+
+    for widget in WIDGETS:
+        output = subprocess.check_output([sys.executable, '-m', 'benchmarks.popup_footprint_benchmark',
+                                          'measure', widget, str(instances)])
+        memory, objects, seconds = map(float, output.decode().split())
+        print('{:12s}: {:7.1f} KiB, {:5.1f} QObjects, {:6.2f} ms to construct per instance'.format(
+            widget, memory / 1024, objects, seconds * 1000))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 4 and sys.argv[1] == 'measure':
+        print(*measure(sys.argv[2], int(sys.argv[3])))
+    else:
+        run()
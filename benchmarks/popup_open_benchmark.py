@@ -0,0 +1,64 @@
+import time
+from qtpy.QtCore import Qt
+from qtpy.QtWidgets import QApplication
+from src.pyqt_phone_input import PhoneInput
+from src.pyqt_phone_input.countries import country_codes
+from src.pyqt_phone_input.country_dropdown import CountryDropdown
+from src.pyqt_phone_input.country_list_model import CountryListModel
+
+
+class CountingCountryListModel(CountryListModel):
+
+    def __init__(self, country_codes, parent=None):
+        """Create a new CountingCountryListModel instance (counts decoration requests)
+
+        :param country_codes: codes of the countries to include
+        :param parent: the parent object
+        """
+
+        super(CountingCountryListModel, self).__init__(country_codes, parent)
+        self.decoration_requests = 0
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DecorationRole:
+            self.decoration_requests += 1
+        return super().data(index, role)
+
+
+def run(repeats: int = 5):
+    """Measure popup open latency and decoration requests for growing country lists
+    (the country list is repeated to simulate subdivisions or carrier-specific entries)
+
+    :param repeats: number of times the popup is opened (the fastest one is reported)
+    """
+
+    app = QApplication.instance() or QApplication([])
+
+    for factor in (1, 10, 100):
+        phone_input = PhoneInput()
+        phone_input.resize(300, 30)
+        phone_input.show()
+        country_dropdown = phone_input.findChild(CountryDropdown)
+        model = CountingCountryListModel(list(country_codes) * factor, country_dropdown)
+        country_dropdown.setModel(model)
+        app.processEvents()
+
+        seconds = []
+        for _ in range(repeats):
+            model.decoration_requests = 0
+            start = time.perf_counter()
+            country_dropdown.showPopup()
+            app.processEvents()
+            seconds.append(time.perf_counter() - start)
+            country_dropdown.hidePopup()
+            app.processEvents()
+
+        print('{:6d} rows: {:7.2f} ms to open, {:5d} decoration requests'.format(
+            model.rowCount(), min(seconds) * 1000, model.decoration_requests))
+        phone_input.close()
+        phone_input.deleteLater()
+        app.processEvents()
+
+
+if __name__ == '__main__':
+    run()
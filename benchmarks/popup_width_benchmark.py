@@ -0,0 +1,50 @@
+import time
+from qtpy.QtWidgets import QApplication, QLineEdit
+from src.pyqt_phone_input.countries import country_codes
+from src.pyqt_phone_input.country_dropdown import CountryDropdown, clear_popup_width_cache
+from src.pyqt_phone_input.country_list_model import CountryListModel
+
+
+def replay_resize_stream(dropdown: CountryDropdown, events: int, cached: bool) -> float:
+    """Resize the dropdown repeatedly
+
+    :param dropdown: dropdown to resize
+    :param events: number of resize events
+    :param cached: whether the cached popup width may be reused between events
+    :return: seconds spent in the resize events
+    """
+
+    start = time.perf_counter()
+    for i in range(events):
+        if not cached:
+            clear_popup_width_cache()
+        dropdown.resize(dropdown.width(), 30 + i % 20)
+    return time.perf_counter() - start
+
+
+def run(events: int = 2000):
+    """Compare the resize cost with and without the popup width cache for different country counts
+
+    :param events: number of resize events
+    """
+
+    app = QApplication.instance() or QApplication([])
+
+    for count in (10, 50, len(country_codes)):
+        dropdown = CountryDropdown()
+        dropdown.setPhoneCodeLineEdit(QLineEdit(dropdown))
+        dropdown.setModel(CountryListModel(country_codes[:count], dropdown))
+        dropdown.show()
+        app.processEvents()
+
+        uncached = replay_resize_stream(dropdown, events, False)
+        cached = replay_resize_stream(dropdown, events, True)
+        print('{:3d} countries: {:7.1f} us per resize uncached, {:7.1f} us per resize cached'.format(
+            count, uncached / events * 1e6, cached / events * 1e6))
+        dropdown.close()
+        dropdown.deleteLater()
+        app.processEvents()
+
+
+if __name__ == '__main__':
+    run()
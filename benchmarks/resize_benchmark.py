@@ -0,0 +1,57 @@
+import time
+from qtpy.QtWidgets import QApplication, QWidget, QVBoxLayout
+from src.pyqt_phone_input import PhoneInput
+
+
+def replay_resize_stream(window: QWidget, phone_inputs: list, events: int) -> tuple:
+    """Resize the window like a user dragging its edge and wait until restyling settled
+
+    :param window: window containing the phone inputs
+    :param phone_inputs: phone inputs inside the window
+    :param events: number of resize events
+    :return: tuple of seconds spent in the resize events and seconds until settled
+    """
+
+    app = QApplication.instance()
+    width = window.width()
+
+    start = time.perf_counter()
+    for i in range(events):
+        window.resize(width + i % 200, 36 * len(phone_inputs) + i % 50)
+    streamed = time.perf_counter() - start
+
+    while any(phone_input.isUpdating() for phone_input in phone_inputs):
+        app.processEvents()
+    return streamed, time.perf_counter() - start
+
+
+def run(instances: int = 100, events: int = 200):
+    """Compare restyling on every resize event with coalesced restyling
+
+    :param instances: number of phone inputs in the window
+    :param events: number of resize events
+    """
+
+    app = QApplication.instance() or QApplication([])
+
+    for delay in (0, 50):
+        window = QWidget()
+        layout = QVBoxLayout(window)
+        phone_inputs = [PhoneInput(window) for _ in range(instances)]
+        for phone_input in phone_inputs:
+            phone_input.setResizeRestyleDelay(delay)
+            layout.addWidget(phone_input)
+        window.resize(400, 36 * instances)
+        window.show()
+        app.processEvents()
+
+        streamed, settled = replay_resize_stream(window, phone_inputs, events)
+        print('restyle delay {:3d} ms: {:8.3f} ms per resize event, {:8.3f} s until settled'.format(
+            delay, streamed / events * 1000, settled))
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,56 @@
+import time
+from qtpy.QtWidgets import QApplication, QLineEdit
+from src.pyqt_phone_input.countries import country_codes
+from src.pyqt_phone_input.country_dropdown import CountryDropdown
+from src.pyqt_phone_input.country_list_model import CountryListModel
+from src.pyqt_phone_input.country_search_index import CountrySearchIndex
+
+# Queries typed one character at a time
+QUERIES = ('united kingdom', 'germany', '+44', 'st lucia')
+
+
+def run():
+    """Measure the index lookup and the popup filtering per keystroke for growing country lists
+    (the country list is repeated to simulate subdivisions or carrier-specific entries)"""
+
+    app = QApplication.instance() or QApplication([])
+    keystrokes = [query[:length] for query in QUERIES for length in range(len(query) + 1)]
+
+    for factor in (1, 10, 100):
+        codes = list(country_codes) * factor
+
+        start = time.perf_counter()
+        search_index = CountrySearchIndex(codes)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for text in keystrokes:
+            search_index.match(text)
+        lookup = (time.perf_counter() - start) / len(keystrokes)
+
+        country_dropdown = CountryDropdown()
+        country_dropdown.setPhoneCodeLineEdit(QLineEdit(country_dropdown))
+        country_dropdown.setModel(CountryListModel(codes, country_dropdown))
+        country_dropdown.show()
+        country_dropdown.showPopup()
+        country_dropdown.setSearchText('x')
+        app.processEvents()
+
+        # The first character hides most rows, every further character only the rows that stop matching
+        first, further = [], []
+        for text in keystrokes:
+            start = time.perf_counter()
+            country_dropdown.setSearchText(text)
+            (first if len(text) == 1 else further if text else []).append(time.perf_counter() - start)
+
+        print('{:6d} rows: {:7.2f} ms index build, {:6.2f} us lookup, {:8.1f} us first keystroke, '
+              '{:6.1f} us further keystrokes'.format(len(codes), build * 1000, lookup * 1e6,
+                                                     sum(first) / len(first) * 1e6, sum(further) / len(further) * 1e6))
+        country_dropdown.hidePopup()
+        country_dropdown.close()
+        country_dropdown.deleteLater()
+        app.processEvents()
+
+
+if __name__ == '__main__':
+    run()
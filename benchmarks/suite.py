@@ -0,0 +1,322 @@
+# Benchmark suite covering widget construction and the hot paths of the widgets.
+# Runs headless (QT_QPA_PLATFORM defaults to offscreen) and compares the results with a JSON baseline:
+#   python -m benchmarks.suite            compare with benchmarks/baseline.json
+#   python -m benchmarks.suite --save     store the results as the new baseline
+import argparse
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from qtpy.QtCore import QEvent
+from qtpy.QtGui import QColor, QFocusEvent
+from qtpy.QtWidgets import QApplication, QWidget, QVBoxLayout, QTableView
+from src.pyqt_phone_input import PhoneInput
+from src.pyqt_phone_input.countries import country_codes
+from src.pyqt_phone_input.country_dropdown import CountryDropdown
+from src.pyqt_phone_input.phone_input_delegate import PhoneInputDelegate
+from src.pyqt_phone_input.phone_line_edit import PhoneLineEdit
+from .delegate_paint_benchmark import PhoneNumberModel
+
+# Default location of the baseline
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# Registered benchmark cases (name -> function returning the seconds per operation)
+CASES = {}
+
+
+def case(name: str):
+    """Register a function as benchmark case
+
+    :param name: name of the case in the results
+    :return: decorator
+    """
+
+    def register(function):
+        CASES[name] = function
+        return function
+    return register
+
+
+def measure(function, operations: int = 1, repeats: int = 7) -> float:
+    """Run a function several times (the fastest run is the least disturbed by other processes)
+
+    :param function: function to run
+    :param operations: number of operations the function performs
+    :param repeats: number of runs
+    :return: seconds per operation of the fastest run
+    """
+
+    app = QApplication.instance()
+    seconds = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        app.processEvents()
+        seconds.append((time.perf_counter() - start) / operations)
+    return min(seconds)
+
+
+def create_window(instances: int = 1) -> tuple:
+    """Create a shown window containing phone inputs
+
+    :param instances: number of phone inputs
+    :return: tuple of the window and the list of phone inputs
+    """
+
+    window = QWidget()
+    layout = QVBoxLayout(window)
+    phone_inputs = [PhoneInput(window) for _ in range(instances)]
+    for phone_input in phone_inputs:
+        layout.addWidget(phone_input)
+    window.resize(400, 36 * instances)
+    window.show()
+    QApplication.instance().processEvents()
+    return window, phone_inputs
+
+
+def close_window(window: QWidget):
+    """Close and delete a window
+
+    :param window: window to close
+    """
+
+    window.close()
+    window.deleteLater()
+    QApplication.instance().processEvents()
+
+
+@case('construct_1')
+def construct_single() -> float:
+    """Construct a single PhoneInput"""
+
+    widgets = []
+    seconds = measure(lambda: widgets.append(PhoneInput()))
+    for widget in widgets:
+        widget.deleteLater()
+    return seconds
+
+
+@case('construct_500')
+def construct_many() -> float:
+    """Construct 500 PhoneInputs"""
+
+    widgets = []
+    seconds = measure(lambda: widgets.extend(PhoneInput() for _ in range(500)), 500, 3)
+    for widget in widgets:
+        widget.deleteLater()
+    return seconds
+
+
+@case('set_country_all')
+def set_country_all() -> float:
+    """Select every country once"""
+
+    window, (phone_input,) = create_window()
+
+    def run():
+        for country in country_codes:
+            phone_input.setCountry(country)
+
+    seconds = measure(run, len(country_codes))
+    close_window(window)
+    return seconds
+
+
+@case('focus_cycle')
+def focus_cycle() -> float:
+    """Focus the phone number LineEdit and remove the focus again"""
+
+    window, (phone_input,) = create_window()
+    phone_line_edit = phone_input.findChild(PhoneLineEdit)
+
+    def run():
+        for _ in range(100):
+            QApplication.sendEvent(phone_line_edit, QFocusEvent(QEvent.Type.FocusIn))
+            QApplication.sendEvent(phone_line_edit, QFocusEvent(QEvent.Type.FocusOut))
+
+    seconds = measure(run, 100)
+    close_window(window)
+    return seconds
+
+
+@case('popup_open_close')
+def popup_open_close() -> float:
+    """Open and close the dropdown"""
+
+    window, (phone_input,) = create_window()
+    country_dropdown = phone_input.findChild(CountryDropdown)
+    app = QApplication.instance()
+
+    def run():
+        for _ in range(10):
+            country_dropdown.showPopup()
+            app.processEvents()
+            country_dropdown.hidePopup()
+            app.processEvents()
+
+    seconds = measure(run, 10)
+    close_window(window)
+    return seconds
+
+
+@case('resize_stream')
+def resize_stream() -> float:
+    """Resize a window containing 20 PhoneInputs like a user dragging its edge"""
+
+    window, phone_inputs = create_window(20)
+    app = QApplication.instance()
+
+    def run():
+        for i in range(100):
+            window.resize(400 + i % 200, 36 * len(phone_inputs) + i % 50)
+        while any(phone_input.isUpdating() for phone_input in phone_inputs):
+            app.processEvents()
+
+    seconds = measure(run, 100)
+    close_window(window)
+    return seconds
+
+
+@case('setter_storm')
+def setter_storm() -> float:
+    """Call styling setters in quick succession"""
+
+    window, (phone_input,) = create_window()
+    colors = [QColor(i, 0, 0) for i in range(0, 250, 10)]
+
+    def run():
+        for i, color in enumerate(colors):
+            phone_input.setColor(color)
+            phone_input.setBorderColor(color)
+            phone_input.setFocusedBorderColor(color)
+            phone_input.setBorderWidth(i % 3)
+            phone_input.setBorderRadius(i % 5)
+
+    seconds = measure(run, len(colors) * 5)
+    close_window(window)
+    return seconds
+
+
+@case('paint_country_dropdown')
+def paint_country_dropdown() -> float:
+    """Repaint the CountryDropdown"""
+
+    window, (phone_input,) = create_window()
+    country_dropdown = phone_input.findChild(CountryDropdown)
+
+    def run():
+        for _ in range(1000):
+            country_dropdown.repaint()
+
+    seconds = measure(run, 1000)
+    close_window(window)
+    return seconds
+
+
+@case('paint_phone_line_edit')
+def paint_phone_line_edit() -> float:
+    """Repaint the PhoneLineEdit"""
+
+    window, (phone_input,) = create_window()
+    phone_line_edit = phone_input.findChild(PhoneLineEdit)
+
+    def run():
+        for _ in range(1000):
+            phone_line_edit.repaint()
+
+    seconds = measure(run, 1000)
+    close_window(window)
+    return seconds
+
+
+@case('paint_delegate_scroll')
+def paint_delegate_scroll() -> float:
+    """Scroll a QTableView with a PhoneInputDelegate through 50000 rows"""
+
+    view = QTableView()
+    view.setItemDelegate(PhoneInputDelegate(view))
+    view.setModel(PhoneNumberModel(50000, view))
+    view.resize(400, 600)
+    view.show()
+    QApplication.instance().processEvents()
+    scroll_bar = view.verticalScrollBar()
+
+    def run():
+        for frame in range(100):
+            scroll_bar.setValue(frame * scroll_bar.maximum() // 100)
+            view.viewport().repaint()
+
+    seconds = measure(run, 100)
+    close_window(view)
+    return seconds
+
+
+def run_cases(names=None) -> dict:
+    """Run benchmark cases
+
+    :param names: names of the cases to run (all cases by default)
+    :return: dict mapping case names to seconds per operation
+    """
+
+    app = QApplication.instance() or QApplication([])
+    return {name: CASES[name]() for name in (names or CASES)}
+
+
+def compare(results: dict, baseline: dict) -> dict:
+    """Compare results with a baseline
+
+    :param results: dict mapping case names to seconds per operation
+    :param baseline: dict mapping case names to seconds per operation
+    :return: dict mapping case names to the change in percent (None if not in the baseline)
+    """
+
+    return {name: (seconds - baseline[name]) / baseline[name] * 100 if baseline.get(name) else None
+            for name, seconds in results.items()}
+
+
+def main(arguments=None) -> int:
+    """Run the suite and print the results (and the changes compared to the baseline)
+
+    :param arguments: command line arguments
+    :return: exit code (1 if a case regressed by more than the threshold)
+    """
+
+    parser = argparse.ArgumentParser(description='Run the pyqt-phone-input benchmark suite')
+    parser.add_argument('cases', nargs='*', help='cases to run (all by default)')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='path of the JSON baseline')
+    parser.add_argument('--save', action='store_true', help='store the results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=20.0,
+                        help='slowdown in percent that counts as regression')
+    arguments = parser.parse_args(arguments)
+
+    results = run_cases(arguments.cases)
+
+    baseline = {}
+    if os.path.exists(arguments.baseline):
+        with open(arguments.baseline) as file:
+            baseline = json.load(file)['results']
+
+    regressions = 0
+    for name, delta in compare(results, baseline).items():
+        if delta is None:
+            change = 'no baseline'
+        else:
+            regressed = delta > arguments.threshold
+            regressions += regressed
+            change = '{:+7.1f} %{}'.format(delta, ' REGRESSION' if regressed else '')
+        print('{:24s} {:12.2f} us  {}'.format(name, results[name] * 1e6, change))
+
+    if arguments.save:
+        with open(arguments.baseline, 'w') as file:
+            json.dump({'platform': sys.platform, 'python': sys.version.split()[0],
+                       'unit': 'seconds per operation', 'results': dict(baseline, **results)},
+                      file, indent=4, sort_keys=True)
+            file.write('\n')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
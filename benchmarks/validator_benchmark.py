@@ -0,0 +1,42 @@
+import time
+from qtpy.QtCore import QRegularExpression
+from qtpy.QtGui import QRegularExpressionValidator
+from qtpy.QtWidgets import QApplication
+from src.pyqt_phone_input.countries import country_codes
+from src.pyqt_phone_input.phone_number_validator import PhoneNumberValidator
+
+# Numbers typed one character at a time
+NUMBERS = ('212 555 0123', '20 7946 0958', '+44 20 7946 0958', '0612345678')
+
+
+def run(repeats: int = 1000):
+    """Measure validation per keystroke (compared with the previous generic regex validator)
+    and switching the rules to another country
+
+    :param repeats: number of times every keystroke is validated
+    """
+
+    app = QApplication.instance() or QApplication([])
+    keystrokes = [number[:length] for number in NUMBERS for length in range(1, len(number) + 1)]
+
+    validators = (('regex', QRegularExpressionValidator(QRegularExpression(r'\+?[0-9 ]*'))),
+                  ('per-country rules', PhoneNumberValidator('gb')))
+    for name, validator in validators:
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for text in keystrokes:
+                validator.validate(text, len(text))
+        seconds = (time.perf_counter() - start) / (repeats * len(keystrokes))
+        print('{:18s}: {:6.2f} us per keystroke'.format(name, seconds * 1e6))
+
+    validator = PhoneNumberValidator()
+    start = time.perf_counter()
+    for _ in range(repeats // 10):
+        for country in country_codes:
+            validator.setCountry(country)
+    seconds = (time.perf_counter() - start) / (repeats // 10 * len(country_codes))
+    print('{:18s}: {:6.2f} us per country change'.format('switch country', seconds * 1e6))
+
+
+if __name__ == '__main__':
+    run()
@@ -12,12 +12,15 @@ setup(
     packages=find_namespace_packages(where="src"),
     package_dir={"": "src"},
     package_data={
-        'pyqt_phone_input.flag_icons': ['*.png'],
+        'pyqt_phone_input.flag_atlases': ['*.png'],
         'pyqt_phone_input.hooks': ['*.py']
     },
     install_requires=[
         'QtPy>=2.4.1'
     ],
+    extras_require={
+        'numpy': ['numpy']
+    },
     python_requires='>=3.7',
     description='A clean and modern phone number input widget for PyQt and PySide',
     long_description=readme,
@@ -1 +1,16 @@
-from .phone_input import PhoneInput
\ No newline at end of file
+# Widgets are imported on first access, so the Qt-free core module
+# (pyqt_phone_input.core) can be imported without importing Qt
+def __getattr__(name):
+    if name == 'PhoneInput':
+        from .phone_input import PhoneInput
+        return PhoneInput
+    if name == 'CompactPhoneInput':
+        from .compact_phone_input import CompactPhoneInput
+        return CompactPhoneInput
+    if name == 'PhoneInputDelegate':
+        from .phone_input_delegate import PhoneInputDelegate
+        return PhoneInputDelegate
+    if name == 'preload_flags':
+        from .flag_cache import preload_flags
+        return preload_flags
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -0,0 +1,373 @@
+from qtpy.QtCore import Qt, Signal, QRect, QSize, QEvent
+from qtpy.QtGui import QPainter, QPalette, QValidator
+from qtpy.QtWidgets import QLineEdit, QStyle, QStyleOptionFrame
+from .countries import countries, country_codes, country_rows
+from .core import DialCodeTrie, get_phone_code, get_phone_number
+from .country_dropdown import get_popup_width
+from .country_list_model import CountryListModel, get_shared_country_list_model
+from .country_popup import get_shared_country_popup
+from .country_search_index import CountrySearchIndex, get_shared_country_search_index
+from .flag_cache import get_scaled_flag_pixmap
+from .instrumentation import register_instrumented, track_widget
+from .phone_number_validator import PhoneNumberValidator
+
+
+class CompactPhoneInput(QLineEdit):
+
+    # Events
+    country_changed = Signal()
+    number_changed = Signal()
+
+    def __init__(self, parent=None):
+        """Create a new CompactPhoneInput instance. Flag and phone code are painted inside a single
+        LineEdit and the shared country popup is opened by clicking them, so no child widgets,
+        stylesheets or popups are created per instance (i.e. for very large forms).
+
+        :param parent: the parent widget
+        """
+
+        super(CompactPhoneInput, self).__init__(parent)
+        track_widget(self)
+
+        # Initial values
+        self.__country = next(iter(countries))
+        self.__phone_code = get_phone_code(self.__country)
+        self.__popup_open = False
+        self.__popup_style_sheet = ''
+
+        # Spacing around flag and phone code and their painted areas
+        self.__spacing = 4
+        self.__flag_rect = QRect()
+        self.__phone_code_rect = QRect()
+
+        # Set validator to only allow numbers matching the length and leading digit rules
+        # of the current country (and international numbers starting with '+', whose
+        # phone code is used to select the country)
+        self.__validator = PhoneNumberValidator(self.__country, parent=self)
+        self.setValidator(self.__validator)
+        self.setMouseTracking(True)
+        self.textChanged.connect(self.__handle_text_changed)
+
+        self.__calculate_geometry()
+
+    def paintEvent(self, event):
+        """Method that gets called every time the widget needs to be updated.
+        Everything related to widget graphics happens here.
+
+        :param event: event sent by PyQt
+        """
+
+        super().paintEvent(event)
+
+        painter = QPainter(self)
+
+        # Draw country flag icon (pre-scaled for the icon size and the screen's pixel ratio)
+        if self.__flag_rect.width() > 0:
+            painter.drawPixmap(self.__flag_rect.topLeft(), get_scaled_flag_pixmap(
+                self.__country, self.__flag_rect.width(), self.devicePixelRatioF()))
+
+        # Draw phone code in the text color of the current state
+        color_group = QPalette.ColorGroup.Active if self.isEnabled() else QPalette.ColorGroup.Disabled
+        painter.setPen(self.palette().color(color_group, QPalette.ColorRole.Text))
+        painter.drawText(self.__phone_code_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
+                         self.__phone_code)
+
+    def resizeEvent(self, event):
+        """Method that gets called every time the widget is resized
+
+        :param event: event sent by PyQt
+        """
+
+        super().resizeEvent(event)
+        self.__calculate_geometry()
+
+    def changeEvent(self, event):
+        """Method that gets called when the font, style or other properties change
+
+        :param event: event sent by PyQt
+        """
+
+        super().changeEvent(event)
+        if event.type() in (QEvent.Type.FontChange, QEvent.Type.StyleChange):
+            self.__calculate_geometry()
+
+    def mousePressEvent(self, event):
+        """Method that gets called when the mouse is pressed (opens the popup on flag and phone code)
+
+        :param event: event sent by PyQt
+        """
+
+        if event.button() == Qt.MouseButton.LeftButton and self.__is_over_country(event.position().x()):
+            self.showPopup()
+            return
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        """Method that gets called when the mouse moves (shows an arrow over flag and phone code)
+
+        :param event: event sent by PyQt
+        """
+
+        if self.__is_over_country(event.position().x()):
+            self.setCursor(Qt.CursorShape.ArrowCursor)
+        else:
+            self.setCursor(Qt.CursorShape.IBeamCursor)
+        super().mouseMoveEvent(event)
+
+    def keyPressEvent(self, event):
+        """Method that gets called when a key is pressed (Alt+Down and F4 open the popup like QComboBox)
+
+        :param event: event sent by PyQt
+        """
+
+        if event.key() == Qt.Key.Key_F4 or (event.key() == Qt.Key.Key_Down and
+                                            event.modifiers() & Qt.KeyboardModifier.AltModifier):
+            self.showPopup()
+            return
+        super().keyPressEvent(event)
+
+    def showPopup(self):
+        """Open the shared country popup below the widget"""
+
+        get_shared_country_popup().showFor(self)
+        self.__popup_open = True
+
+    def hidePopup(self):
+        """Close the shared country popup"""
+
+        get_shared_country_popup().release(self)
+        self.__popup_open = False
+
+    def isDropdownOpen(self) -> bool:
+        """Get whether the country popup is currently opened
+
+        :return: whether the country popup is currently opened
+        """
+
+        return self.__popup_open
+
+    def getCountry(self) -> str:
+        """Get the current country
+
+        :return: country code (i.e. 'us')
+        """
+
+        return self.__country
+
+    def getCountryPhoneCode(self) -> str:
+        """Get the phone code of the current country
+
+        :return: phone code (i.e. '+1')
+        """
+
+        return self.__phone_code
+
+    def setCountry(self, country: str):
+        """Set the country
+
+        :param country: new country
+        """
+
+        country = country.lower()
+        if country not in country_rows or country == self.__country:
+            return
+
+        self.__country = country
+        self.__phone_code = get_phone_code(country)
+        self.__validator.setCountry(country)
+        self.__validator.revalidate(self)
+        self.__calculate_geometry()
+        self.update()
+        self.country_changed.emit()
+
+    def getPhoneNumber(self) -> str:
+        """Get the current phone number (no blank spaces)
+
+        :return: phone number or None while a typed international phone code is incomplete
+        """
+
+        return get_phone_number(self.__country, self.text())
+
+    def getInput(self) -> str:
+        """Get the LineEdit's input
+
+        :return: current input
+        """
+
+        return self.text()
+
+    def setInput(self, input_number: str):
+        """Set the LineEdit's input
+
+        :param input_number: new input
+        """
+
+        self.setText(input_number)
+
+    def getPlaceholderText(self) -> str:
+        """Get the current placeholder text
+
+        :return: placeholder text
+        """
+
+        return self.placeholderText()
+
+    def isDisabled(self) -> bool:
+        """Get whether the widget is disabled
+
+        :return: whether the widget is disabled
+        """
+
+        return not self.isEnabled()
+
+    def getValidationState(self) -> QValidator.State:
+        """Get whether the current input is a complete number of the current country
+
+        :return: Acceptable if the number is complete, Intermediate if it can still become valid or Invalid
+        """
+
+        return self.__validator.getState(self.text())
+
+    def getDialCodeTrie(self) -> DialCodeTrie:
+        """Get the trie used to detect the country of international numbers
+
+        :return: dial code trie
+        """
+
+        return self.__validator.getDialCodeTrie()
+
+    def setDialCodeTrie(self, dial_code_trie: DialCodeTrie):
+        """Set the trie used to detect the country of international numbers
+
+        :param dial_code_trie: new dial code trie (None to disable detection, any digits
+            can then follow the '+')
+        """
+
+        self.__validator.setDialCodeTrie(dial_code_trie)
+
+    def getPopupStyleSheet(self) -> str:
+        """Get the stylesheet applied to the shared popup while it is shown for this widget
+
+        :return: popup stylesheet
+        """
+
+        return self.__popup_style_sheet
+
+    def setPopupStyleSheet(self, style_sheet: str):
+        """Set the stylesheet applied to the shared popup while it is shown for this widget
+
+        :param style_sheet: new popup stylesheet
+        """
+
+        self.__popup_style_sheet = style_sheet
+
+    def model(self) -> CountryListModel:
+        """Get the country list shown in the popup (used by the shared popup like the model of a QComboBox)
+
+        :return: shared CountryListModel
+        """
+
+        return get_shared_country_list_model()
+
+    def currentIndex(self) -> int:
+        """Get the row of the current country in the popup
+
+        :return: row
+        """
+
+        return country_rows[self.__country]
+
+    def setCurrentIndex(self, row: int):
+        """Select the country shown in the given row of the popup
+
+        :param row: row
+        """
+
+        if 0 <= row < len(country_codes):
+            self.setCountry(country_codes[row])
+
+    def maxVisibleItems(self) -> int:
+        """Get the maximum number of countries visible in the popup without scrolling
+
+        :return: maximum number of visible countries
+        """
+
+        return 10
+
+    def iconSize(self) -> QSize:
+        """Get the size of the flags in the popup
+
+        :return: icon size
+        """
+
+        size = self.style().pixelMetric(QStyle.PixelMetric.PM_SmallIconSize, None, self)
+        return QSize(size, size)
+
+    def getSearchIndex(self) -> CountrySearchIndex:
+        """Get the search index of the countries in the popup
+
+        :return: shared search index
+        """
+
+        return get_shared_country_search_index()
+
+    def getPopupWidth(self) -> int:
+        """Get the width of the popup's country list (fits the longest country, cached per font
+        and shared with CountryDropdown)
+
+        :return: popup width in pixels
+        """
+
+        return get_popup_width(self, self.model(), self.iconSize())
+
+    def __calculate_geometry(self):
+        """Calculates the painted areas of flag and phone code and reserves them as text margin"""
+
+        option = QStyleOptionFrame()
+        self.initStyleOption(option)
+        contents = self.style().subElementRect(QStyle.SubElement.SE_LineEditContents, option, self)
+
+        # Flag grows with the height, but never beyond the text height (i.e. the hidden default size)
+        icon_size = min(int(contents.height() * 0.7), self.fontMetrics().height())
+        self.__flag_rect = QRect(contents.left() + self.__spacing // 2,
+                                 contents.top() + (contents.height() - icon_size) // 2, icon_size, icon_size)
+        phone_code_width = self.fontMetrics().horizontalAdvance(self.__phone_code)
+        self.__phone_code_rect = QRect(self.__flag_rect.right() + 1 + self.__spacing, contents.top(),
+                                       phone_code_width, contents.height())
+
+        margin = self.__phone_code_rect.right() + 1 + self.__spacing - contents.left()
+        if self.textMargins().left() != margin:
+            self.setTextMargins(margin, 0, 0, 0)
+
+    def __is_over_country(self, x: float) -> bool:
+        """Gets whether a position is over the painted flag or phone code
+
+        :param x: horizontal position in widget coordinates
+        :return: whether the position is over flag or phone code
+        """
+
+        return x <= self.__phone_code_rect.right() + self.__spacing
+
+    def __handle_text_changed(self, text: str):
+        """Selects the country of international numbers, removes their phone code
+        and emits number_changed event
+
+        :param text: new text
+        """
+
+        result = self.__validator.splitPhoneNumber(text, self.__country)
+        if result:
+            country, number = result
+            self.setCountry(country)
+            self.setText(number)
+            return
+
+        self.number_changed.emit()
+
+
+# Hot paths measured while instrumentation is enabled
+register_instrumented(CompactPhoneInput, {
+    'paintEvent': 'paint',
+    'showPopup': 'popup',
+    '_CompactPhoneInput__calculate_geometry': 'geometry'
+}, ('country_changed', 'number_changed'))
@@ -0,0 +1,201 @@
+# Qt-free phone number logic shared by the widgets. Nothing in here depends on Qt, so it can
+# be used in backend code, worker threads and worker processes without a QApplication.
+from .countries import countries, country_codes, country_rows, phone_code_rows
+from .country_search_index import get_shared_country_search_index
+from .dial_code_trie import DialCodeTrie, get_shared_dial_code_trie
+from .phone_number_rules import (MAX_PHONE_NUMBER_LENGTH, INVALID, INTERMEDIATE, ACCEPTABLE,
+                                 get_shared_phone_number_rules)
+
+# NumPy is optional and only used to vectorize normalize_many, so it is imported on first use
+# (importing it takes much longer than importing this module)
+_numpy = None
+_numpy_imported = False
+
+# Country codes sorted for binary search and the phone codes in the same order (built on first use)
+_phone_code_arrays = None
+
+
+def is_country(country: str) -> bool:
+    """Get whether a country code is known
+
+    :param country: country code (i.e. 'us', case-insensitive)
+    :return: whether the country code is known
+    """
+
+    return country.lower() in country_rows
+
+
+def get_country_name(country: str) -> str:
+    """Get the name of a country
+
+    :param country: country code (i.e. 'us', case-insensitive)
+    :return: country name (i.e. 'United States') or None if the country is unknown
+    """
+
+    entry = countries.get(country.lower())
+    return entry[0] if entry else None
+
+
+def get_phone_code(country: str) -> str:
+    """Get the phone code of a country
+
+    :param country: country code (i.e. 'us', case-insensitive)
+    :return: phone code (i.e. '+1') or None if the country is unknown
+    """
+
+    entry = countries.get(country.lower())
+    return entry[1] if entry else None
+
+
+def get_countries_by_phone_code(phone_code: str) -> list:
+    """Get all countries using a phone code
+
+    :param phone_code: phone code (i.e. '+7')
+    :return: list of country codes (i.e. ['kz', 'ru'])
+    """
+
+    return [country_codes[row] for row in phone_code_rows.get(phone_code, ())]
+
+
+def search_countries(query: str) -> list:
+    """Find all countries whose name, country code or phone code matches a query
+
+    :param query: search query (i.e. 'united st', 'de' or '+44', case- and accent-insensitive)
+    :return: list of matching country codes (i.e. ['us'])
+    """
+
+    return [country_codes[row] for row in get_shared_country_search_index().search(query)]
+
+
+def get_phone_number(country: str, number: str) -> str:
+    """Get the phone number of a country and local number (no blank spaces)
+
+    :param country: country code (i.e. 'us', case-insensitive)
+    :param number: local number (i.e. '123 456 789')
+    :return: phone number (i.e. '+1123456789') or None if the country is unknown or the number
+        is an international number whose phone code is still incomplete (i.e. '+4')
+    """
+
+    phone_code = get_phone_code(country)
+    if phone_code is None or number.startswith('+'):
+        return None
+    return phone_code + number.replace(' ', '')
+
+
+def validate_phone_number(country: str, number: str) -> int:
+    """Validate a local number against the length and leading digit rules of a country
+
+    :param country: country code (i.e. 'us', case-insensitive)
+    :param number: local number (i.e. '212 555 0123', international numbers have to start with
+        a known phone code or a prefix of one)
+    :return: ACCEPTABLE if the number is complete, INTERMEDIATE if it can still become valid or INVALID
+    """
+
+    return get_shared_phone_number_rules().validate(country.lower(), number, get_shared_dial_code_trie())
+
+
+def split_phone_number(number: str, current_country: str = None, dial_code_trie: DialCodeTrie = None):
+    """Split an international number into its country and local number
+
+    :param number: international number (i.e. '+44 20 7946 0958')
+    :param current_country: country that is kept if it uses the number's phone code
+    :param dial_code_trie: trie used to find the phone code (shared trie by default)
+    :return: tuple of country code and local number (i.e. ('gb', '20 7946 0958')) or None
+    """
+
+    if dial_code_trie is None:
+        dial_code_trie = get_shared_dial_code_trie()
+
+    match = dial_code_trie.match(number)
+    if match is None:
+        return None
+
+    phone_code, local_number = match
+    return dial_code_trie.getCountry(phone_code, current_country), local_number
+
+
+def normalize_many(country_list, number_list):
+    """Build the E.164 phone numbers of many country and local number pairs at once.
+    A pair is valid if the country is known and the local number only consists of
+    digits and spaces, with at most 15 digits in total (including the phone code).
+    If NumPy is installed, vectorized string operations are used.
+
+    :param country_list: sequence or NumPy array of country codes (case-insensitive)
+    :param number_list: sequence or NumPy array of local numbers (same length)
+    :return: tuple of phone numbers ('' for invalid pairs) and validity flags, as NumPy arrays
+        if NumPy is installed, otherwise as lists
+    """
+
+    if len(country_list) != len(number_list):
+        raise ValueError('country_list and number_list must have the same length')
+
+    numpy = _get_numpy()
+    if numpy is None:
+        phone_numbers = []
+        valid = []
+        for country, number in zip(country_list, number_list):
+            phone_code = get_phone_code(country)
+            digits = number.replace(' ', '')
+            is_valid = (phone_code is not None and digits.isdigit()
+                        and len(phone_code) - 1 + len(digits) <= MAX_PHONE_NUMBER_LENGTH)
+            phone_numbers.append(phone_code + digits if is_valid else '')
+            valid.append(is_valid)
+        return phone_numbers, valid
+
+    return _normalize_many_numpy(numpy, numpy.asarray(country_list, dtype=str),
+                                 numpy.asarray(number_list, dtype=str))
+
+
+def _get_numpy():
+    """Gets the NumPy module (imported on first use)
+
+    :return: NumPy module or None if NumPy isn't installed
+    """
+
+    global _numpy, _numpy_imported
+
+    if not _numpy_imported:
+        _numpy_imported = True
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = None
+    return _numpy
+
+
+def _normalize_many_numpy(numpy, country_array, number_array):
+    """Vectorized implementation of normalize_many
+
+    :param numpy: NumPy module
+    :param country_array: NumPy array of country codes
+    :param number_array: NumPy array of local numbers
+    :return: tuple of NumPy arrays containing the phone numbers and validity flags
+    """
+
+    global _phone_code_arrays
+
+    strings = numpy.strings if hasattr(numpy, 'strings') else numpy.char
+
+    if _phone_code_arrays is None:
+        sorted_codes = sorted(country_codes)
+        _phone_code_arrays = (numpy.array(sorted_codes), numpy.array([countries[c][1] for c in sorted_codes]))
+    sorted_codes, phone_codes = _phone_code_arrays
+
+    # Look up country rows by binary search (only lowercase the countries that weren't found)
+    rows = numpy.minimum(numpy.searchsorted(sorted_codes, country_array), len(sorted_codes) - 1)
+    known = sorted_codes[rows] == country_array
+    if not known.all():
+        unknown = ~known
+        lowered = strings.lower(country_array[unknown])
+        lowered_rows = numpy.minimum(numpy.searchsorted(sorted_codes, lowered), len(sorted_codes) - 1)
+        rows[unknown] = lowered_rows
+        known[unknown] = sorted_codes[lowered_rows] == lowered
+
+    # Validate and concatenate the digits
+    row_phone_codes = phone_codes[rows]
+    digits = strings.replace(number_array, ' ', '')
+    length = strings.str_len(row_phone_codes) - 1 + strings.str_len(digits)
+    valid = known & strings.isdigit(digits) & (length <= MAX_PHONE_NUMBER_LENGTH)
+
+    return numpy.where(valid, strings.add(row_phone_codes, digits), ''), valid
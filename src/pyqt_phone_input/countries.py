@@ -1,3 +1,6 @@
+from types import MappingProxyType
+
+
 
 countries = {
     'af': ['Afghanistan', '+93'],
@@ -236,3 +239,23 @@ countries = {
     'zm': ['Zambia', '+260'],
     'zw': ['Zimbabwe', '+263']
 }
+
+
+# Immutable lookup indexes (rows correspond to the order of the countries above)
+country_codes = tuple(countries)
+country_rows = MappingProxyType({country: row for row, country in enumerate(country_codes)})
+
+
+def _build_phone_code_rows():
+    """Builds the phone code to rows index
+
+    :return: dict mapping every phone code to the rows of all countries using it
+    """
+
+    rows = {}
+    for row, country in enumerate(country_codes):
+        rows.setdefault(countries[country][1], []).append(row)
+    return {phone_code: tuple(rows[phone_code]) for phone_code in rows}
+
+
+phone_code_rows = MappingProxyType(_build_phone_code_rows())
@@ -1,10 +1,80 @@
-import os
 import math
 from qtpy import QtCore
-from qtpy.QtCore import Signal, Qt
-from qtpy.QtGui import QPainter, QIcon
-from qtpy.QtWidgets import QComboBox, QLineEdit
-from .countries import countries
+from qtpy.QtCore import Signal, QSize
+from qtpy.QtGui import QPainter
+from qtpy.QtWidgets import QComboBox, QLineEdit, QStyle, QStyleOptionComboBox
+from .countries import countries, country_codes, country_rows
+from .core import get_phone_code
+from .country_list_model import CountryListModel, get_shared_country_list_model
+from .country_list_view import CountryListView
+from .country_popup import get_shared_country_popup
+from .country_search import CountrySearch
+from .country_search_index import CountrySearchIndex, get_shared_country_search_index
+from .flag_cache import get_scaled_flag_pixmap
+from .instrumentation import register_instrumented, track_widget
+
+
+# Tight pixel widths of the phone codes per font, shared by all instances
+# (font key and DPI -> {phone code: width})
+_phone_code_widths = {}
+
+# Popup widths (width of the longest country including its flag), shared by all instances
+# (font key, icon width, icon height and countries of the model -> width)
+_popup_widths = {}
+
+
+def clear_popup_width_cache():
+    """Remove all cached popup widths"""
+
+    _popup_widths.clear()
+
+
+def get_popup_width(widget, model, icon_size: QSize) -> int:
+    """Get the width of a country popup fitting the longest country of a model (every item has
+    to be measured to calculate it, so the width is cached)
+
+    :param widget: CountryDropdown or CompactPhoneInput whose font and style are used
+    :param model: model shown in the popup
+    :param icon_size: size of the flags in the popup
+    :return: popup width in pixels
+    """
+
+    # Widths are cached by the countries in the model (not by model identity, since
+    # models are replaced and deleted), other models are measured every time
+    if model is get_shared_country_list_model():
+        countries_key = None
+    elif isinstance(model, CountryListModel):
+        countries_key = tuple(model.getCountryCodes())
+    else:
+        return _calculate_popup_width(widget, model, icon_size)
+
+    key = (widget.font().key(), icon_size.width(), icon_size.height(), countries_key)
+    width = _popup_widths.get(key)
+    if width is None:
+        width = _calculate_popup_width(widget, model, icon_size)
+        _popup_widths[key] = width
+    return width
+
+
+def _calculate_popup_width(widget, model, icon_size: QSize) -> int:
+    """Measures the longest country the same way QComboBox calculates its minimum size hint
+    (the size hint itself is cached by QComboBox and doesn't follow font changes). The widget's
+    stylesheet isn't applied, since the width is shared by all widgets using the same font.
+
+    :param widget: widget whose font and style are used
+    :param model: model shown in the popup
+    :param icon_size: size of the flags in the popup
+    :return: popup width in pixels
+    """
+
+    font_metrics = widget.fontMetrics()
+    text_width = max((font_metrics.horizontalAdvance(model.data(model.index(row, 0)))
+                      for row in range(model.rowCount())), default=0)
+
+    contents_size = QSize(text_width + icon_size.width() + 4, max(font_metrics.height(), icon_size.height()))
+    option = QStyleOptionComboBox()
+    option.initFrom(widget)
+    return widget.style().sizeFromContents(QStyle.ContentsType.CT_ComboBox, option, contents_size, None).width()
 
 
 class CountryDropdown(QComboBox):
@@ -13,14 +83,18 @@ class CountryDropdown(QComboBox):
     show_popup = Signal()
     hide_popup = Signal()
     geometry_changed = Signal()
+    country_changed = Signal()
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, lazy: bool = False, shared_popup: bool = False):
         """Create a new CountryDropdown instance
 
         :param parent: the parent widget
+        :param lazy: whether the country list should only be populated once the popup is first opened
+        :param shared_popup: whether to borrow the popup shared by all dropdowns instead of owning one
         """
 
         super(CountryDropdown, self).__init__(parent)
+        track_widget(self)
 
         # Connected LineEdit used to display phone code
         self.__phone_code_line_edit = None
@@ -30,18 +104,41 @@ class CountryDropdown(QComboBox):
         self.__border_width = 0
         self.__popup_open = False
         self.__current_country_code = ''
+        self.__current_country = None
+        self.__phone_code_widths = None
+        self.__search_index = None
+        self.__search = None
+        self.__shared_popup = shared_popup
+        self.__popup_width = 0
+        self.__popup_style_sheet = ''
 
         # Initial settings
         self.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
-        self.view().setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.currentTextChanged.connect(self.__handle_current_item_changed)
 
-        # Add all countries to dropdown
-        self.__directory = os.path.dirname(os.path.realpath(__file__))
-        for country in countries:
-            self.addItem(
-                QIcon(self.__directory + '/flag_icons/{}.png'.format(country)),
-                '{} ({})'.format(countries[country][0], countries[country][1]))
+        # With a shared popup, no popup, view or search widgets are created per instance
+        # (QComboBox only creates its popup once view() is called)
+        if not shared_popup:
+            self.setView(CountryListView())
+
+            # Same search as the shared popup above the country list (inside the popup)
+            self.__search = CountrySearch(self.view())
+            popup_layout = self.view().parentWidget().layout()
+            popup_layout.insertWidget(popup_layout.indexOf(self.view()), self.__search)
+
+        # Attach to the country list model shared by all instances. In lazy mode,
+        # a model containing only the selected country is used until the popup is
+        # opened for the first time.
+        self.__lazy_model = None
+        if lazy:
+            self.__lazy_model = CountryListModel([next(iter(countries))], self)
+            self.setModel(self.__lazy_model)
+        else:
+            self.setModel(get_shared_country_list_model())
+
+        # Nothing to search while only the selected country is shown
+        if self.__search is not None and not lazy:
+            self.__search.setDropdown(self)
 
         # Handle initial country
         self.__handle_current_item_changed()
@@ -55,24 +152,44 @@ class CountryDropdown(QComboBox):
 
         painter = QPainter(self)
 
-        if self.count() > 0:
+        if self.__current_country is not None and self.__icon_size > 0:
             icon_start = math.ceil((self.height() - self.__icon_size) / 2)
 
-            # Draw country flag icon
-            painter.drawPixmap(icon_start, icon_start, self.itemIcon(
-                self.currentIndex()).pixmap(self.__icon_size, self.__icon_size))
+            # Draw country flag icon (pre-scaled for the icon size and the screen's pixel ratio)
+            painter.drawPixmap(icon_start, icon_start, get_scaled_flag_pixmap(
+                self.__current_country, self.__icon_size, self.devicePixelRatioF()))
 
     def showPopup(self):
         """Method that gets called when the dropdown is opened"""
 
+        if self.__lazy_model is not None:
+            self.__populate()
+
+        if self.__shared_popup:
+            self.__update_popup_width()
+            get_shared_country_popup().showFor(self)
+            self.__popup_open = True
+            self.show_popup.emit()
+            return
+
         super().showPopup()
+
+        # QComboBox sizes the popup for the list only
+        popup = self.view().parentWidget()
+        popup.resize(popup.width(), popup.height() + self.__search.sizeHint().height())
+        self.__search.setFocus()
+
         self.__popup_open = True
         self.show_popup.emit()
         
     def hidePopup(self):
         """Method that gets called when the dropdown is closed"""
 
-        super().hidePopup()
+        if self.__shared_popup:
+            get_shared_country_popup().release(self)
+        else:
+            super().hidePopup()
+            self.__search.clear()
         self.__popup_open = False
         self.hide_popup.emit()
 
@@ -99,6 +216,78 @@ class CountryDropdown(QComboBox):
         """
 
         self.__phone_code_line_edit = line_edit
+        self.__phone_code_widths = None
+
+    def getSearchLineEdit(self) -> QLineEdit:
+        """Get the search field shown above the country list
+
+        :return: search LineEdit (the shared popup's search field if a shared popup is used)
+        """
+
+        if self.__shared_popup:
+            return get_shared_country_popup().getSearchLineEdit()
+        return self.__search.getSearchLineEdit()
+
+    def getSearchText(self) -> str:
+        """Get the current search text
+
+        :return: search text
+        """
+
+        return self.getSearchLineEdit().text()
+
+    def setSearchText(self, text: str):
+        """Set the search text (only countries whose name, country code or phone code match are shown)
+
+        :param text: new search text
+        """
+
+        self.getSearchLineEdit().setText(text)
+
+    def getSearchIndex(self) -> CountrySearchIndex:
+        """Get the search index of the current model (built on first use for custom models)
+
+        :return: search index
+        """
+
+        if self.model() is get_shared_country_list_model():
+            return get_shared_country_search_index()
+        if self.__search_index is None or self.__search_index[0] is not self.model():
+            self.__search_index = (self.model(), CountrySearchIndex(self.model().getCountryCodes()))
+        return self.__search_index[1]
+
+    def isSharedPopup(self) -> bool:
+        """Get whether the popup shared by all dropdowns is used instead of an own popup
+
+        :return: whether the shared popup is used
+        """
+
+        return self.__shared_popup
+
+    def getPopupStyleSheet(self) -> str:
+        """Get the stylesheet applied to the shared popup while it is shown for this dropdown
+
+        :return: popup stylesheet
+        """
+
+        return self.__popup_style_sheet
+
+    def setPopupStyleSheet(self, style_sheet: str):
+        """Set the stylesheet applied to the shared popup while it is shown for this dropdown
+        (only used with a shared popup, the own popup is styled through the dropdown's stylesheet)
+
+        :param style_sheet: new popup stylesheet
+        """
+
+        self.__popup_style_sheet = style_sheet
+
+    def getPopupWidth(self) -> int:
+        """Get the width of the popup's country list (fits the longest country)
+
+        :return: popup width in pixels
+        """
+
+        return self.__popup_width
 
     def getCountry(self) -> str:
         """Get the current country
@@ -106,11 +295,7 @@ class CountryDropdown(QComboBox):
         :return: country code (i.e. 'us')
         """
 
-        current_country_name = self.currentText().split(' (')[0]
-
-        for country in countries:
-            if countries[country][0] == current_country_name:
-                return country
+        return self.__current_country
 
     def getCountryPhoneCode(self) -> str:
         """Get the phone code of the current country
@@ -127,13 +312,26 @@ class CountryDropdown(QComboBox):
         """
 
         new_country = new_country.lower()
+        if new_country not in country_rows:
+            return
+
+        # Popup not populated yet, so only the single country has to be replaced
+        if self.__lazy_model is not None:
+            self.__lazy_model.setCountryCodes([new_country])
+            self.__handle_current_item_changed()
+        else:
+            self.setCurrentIndex(country_rows[new_country])
+
+    def updatePhoneCodeFont(self):
+        """Update the geometry after the font of the phone code LineEdit changed"""
 
-        index = 0
-        for country in countries:
-            if country == new_country:
-                self.setCurrentIndex(index)
-                break
-            index += 1
+        self.__phone_code_widths = None
+        self.__calculate_geometry()
+
+    def updatePopupWidth(self):
+        """Update the popup width after the font or icon size changed"""
+
+        self.__update_popup_width()
 
     def getBorderWidth(self) -> int:
         """Get the current border width
@@ -153,6 +351,15 @@ class CountryDropdown(QComboBox):
         self.__calculate_geometry()
         self.update()
 
+    def isPopulated(self) -> bool:
+        """Get whether the dropdown contains all countries (only False in lazy mode
+        before the popup has been opened for the first time)
+
+        :return: whether the dropdown contains all countries
+        """
+
+        return self.__lazy_model is None
+
     def isDropdownOpen(self) -> bool:
         """Gets whether the dropdown is currently opened
 
@@ -172,7 +379,7 @@ class CountryDropdown(QComboBox):
             if self.__phone_code_line_edit.text() != self.__current_country_code:
                 self.__phone_code_line_edit.setText(self.__current_country_code)
 
-            w = self.__phone_code_line_edit.fontMetrics().tightBoundingRect(self.__phone_code_line_edit.text()).width() + 8 + self.__border_width * 2
+            w = self.__get_phone_code_width(self.__current_country_code) + 8 + self.__border_width * 2
             if self.__phone_code_line_edit.width() != w:
                 self.__phone_code_line_edit.setFixedWidth(w)
 
@@ -180,17 +387,85 @@ class CountryDropdown(QComboBox):
                 self.__phone_code_line_edit.move(text_start, 0)
 
             self.setFixedWidth(text_start + self.__phone_code_line_edit.width())
+            self.__update_popup_width()
             self.geometry_changed.emit()
             self.update()
 
-    def __update_country_code(self):
-        """Updates the country code"""
+    def __update_popup_width(self):
+        """Sets the popup width to fit the longest country"""
+
+        # Popup width is only needed once all countries are shown
+        if self.__lazy_model is not None:
+            return
 
-        if self.count() > 0:
-            self.__current_country_code = self.currentText().split('(')[1].split(')')[0]
+        width = get_popup_width(self, self.model(), self.iconSize())
+        self.__popup_width = width
+
+        # The shared popup applies the width when it is shown
+        if self.__shared_popup:
+            return
+
+        view = self.view()
+        if view.minimumWidth() != width or view.maximumWidth() != width:
+            view.setFixedWidth(width)
+
+    def __get_phone_code_width(self, phone_code: str) -> int:
+        """Gets the tight pixel width of a phone code in the phone code LineEdit's font
+
+        :param phone_code: phone code (i.e. '+1')
+        :return: width in pixels
+        """
+
+        if self.__phone_code_widths is None:
+            key = (self.__phone_code_line_edit.font().key(), self.__phone_code_line_edit.logicalDpiY())
+            self.__phone_code_widths = _phone_code_widths.setdefault(key, {})
+
+        width = self.__phone_code_widths.get(phone_code)
+        if width is None:
+            width = self.__phone_code_line_edit.fontMetrics().tightBoundingRect(phone_code).width()
+            self.__phone_code_widths[phone_code] = width
+        return width
+
+    def __populate(self):
+        """Replaces the single country model used in lazy mode with the shared model"""
+
+        country = self.getCountry()
+        self.__lazy_model = None
+
+        # The single country model is deleted by QComboBox since it is its parent
+        self.blockSignals(True)
+        self.setModel(get_shared_country_list_model())
+        self.blockSignals(False)
+
+        # Select previous country again (index changes, but country doesn't)
+        self.setCountry(country)
+        self.__update_popup_width()
+        if self.__search is not None:
+            self.__search.setDropdown(self)
 
     def __handle_current_item_changed(self):
         """Handles change of selected dropdown item"""
 
-        self.__update_country_code()
+        if self.__lazy_model is not None:
+            country = self.__lazy_model.getCountryCodes()[0]
+        elif self.currentIndex() >= 0:
+            country = country_codes[self.currentIndex()]
+        else:
+            return
+
+        changed = country != self.__current_country
+        self.__current_country = country
+        self.__current_country_code = get_phone_code(country)
         self.__calculate_geometry()
+
+        if changed:
+            self.country_changed.emit()
+
+
+# Hot paths measured while instrumentation is enabled
+register_instrumented(CountryDropdown, {
+    'paintEvent': 'paint',
+    'showPopup': 'popup',
+    '_CountryDropdown__calculate_geometry': 'geometry',
+    '_CountryDropdown__update_popup_width': 'popup_width'
+}, ('show_popup', 'hide_popup', 'geometry_changed', 'country_changed'))
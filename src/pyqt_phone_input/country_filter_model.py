@@ -0,0 +1,85 @@
+from qtpy.QtCore import Qt, QAbstractListModel, QModelIndex
+
+
+class CountryFilterModel(QAbstractListModel):
+
+    def __init__(self, source_model=None, parent=None):
+        """Create a new CountryFilterModel instance showing a subset of the rows of another model.
+        The rows are given explicitly (i.e. by a search index), so the source data is never scanned.
+
+        :param source_model: model the rows refer to
+        :param parent: the parent object
+        """
+
+        super(CountryFilterModel, self).__init__(parent)
+
+        self.__source_model = source_model
+        self.__rows = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Get the number of rows shown
+
+        :param parent: parent index (only the invalid root index has children)
+        :return: number of rows
+        """
+
+        return 0 if parent.isValid() else len(self.__rows)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        """Get the data of the source row shown at the given index
+
+        :param index: model index
+        :param role: item data role
+        :return: data for the given role or None
+        """
+
+        row = index.row()
+        if not 0 <= row < len(self.__rows):
+            return None
+        return self.__source_model.data(self.__source_model.index(self.__rows[row], 0), role)
+
+    def getSourceModel(self):
+        """Get the model the rows refer to
+
+        :return: source model
+        """
+
+        return self.__source_model
+
+    def setSourceModel(self, source_model):
+        """Set the model the rows refer to (no rows are shown afterwards)
+
+        :param source_model: new source model
+        """
+
+        self.beginResetModel()
+        self.__source_model = source_model
+        self.__rows = []
+        self.endResetModel()
+
+    def getRows(self) -> list:
+        """Get the source rows shown (in display order)
+
+        :return: list of source rows
+        """
+
+        return list(self.__rows)
+
+    def setRows(self, rows):
+        """Set the source rows shown
+
+        :param rows: source rows in display order
+        """
+
+        self.beginResetModel()
+        self.__rows = list(rows)
+        self.endResetModel()
+
+    def mapToSource(self, row: int) -> int:
+        """Get the source row shown at the given row
+
+        :param row: row in this model
+        :return: source row or -1 if the row doesn't exist
+        """
+
+        return self.__rows[row] if 0 <= row < len(self.__rows) else -1
@@ -0,0 +1,127 @@
+from qtpy.QtCore import Qt, QAbstractListModel, QModelIndex
+from .countries import countries
+from .flag_cache import ICON_FLAG_SIZE, get_flag_icon, get_flag_loader, is_preloading_flags
+
+
+class CountryListModel(QAbstractListModel):
+
+    # Custom item data roles
+    CountryRole = Qt.ItemDataRole.UserRole + 1
+    NameRole = Qt.ItemDataRole.UserRole + 2
+    PhoneCodeRole = Qt.ItemDataRole.UserRole + 3
+    FlagRole = Qt.ItemDataRole.UserRole + 4
+
+    def __init__(self, country_codes=None, parent=None):
+        """Create a new CountryListModel instance
+
+        :param country_codes: codes of the countries to include (all countries by default)
+        :param parent: the parent object
+        """
+
+        super(CountryListModel, self).__init__(parent)
+
+        # Rows are built once and only change through setCountryCodes (flags are resolved on demand)
+        self.__country_codes = []
+        self.__rows = []
+        self.__row_count = 0
+        self.__build_rows(list(countries) if country_codes is None else country_codes)
+
+        # Whether flags were requested while they were decoded in the background (they are
+        # filled in once they arrive, only models that requested them listen for the atlas)
+        self.__waiting_for_flags = False
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Get the number of rows (countries) in the model
+
+        :param parent: parent index (only the invalid root index has children)
+        :return: number of rows
+        """
+
+        return 0 if parent.isValid() else self.__row_count
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        """Get the data stored under the given role for the item at the given index
+
+        :param index: model index
+        :param role: item data role
+        :return: data for the given role or None
+        """
+
+        row = index.row()
+        if not 0 <= row < self.__row_count:
+            return None
+
+        if role == Qt.ItemDataRole.DecorationRole or role == CountryListModel.FlagRole:
+            # Don't block while the flags are still decoded in the background
+            if is_preloading_flags(ICON_FLAG_SIZE):
+                if not self.__waiting_for_flags:
+                    self.__waiting_for_flags = True
+                    get_flag_loader().flags_loaded.connect(self.__handle_flags_loaded)
+                return None
+            return get_flag_icon(self.__country_codes[row])
+        return self.__rows[row].get(role)
+
+    def getCountryCodes(self) -> list:
+        """Get the codes of the countries in the model (in row order)
+
+        :return: list of country codes
+        """
+
+        return list(self.__country_codes)
+
+    def setCountryCodes(self, country_codes):
+        """Replace the countries in the model
+
+        :param country_codes: codes of the countries to include
+        """
+
+        self.beginResetModel()
+        self.__build_rows(country_codes)
+        self.endResetModel()
+
+    def __handle_flags_loaded(self, flag_size: int):
+        """Handles flags decoded in the background
+
+        :param flag_size: flag size in pixels
+        """
+
+        if flag_size != ICON_FLAG_SIZE:
+            return
+
+        self.__waiting_for_flags = False
+        get_flag_loader().flags_loaded.disconnect(self.__handle_flags_loaded)
+        if self.__row_count > 0:
+            self.dataChanged.emit(self.index(0, 0), self.index(self.__row_count - 1, 0),
+                                  [Qt.ItemDataRole.DecorationRole, CountryListModel.FlagRole])
+
+    def __build_rows(self, country_codes):
+        """Builds the row data for the given countries
+
+        :param country_codes: codes of the countries to include
+        """
+
+        self.__country_codes = list(country_codes)
+        self.__rows = [{
+            Qt.ItemDataRole.DisplayRole: '{} ({})'.format(countries[country][0], countries[country][1]),
+            CountryListModel.CountryRole: country,
+            CountryListModel.NameRole: countries[country][0],
+            CountryListModel.PhoneCodeRole: countries[country][1]
+        } for country in self.__country_codes]
+        self.__row_count = len(self.__rows)
+
+
+# Single model instance shared by all CountryDropdown instances
+_shared_model = None
+
+
+def get_shared_country_list_model() -> CountryListModel:
+    """Get the CountryListModel instance shared by all dropdowns (created on first use)
+
+    :return: shared CountryListModel
+    """
+
+    global _shared_model
+
+    if _shared_model is None:
+        _shared_model = CountryListModel()
+    return _shared_model
@@ -0,0 +1,51 @@
+from qtpy.QtCore import Qt, QModelIndex
+from qtpy.QtWidgets import QListView, QAbstractItemView
+
+
+class CountryListView(QListView):
+
+    def __init__(self, parent=None):
+        """Create a new CountryListView instance
+
+        :param parent: the parent widget
+        """
+
+        super(CountryListView, self).__init__(parent)
+
+        # Scroll request for a row that hasn't been laid out yet
+        self.__pending_scroll = None
+
+        # All rows have the same height and are laid out in batches, so showing the view
+        # only queries the visible rows (including their flags) no matter how many rows there are
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+
+    def scrollTo(self, index: QModelIndex, hint=QAbstractItemView.ScrollHint.EnsureVisible):
+        """Scroll to the given index (once it has been laid out)
+
+        :param index: model index
+        :param hint: where the index should be positioned
+        """
+
+        if index.isValid() and not self.visualRect(index).isValid():
+            self.__pending_scroll = (index, hint)
+            return
+
+        self.__pending_scroll = None
+        super().scrollTo(index, hint)
+
+    def timerEvent(self, event):
+        """Method that gets called when a timer fires (including the batched layout timer)
+
+        :param event: event sent by PyQt
+        """
+
+        super().timerEvent(event)
+
+        if self.__pending_scroll is not None:
+            index, hint = self.__pending_scroll
+            if not index.isValid():
+                self.__pending_scroll = None
+            elif self.visualRect(index).isValid():
+                self.scrollTo(index, hint)
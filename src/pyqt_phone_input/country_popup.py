@@ -0,0 +1,186 @@
+from qtpy.QtCore import Qt, QPoint
+from qtpy.QtWidgets import QFrame, QLineEdit, QVBoxLayout, QAbstractItemView
+from .country_list_view import CountryListView
+from .country_search import CountrySearch
+
+
+class CountryPopup(QFrame):
+
+    def __init__(self, parent=None):
+        """Create a new CountryPopup instance (a search field and country list that is borrowed
+        by dropdowns using a shared popup, so only one popup exists for all of them)
+
+        :param parent: the parent widget
+        """
+
+        super(CountryPopup, self).__init__(parent, Qt.WindowType.Popup)
+
+        # Dropdown currently showing the popup
+        self.__dropdown = None
+
+        # Search above the country list (its results replace the country list while searching)
+        self.__list_view = CountryListView(self)
+        self.__list_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.__search = CountrySearch(self.__list_view, self)
+        self.__list_view.clicked.connect(self.__search.select)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.addWidget(self.__search)
+        layout.addWidget(self.__list_view)
+
+    def showFor(self, dropdown):
+        """Show the popup below a dropdown, styled and filled like the dropdown
+        (a dropdown still showing the popup is closed first)
+
+        :param dropdown: CountryDropdown or CompactPhoneInput borrowing the popup
+        """
+
+        if self.__dropdown is not None and self.__dropdown is not dropdown:
+            self.__dropdown.hidePopup()
+        if self.__dropdown is None:
+            dropdown.destroyed.connect(self.__handle_dropdown_destroyed)
+        self.__dropdown = dropdown
+        self.__search.setDropdown(dropdown)
+
+        # Restyling is only needed when the popup switches between differently styled dropdowns
+        if self.styleSheet() != dropdown.getPopupStyleSheet():
+            self.setStyleSheet(dropdown.getPopupStyleSheet())
+        if self.font() != dropdown.font():
+            self.setFont(dropdown.font())
+
+        model = dropdown.model()
+        search_results_view = self.__search.getSearchResultsView()
+        for view in (self.__list_view, search_results_view):
+            if view.iconSize() != dropdown.iconSize():
+                view.setIconSize(dropdown.iconSize())
+            view.setFixedWidth(dropdown.getPopupWidth())
+        if self.__list_view.model() is not model:
+            self.__list_view.setModel(model)
+
+        # Same height as the list popup of QComboBox (maximum number of visible items)
+        row_height = self.__list_view.sizeHintForRow(0) if model.rowCount() else 0
+        list_height = min(model.rowCount(), dropdown.maxVisibleItems()) * row_height + self.__list_view.frameWidth() * 2
+        for view in (self.__list_view, search_results_view):
+            view.setFixedHeight(list_height)
+        self.adjustSize()
+
+        # Below the dropdown or above it if there isn't enough space on the screen
+        position = dropdown.mapToGlobal(QPoint(0, dropdown.height()))
+        screen = dropdown.screen().availableGeometry()
+        if position.y() + self.height() > screen.bottom() and position.y() - dropdown.height() - self.height() >= screen.top():
+            position.setY(position.y() - dropdown.height() - self.height())
+        position.setX(max(screen.left(), min(position.x(), screen.right() - self.width())))
+        self.move(position)
+
+        index = model.index(dropdown.currentIndex(), 0)
+        self.__list_view.setCurrentIndex(index)
+        self.show()
+        self.__list_view.scrollTo(index, QAbstractItemView.ScrollHint.PositionAtCenter)
+        self.__search.setFocus()
+
+    def release(self, dropdown):
+        """Hide the popup and clear the search if it is shown for the given dropdown
+
+        :param dropdown: CountryDropdown or CompactPhoneInput that borrowed the popup
+        """
+
+        if self.__dropdown is not dropdown:
+            return
+
+        dropdown.destroyed.disconnect(self.__handle_dropdown_destroyed)
+        self.__dropdown = None
+        self.hide()
+        self.__search.clear()
+        self.__search.setDropdown(None)
+
+    def getDropdown(self):
+        """Get the dropdown currently showing the popup
+
+        :return: CountryDropdown or None
+        """
+
+        return self.__dropdown
+
+    def getSearch(self) -> CountrySearch:
+        """Get the search shown above the country list
+
+        :return: country search
+        """
+
+        return self.__search
+
+    def getSearchLineEdit(self) -> QLineEdit:
+        """Get the search field shown above the country list
+
+        :return: search LineEdit
+        """
+
+        return self.__search.getSearchLineEdit()
+
+    def getListView(self) -> CountryListView:
+        """Get the view showing all countries
+
+        :return: country list view
+        """
+
+        return self.__list_view
+
+    def getSearchResultsView(self) -> CountryListView:
+        """Get the view showing the countries matching the search
+
+        :return: search results view
+        """
+
+        return self.__search.getSearchResultsView()
+
+    def mousePressEvent(self, event):
+        """Method that gets called when the mouse is pressed (closes the popup if outside of it)
+
+        :param event: event sent by PyQt
+        """
+
+        # A click on the dropdown only closes the popup instead of opening it again
+        if self.__dropdown is not None and not self.rect().contains(event.position().toPoint()):
+            if self.__dropdown.rect().contains(
+                    self.__dropdown.mapFromGlobal(event.globalPosition().toPoint())):
+                self.setAttribute(Qt.WidgetAttribute.WA_NoMouseReplay)
+        super().mousePressEvent(event)
+
+    def hideEvent(self, event):
+        """Method that gets called when the popup is hidden (i.e. by clicking outside of it)
+
+        :param event: event sent by PyQt
+        """
+
+        super().hideEvent(event)
+
+        # Closes the popup through the dropdown showing it
+        if self.__dropdown is not None:
+            self.__dropdown.hidePopup()
+
+    def __handle_dropdown_destroyed(self):
+        """Handles the dropdown showing the popup being deleted"""
+
+        self.__dropdown = None
+        self.hide()
+        self.__search.clear()
+        self.__search.setDropdown(None)
+
+
+# Popup instance shared by all dropdowns using a shared popup
+_shared_popup = None
+
+
+def get_shared_country_popup() -> CountryPopup:
+    """Get the CountryPopup instance shared by all dropdowns using a shared popup (created on first use)
+
+    :return: shared CountryPopup
+    """
+
+    global _shared_popup
+
+    if _shared_popup is None:
+        _shared_popup = CountryPopup()
+    return _shared_popup
@@ -0,0 +1,163 @@
+import weakref
+from qtpy.QtCore import Qt, QEvent, QCoreApplication
+from qtpy.QtWidgets import QWidget, QLineEdit, QVBoxLayout, QLayout
+from .country_filter_model import CountryFilterModel
+from .country_list_view import CountryListView
+
+
+class CountrySearch(QWidget):
+
+    def __init__(self, list_view: CountryListView, parent=None):
+        """Create a new CountrySearch instance (a search field and a second list showing only the
+        matching countries, which replaces the country list of the popup while searching)
+
+        :param list_view: view showing all countries in the popup
+        :param parent: the parent widget
+        """
+
+        super(CountrySearch, self).__init__(parent)
+
+        # Country list of the popup and the dropdown whose countries are searched (weakly
+        # referenced, since a dropdown with an own popup owns its search)
+        self.__list_view = list_view
+        self.__dropdown = None
+
+        self.__search_line_edit = QLineEdit(self)
+        self.__search_line_edit.setPlaceholderText('Search')
+        self.__search_line_edit.setClearButtonEnabled(True)
+        self.__search_line_edit.installEventFilter(self)
+        self.__search_line_edit.textChanged.connect(self.__handle_search_text_changed)
+        self.__search_results_model = CountryFilterModel(parent=self)
+        self.__search_results_view = CountryListView(self)
+        self.__search_results_view.setModel(self.__search_results_model)
+        self.__search_results_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.__search_results_view.clicked.connect(self.select)
+        self.__search_results_view.hide()
+        self.setFocusProxy(self.__search_line_edit)
+
+        # Only as high as the search field unless the search results are shown
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.setSizeConstraint(QLayout.SizeConstraint.SetMaximumSize)
+        layout.addWidget(self.__search_line_edit)
+        layout.addWidget(self.__search_results_view)
+
+    def getDropdown(self):
+        """Get the dropdown whose countries are searched
+
+        :return: CountryDropdown, CompactPhoneInput or None
+        """
+
+        return None if self.__dropdown is None else self.__dropdown()
+
+    def setDropdown(self, dropdown):
+        """Set the dropdown whose countries are searched (looked up in its search index)
+        and selected (the current search text is applied again)
+
+        :param dropdown: CountryDropdown, CompactPhoneInput or None to not search
+        """
+
+        self.__dropdown = None if dropdown is None else weakref.ref(dropdown)
+        if dropdown is None:
+            self.__search_results_model.setSourceModel(None)
+        self.__handle_search_text_changed(self.__search_line_edit.text())
+
+    def getSearchLineEdit(self) -> QLineEdit:
+        """Get the search field
+
+        :return: search LineEdit
+        """
+
+        return self.__search_line_edit
+
+    def getListView(self) -> CountryListView:
+        """Get the view showing all countries
+
+        :return: country list view
+        """
+
+        return self.__list_view
+
+    def getSearchResultsView(self) -> CountryListView:
+        """Get the view showing the countries matching the search
+
+        :return: search results view
+        """
+
+        return self.__search_results_view
+
+    def clear(self):
+        """Clear the search text (the country list is shown again)"""
+
+        self.__search_line_edit.clear()
+
+    def select(self, index):
+        """Select a country of the shown list in the dropdown and close its popup
+
+        :param index: index of the search results or of the country list
+        """
+
+        dropdown = self.getDropdown()
+        if dropdown is None:
+            return
+
+        if index.isValid():
+            row = index.row()
+            if index.model() is self.__search_results_model:
+                row = self.__search_results_model.mapToSource(row)
+            dropdown.setCurrentIndex(row)
+        dropdown.hidePopup()
+
+    def eventFilter(self, watched, event) -> bool:
+        """Method that gets called for events of the search field
+
+        :param watched: object the event was sent to
+        :param event: event sent by PyQt
+        :return: whether the event was handled
+        """
+
+        if event.type() == QEvent.Type.KeyPress and watched is self.__search_line_edit:
+            key = event.key()
+
+            # Navigate the shown list while typing
+            view = self.__list_view if self.__search_results_view.isHidden() else self.__search_results_view
+            if key in (Qt.Key.Key_Up, Qt.Key.Key_Down, Qt.Key.Key_PageUp, Qt.Key.Key_PageDown):
+                QCoreApplication.sendEvent(view, event)
+                return True
+            if key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+                self.select(view.currentIndex())
+                return True
+            if key == Qt.Key.Key_Escape:
+                dropdown = self.getDropdown()
+                if dropdown is not None:
+                    dropdown.hidePopup()
+                return True
+        return super().eventFilter(watched, event)
+
+    def __handle_search_text_changed(self, text: str):
+        """Handles change of the search text (the matching rows are looked up in the
+        search index of the dropdown, so the cost only depends on the number of matches)
+
+        :param text: new search text
+        """
+
+        dropdown = self.getDropdown()
+        if dropdown is None or not text:
+            self.__search_results_view.hide()
+            self.__search_results_model.setRows([])
+
+            # Shrink before the country list is shown again, so the popup doesn't grow
+            self.layout().activate()
+            self.__list_view.show()
+            return
+
+        model = dropdown.model()
+        if self.__search_results_model.getSourceModel() is not model:
+            self.__search_results_model.setSourceModel(model)
+        self.__search_results_model.setRows(dropdown.getSearchIndex().search(text))
+
+        # Highlight the first match
+        self.__list_view.hide()
+        self.__search_results_view.show()
+        self.__search_results_view.setCurrentIndex(self.__search_results_model.index(0, 0))
@@ -0,0 +1,109 @@
+import re
+import unicodedata
+from .countries import countries
+
+
+# Characters that are removed inside a word (i.e. 'U.S.' -> 'us', "d'Ivoire" -> 'divoire')
+_joining_characters = re.compile(r"['’.]")
+
+# Characters that separate words
+_separators = re.compile(r'[^0-9a-z]+')
+
+
+def _normalize(text: str) -> str:
+    """Lowercase a text and remove its accents (i.e. 'Réunion' -> 'reunion')
+
+    :param text: text to normalize
+    :return: normalized text
+    """
+
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(character for character in decomposed if not unicodedata.combining(character))
+
+
+def _split_words(text: str) -> list:
+    """Split a normalized text into its words
+
+    :param text: normalized text
+    :return: list of words
+    """
+
+    return [word for word in _separators.split(text) if word]
+
+
+class CountrySearchIndex:
+
+    def __init__(self, country_codes=None):
+        """Create a new CountrySearchIndex instance. Every prefix of every word of the country
+        names, the country codes and the phone codes (without '+') is mapped to the rows
+        containing it, so a search only consists of dict lookups and set intersections.
+
+        :param country_codes: codes of the countries to index in row order (all countries by default)
+        """
+
+        self.__country_codes = list(countries) if country_codes is None else list(country_codes)
+        self.__all_rows = frozenset(range(len(self.__country_codes)))
+
+        prefixes = {}
+        for row, country in enumerate(self.__country_codes):
+            name = _normalize(countries[country][0])
+            words = set(_split_words(name))
+            words.update(_split_words(_joining_characters.sub('', name)))
+            words.add(country)
+            words.add(countries[country][1][1:])
+
+            row_prefixes = {word[:length] for word in words for length in range(1, len(word) + 1)}
+            for prefix in row_prefixes:
+                prefixes.setdefault(prefix, set()).add(row)
+
+        self.__prefixes = {prefix: frozenset(rows) for prefix, rows in prefixes.items()}
+
+    def search(self, query: str) -> list:
+        """Find the rows of all countries matching a query. Every word of the query must be the
+        start of a word of the country name, the country code or the phone code.
+
+        :param query: search query (i.e. 'united st', 'de' or '+44', case- and accent-insensitive)
+        :return: list of matching rows in ascending order (all rows if the query is empty)
+        """
+
+        return sorted(self.match(query))
+
+    def match(self, query: str) -> frozenset:
+        """Find the rows of all countries matching a query (see search)
+
+        :param query: search query
+        :return: set of matching rows
+        """
+
+        rows = None
+        for word in _split_words(_joining_characters.sub('', _normalize(query))):
+            word_rows = self.__prefixes.get(word, frozenset())
+            rows = word_rows if rows is None else rows & word_rows
+            if not rows:
+                break
+        return self.__all_rows if rows is None else rows
+
+    def getCountryCodes(self) -> list:
+        """Get the codes of the indexed countries (in row order)
+
+        :return: list of country codes
+        """
+
+        return list(self.__country_codes)
+
+
+# Index instance shared by all dropdowns
+_shared_index = None
+
+
+def get_shared_country_search_index() -> CountrySearchIndex:
+    """Get the CountrySearchIndex instance of all countries shared by all dropdowns (created on first use)
+
+    :return: shared CountrySearchIndex
+    """
+
+    global _shared_index
+
+    if _shared_index is None:
+        _shared_index = CountrySearchIndex()
+    return _shared_index
@@ -0,0 +1,124 @@
+from .countries import countries, country_codes, phone_code_rows
+
+
+# Countries used for phone codes shared by multiple countries
+default_countries = {
+    '+1': 'us',
+    '+7': 'ru',
+    '+39': 'it',
+    '+590': 'gp',
+    '+599': 'cw'
+}
+
+
+class DialCodeTrie:
+
+    def __init__(self, defaults: dict = None):
+        """Create a new DialCodeTrie instance containing the phone codes of all countries
+
+        :param defaults: dict mapping shared phone codes to the country they should resolve to
+        """
+
+        # Every node is a dict mapping the next digit to the child node,
+        # the key None marks the end of a phone code
+        self.__root = {}
+        self.__defaults = dict(default_countries if defaults is None else defaults)
+
+        for phone_code in phone_code_rows:
+            node = self.__root
+            for digit in phone_code[1:]:
+                node = node.setdefault(digit, {})
+            node[None] = phone_code
+
+    def match(self, number: str):
+        """Find the longest phone code the given international number starts with.
+        Spaces between the digits of the phone code are ignored.
+
+        :param number: international number (i.e. '+44 20 7946 0958')
+        :return: tuple of phone code and remaining number (i.e. ('+44', '20 7946 0958')) or None
+        """
+
+        if not number.startswith('+'):
+            return None
+
+        node = self.__root
+        match = None
+        for i in range(1, len(number)):
+            character = number[i]
+            if character == ' ':
+                continue
+            node = node.get(character)
+            if node is None:
+                break
+            if None in node:
+                match = (node[None], number[i + 1:].lstrip())
+        return match
+
+    def isPrefix(self, number: str) -> bool:
+        """Get whether the given international number could still become a known phone code
+
+        :param number: international number (i.e. '+4')
+        :return: whether more digits could complete a phone code
+        """
+
+        if not number.startswith('+'):
+            return False
+
+        node = self.__root
+        for character in number[1:].replace(' ', ''):
+            node = node.get(character)
+            if node is None:
+                return False
+        return len(node) > (1 if None in node else 0)
+
+    def getCountry(self, phone_code: str, current_country: str = None) -> str:
+        """Get the country a phone code resolves to
+
+        :param phone_code: phone code (i.e. '+1')
+        :param current_country: country that is kept if it uses the phone code
+        :return: country code (i.e. 'us') or None if the phone code is unknown
+        """
+
+        rows = phone_code_rows.get(phone_code)
+        if rows is None:
+            return None
+        if current_country in countries and countries[current_country][1] == phone_code:
+            return current_country
+        if len(rows) > 1 and phone_code in self.__defaults:
+            return self.__defaults[phone_code]
+        return country_codes[rows[0]]
+
+    def getDefaultCountry(self, phone_code: str) -> str:
+        """Get the country a shared phone code resolves to
+
+        :param phone_code: phone code (i.e. '+1')
+        :return: country code (i.e. 'us')
+        """
+
+        return self.getCountry(phone_code)
+
+    def setDefaultCountry(self, phone_code: str, country: str):
+        """Set the country a shared phone code resolves to
+
+        :param phone_code: phone code (i.e. '+1')
+        :param country: country code (i.e. 'ca')
+        """
+
+        self.__defaults[phone_code] = country.lower()
+
+
+# Trie instance shared by all PhoneLineEdit instances
+_shared_trie = None
+
+
+def get_shared_dial_code_trie() -> DialCodeTrie:
+    """Get the DialCodeTrie instance shared by all line edits (created on first use)
+
+    :return: shared DialCodeTrie
+    """
+
+    global _shared_trie
+
+    if _shared_trie is None:
+        _shared_trie = DialCodeTrie()
+    return _shared_trie
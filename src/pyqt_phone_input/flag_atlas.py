@@ -0,0 +1,111 @@
+import json
+import math
+import os
+from qtpy.QtCore import Qt, QRect
+from qtpy.QtGui import QImage, QPainter
+from .countries import countries
+
+
+# Directory containing the flag icons the atlas is built from
+_icon_directory = os.path.dirname(os.path.realpath(__file__)) + '/flag_icons'
+
+# Directory containing the generated atlases
+_atlas_directory = os.path.dirname(os.path.realpath(__file__)) + '/flag_atlases'
+
+# Flag sizes an atlas is generated for (standard icon sizes and their 2x variants)
+FLAG_SIZES = (16, 24, 32, 48, 64, 96)
+
+# Key of the PNG text chunk storing the index, so loading an atlas is a single file read
+INDEX_KEY = 'flag_index'
+
+
+def get_flag_size(size: int) -> int:
+    """Get the smallest generated flag size that is at least as large as the given size
+    (so flags are only ever scaled down, and by as little as possible)
+
+    :param size: size in device pixels
+    :return: flag size (largest flag size if the given size is larger)
+    """
+
+    for flag_size in FLAG_SIZES:
+        if flag_size >= size:
+            return flag_size
+    return FLAG_SIZES[-1]
+
+
+def get_flag_atlas_path(cell_size: int) -> str:
+    """Get the path of the atlas containing all flags at the given size
+
+    :param cell_size: width and height of a single flag
+    :return: path of the atlas image
+    """
+
+    return _atlas_directory + '/flags_{}.png'.format(cell_size)
+
+
+def build_flag_atlas(cell_size: int, path: str = None) -> str:
+    """Pack the flags of all countries into one image. The index mapping every
+    country to its rect inside the image is stored in the image itself.
+
+    :param cell_size: width and height of a single flag
+    :param path: path the atlas is saved to (default location by default)
+    :return: path of the atlas image
+    """
+
+    if path is None:
+        path = get_flag_atlas_path(cell_size)
+
+    columns = math.ceil(math.sqrt(len(countries)))
+    rows = math.ceil(len(countries) / columns)
+    atlas = QImage(columns * cell_size, rows * cell_size, QImage.Format.Format_ARGB32_Premultiplied)
+    atlas.fill(Qt.GlobalColor.transparent)
+
+    index = {}
+    painter = QPainter(atlas)
+    for i, country in enumerate(countries):
+        flag = QImage(_icon_directory + '/{}.png'.format(country)).scaled(
+            cell_size, cell_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        x = i % columns * cell_size
+        y = i // columns * cell_size
+        painter.drawImage(x, y, flag)
+        index[country] = [x, y, flag.width(), flag.height()]
+    painter.end()
+
+    atlas.setText(INDEX_KEY, json.dumps(index, separators=(',', ':')))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if not atlas.save(path, 'PNG'):
+        raise OSError('Could not save flag atlas to {}'.format(path))
+    return path
+
+
+def build_flag_atlases(sizes=FLAG_SIZES) -> list:
+    """Build the atlases of all given flag sizes at the default location
+
+    :param sizes: flag sizes to build atlases for
+    :return: paths of the atlas images
+    """
+
+    return [build_flag_atlas(size) for size in sizes]
+
+
+def load_flag_atlas(cell_size: int, path: str = None):
+    """Load an atlas and its index
+
+    :param cell_size: width and height of a single flag
+    :param path: path of the atlas image (default location by default)
+    :return: tuple of the atlas image and a dict mapping country codes to rects or None if the atlas doesn't exist
+    """
+
+    if path is None:
+        path = get_flag_atlas_path(cell_size)
+
+    atlas = QImage(path)
+    index = atlas.text(INDEX_KEY)
+    if atlas.isNull() or not index:
+        return None
+    return atlas, {country: QRect(*rect) for country, rect in json.loads(index).items()}
+
+
+if __name__ == '__main__':
+    for atlas_path in build_flag_atlases():
+        print(atlas_path)
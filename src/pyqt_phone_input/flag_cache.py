@@ -0,0 +1,282 @@
+import time
+from collections import OrderedDict
+from qtpy.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal
+from qtpy.QtGui import QIcon, QPixmap
+from .countries import countries
+from .flag_atlas import FLAG_SIZES, get_flag_atlas_path, get_flag_size, load_flag_atlas
+from .instrumentation import is_instrumentation_enabled, record
+
+
+# Flag size used for the item icons (16 px icons at up to 2x device pixel ratio)
+ICON_FLAG_SIZE = 32
+
+# Decoded atlases and their indexes per flag size (flags are only loaded from the atlases,
+# the loose flag icons are the atlas source and aren't part of the package)
+_atlases = {}
+
+# Process-wide caches shared by every CountryDropdown ((country, flag size) -> pixmap)
+_pixmaps = {}
+_icons = {}
+
+# Maximum number of pre-scaled flags kept (least recently used flags are removed first)
+SCALED_CACHE_SIZE = 256
+
+# Flags scaled to the size they are painted at, shared by every CountryDropdown
+# ((country, size, device pixel ratio) -> pixmap, ordered from least to most recently used)
+_scaled_pixmaps = OrderedDict()
+
+# Flag sizes currently decoded in the background
+_pending = set()
+
+# Incremented by clear_flag_cache, so atlases decoded for an older cache are dropped
+_generation = 0
+
+# Cache statistics (pixmap, icon and pre-scaled flag lookups are counted separately)
+_stats = {'loads': 0, 'hits': 0, 'misses': 0, 'icon_hits': 0, 'icon_misses': 0,
+          'scaled_hits': 0, 'scaled_misses': 0}
+
+
+def get_flag_pixmap(country: str, flag_size: int = ICON_FLAG_SIZE) -> QPixmap:
+    """Get the flag of a country as a pixmap (sliced from the flag atlas of the
+    given size only once per process)
+
+    :param country: country code (i.e. 'us')
+    :param flag_size: flag size in pixels (one of flag_atlas.FLAG_SIZES)
+    :return: flag pixmap (null pixmap if the country is unknown)
+    """
+
+    key = (country, flag_size)
+    pixmap = _pixmaps.get(key)
+    if pixmap is not None:
+        _stats['hits'] += 1
+        return pixmap
+
+    _stats['misses'] += 1
+    start = time.perf_counter() if is_instrumentation_enabled() else None
+    atlas, index = _get_atlas(flag_size)
+    pixmap = atlas.copy(index[country]) if country in index else QPixmap()
+    _pixmaps[key] = pixmap
+
+    if start is not None:
+        record(None, 'icon_load', time.perf_counter() - start)
+    return pixmap
+
+
+def get_flag_icon(country: str) -> QIcon:
+    """Get the flag of a country as an icon (created only once per process)
+
+    :param country: country code (i.e. 'us')
+    :return: flag icon
+    """
+
+    icon = _icons.get(country)
+    if icon is not None:
+        _stats['icon_hits'] += 1
+        return icon
+
+    _stats['icon_misses'] += 1
+    icon = QIcon(get_flag_pixmap(country))
+    _icons[country] = icon
+    return icon
+
+
+def get_scaled_flag_pixmap(country: str, size: int, device_pixel_ratio: float = 1.0) -> QPixmap:
+    """Get the flag of a country scaled to the given size, ready to be drawn
+    (scaled from the nearest larger flag size, only once per size and device pixel ratio)
+
+    :param country: country code (i.e. 'us')
+    :param size: width and height in device-independent pixels
+    :param device_pixel_ratio: device pixel ratio of the widget it is drawn on
+    :return: scaled flag pixmap
+    """
+
+    key = (country, size, device_pixel_ratio)
+    pixmap = _scaled_pixmaps.get(key)
+    if pixmap is not None:
+        _stats['scaled_hits'] += 1
+        _scaled_pixmaps.move_to_end(key)
+        return pixmap
+
+    _stats['scaled_misses'] += 1
+    device_size = round(size * device_pixel_ratio)
+    pixmap = get_flag_pixmap(country, get_flag_size(device_size))
+    if pixmap.width() != device_size:
+        pixmap = pixmap.scaled(device_size, device_size, Qt.AspectRatioMode.KeepAspectRatio,
+                               Qt.TransformationMode.SmoothTransformation)
+    else:
+        pixmap = QPixmap(pixmap)
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    _scaled_pixmaps[key] = pixmap
+    while len(_scaled_pixmaps) > SCALED_CACHE_SIZE:
+        _scaled_pixmaps.popitem(last=False)
+    return pixmap
+
+
+class FlagLoader(QObject):
+
+    # Events
+    flags_loaded = Signal(int)
+    atlas_decoded = Signal(int, int, object)
+
+    def __init__(self, parent=None):
+        """Create a new FlagLoader instance (receives the atlases decoded in the background)
+
+        :param parent: the parent object
+        """
+
+        super(FlagLoader, self).__init__(parent)
+
+        # Emitted from the worker threads, so it is handled on the GUI thread
+        self.atlas_decoded.connect(self.__handle_atlas_decoded)
+
+    def __handle_atlas_decoded(self, flag_size: int, generation: int, loaded):
+        """Handles an atlas decoded in the background (converted to a pixmap on the GUI thread)
+
+        :param flag_size: flag size in pixels
+        :param generation: cache generation the atlas was requested in
+        :param loaded: tuple of the atlas image and its index or None if the atlas is missing
+        """
+
+        # Cache was cleared while decoding (a newer preload of the same size may be pending)
+        if generation != _generation:
+            return
+
+        _pending.discard(flag_size)
+
+        # A missing atlas is reported once the flags are used on the GUI thread
+        if loaded is None:
+            return
+
+        # Atlas may have been loaded on the GUI thread in the meantime
+        if flag_size not in _atlases:
+            _stats['loads'] += 1
+            _atlases[flag_size] = (QPixmap.fromImage(loaded[0]), loaded[1])
+        self.flags_loaded.emit(flag_size)
+
+
+class _AtlasDecoder(QRunnable):
+
+    def __init__(self, flag_size: int, generation: int, flag_loader: FlagLoader):
+        """Create a new _AtlasDecoder instance
+
+        :param flag_size: flag size in pixels
+        :param generation: cache generation the atlas is requested in
+        :param flag_loader: loader the decoded atlas is sent to
+        """
+
+        super(_AtlasDecoder, self).__init__()
+
+        self.__flag_size = flag_size
+        self.__generation = generation
+        self.__flag_loader = flag_loader
+
+    def run(self):
+        """Decodes the atlas into a QImage (safe outside the GUI thread)"""
+
+        loaded = load_flag_atlas(self.__flag_size)
+        self.__flag_loader.atlas_decoded.emit(self.__flag_size, self.__generation, loaded)
+
+
+# Loader instance shared by all preload calls
+_flag_loader = None
+
+
+def get_flag_loader() -> FlagLoader:
+    """Get the FlagLoader instance notifying about flags loaded in the background (created on first use)
+
+    :return: shared FlagLoader
+    """
+
+    global _flag_loader
+
+    if _flag_loader is None:
+        _flag_loader = FlagLoader()
+    return _flag_loader
+
+
+def preload_flags(flag_sizes=None, thread_pool: QThreadPool = None):
+    """Decode the flags of the given sizes in the background. Every size emits
+    get_flag_loader().flags_loaded once it is ready to be used on the GUI thread.
+
+    :param flag_sizes: flag sizes to load (all sizes up to the item icon size by default)
+    :param thread_pool: thread pool used to decode the flags (global thread pool by default)
+    """
+
+    if flag_sizes is None:
+        flag_sizes = [flag_size for flag_size in FLAG_SIZES if flag_size <= ICON_FLAG_SIZE]
+    if thread_pool is None:
+        thread_pool = QThreadPool.globalInstance()
+
+    flag_loader = get_flag_loader()
+    for flag_size in flag_sizes:
+        if flag_size not in _atlases and flag_size not in _pending:
+            _pending.add(flag_size)
+            thread_pool.start(_AtlasDecoder(flag_size, _generation, flag_loader))
+
+
+def is_preloading_flags(flag_size: int = None) -> bool:
+    """Get whether flags are currently decoded in the background
+
+    :param flag_size: flag size in pixels (any size by default)
+    :return: whether the flags are still being decoded
+    """
+
+    return bool(_pending) if flag_size is None else flag_size in _pending
+
+
+def warm_up_flag_cache(country_codes=None):
+    """Load the flags of the given countries (all countries by default) into the cache
+
+    :param country_codes: iterable of country codes to load
+    """
+
+    for country in countries if country_codes is None else country_codes:
+        get_flag_icon(country)
+
+
+def clear_flag_cache():
+    """Remove all flags from the cache and reset the statistics (atlases still decoded
+    in the background are no longer waited for and dropped once they are ready)"""
+
+    global _generation
+
+    _generation += 1
+    _atlases.clear()
+    _pending.clear()
+    _pixmaps.clear()
+    _icons.clear()
+    _scaled_pixmaps.clear()
+    for key in _stats:
+        _stats[key] = 0
+
+
+def get_flag_cache_stats() -> dict:
+    """Get the cache statistics
+
+    :return: dict containing the number of file loads, hits, misses and cached flags
+        (hits and misses also for icons, and the same for pre-scaled flags)
+    """
+
+    stats = dict(_stats)
+    stats['cached'] = len(_pixmaps)
+    stats['scaled_cached'] = len(_scaled_pixmaps)
+    return stats
+
+
+def _get_atlas(flag_size: int):
+    """Gets the flag atlas of a flag size (decoded on first use)
+
+    :param flag_size: flag size in pixels
+    :return: tuple of the atlas pixmap and its index
+    """
+
+    atlas = _atlases.get(flag_size)
+    if atlas is None:
+        loaded = load_flag_atlas(flag_size)
+        if loaded is None:
+            raise FileNotFoundError('Flag atlas {} is missing (run python -m pyqt_phone_input.flag_atlas)'.format(
+                get_flag_atlas_path(flag_size)))
+        _stats['loads'] += 1
+        atlas = (QPixmap.fromImage(loaded[0]), loaded[1])
+        _atlases[flag_size] = atlas
+    return atlas
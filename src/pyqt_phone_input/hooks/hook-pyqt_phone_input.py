@@ -1,3 +1,4 @@
 from PyInstaller.utils.hooks import collect_data_files
 
-datas = collect_data_files('pyqt_phone_input', excludes=['hooks'])
\ No newline at end of file
+# Flags are loaded from the atlas, so the loose flag icons aren't bundled
+datas = collect_data_files('pyqt_phone_input', excludes=['hooks', 'flag_icons'])
\ No newline at end of file
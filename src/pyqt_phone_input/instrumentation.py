@@ -0,0 +1,210 @@
+# Opt-in instrumentation of the widgets' hot paths. Widget classes register the methods and
+# signals worth measuring, but they are only wrapped and connected while instrumentation is
+# enabled, so it costs nothing while disabled (apart from one WeakSet insert per widget).
+import functools
+import time
+import weakref
+
+# Whether instrumentation is enabled and the function called for every recorded event
+_enabled = False
+_callback = None
+
+# Registered methods ((class, method name) -> event name) and signals (class -> signal names)
+_methods = {}
+_signals = {}
+
+# Original methods replaced while instrumentation is enabled ((class, method name) -> function)
+_originals = {}
+
+# Every instrumentable widget and the slots connected to its signals while enabled
+_widgets = weakref.WeakSet()
+_connections = weakref.WeakKeyDictionary()
+
+# Recorded stats per widget (widget -> {event name: [count, seconds]}), None for process-wide events
+_stats = weakref.WeakKeyDictionary()
+_process_stats = {}
+
+
+def register_instrumented(cls, methods: dict = None, signals=()):
+    """Register the methods and signals of a widget class to measure while instrumentation is enabled
+
+    :param cls: widget class
+    :param methods: dict mapping method names (private names are mangled, i.e. '_PhoneInput__method') to event names
+    :param signals: names of the signals whose emissions are counted (as 'signal.<name>')
+    """
+
+    for name, event in (methods or {}).items():
+        if not callable(cls.__dict__.get(name)):
+            raise AttributeError('{} has no method {}'.format(cls.__name__, name))
+        _methods[(cls, name)] = event
+        if _enabled:
+            _wrap_method(cls, name, event)
+    _signals[cls] = tuple(signals)
+
+
+def track_widget(widget):
+    """Track a widget so its signals can be counted (called by the widgets on construction)
+
+    :param widget: widget to track
+    """
+
+    _widgets.add(widget)
+    if _enabled:
+        _connect_signals(widget)
+
+
+def enable_instrumentation(callback=None):
+    """Start measuring the registered methods and signals of all widgets
+
+    :param callback: function called with the widget (None for process-wide events),
+        event name and duration in seconds for every recorded event
+    """
+
+    global _enabled, _callback
+
+    _callback = callback
+    if _enabled:
+        return
+
+    _enabled = True
+    for (cls, name), event in _methods.items():
+        _wrap_method(cls, name, event)
+    for widget in list(_widgets):
+        _connect_signals(widget)
+
+
+def disable_instrumentation():
+    """Stop measuring and restore the original methods (recorded stats are kept)"""
+
+    global _enabled, _callback
+
+    _enabled = False
+    _callback = None
+
+    for (cls, name), function in _originals.items():
+        setattr(cls, name, function)
+    _originals.clear()
+
+    for widget, connections in list(_connections.items()):
+        for signal_name, slot in connections:
+            try:
+                getattr(widget, signal_name).disconnect(slot)
+            except (RuntimeError, TypeError):
+                pass
+    _connections.clear()
+
+
+def is_instrumentation_enabled() -> bool:
+    """Get whether instrumentation is enabled
+
+    :return: whether instrumentation is enabled
+    """
+
+    return _enabled
+
+
+def record(widget, event: str, seconds: float = 0.0):
+    """Record an event
+
+    :param widget: widget the event belongs to (None for process-wide events like icon loads)
+    :param event: event name
+    :param seconds: duration of the event
+    """
+
+    stats = _process_stats if widget is None else _stats.setdefault(widget, {})
+    entry = stats.get(event)
+    if entry is None:
+        stats[event] = [1, seconds]
+    else:
+        entry[0] += 1
+        entry[1] += seconds
+
+    if _callback is not None:
+        _callback(widget, event, seconds)
+
+
+def get_instrumentation_stats(widget=None) -> dict:
+    """Get a snapshot of the recorded stats
+
+    :param widget: widget to get the stats of (process-wide events are stored under None)
+    :return: dict mapping event names to dicts containing 'count' and 'seconds',
+        or if no widget is given, a dict mapping every widget (and None) to its stats
+    """
+
+    if widget is not None:
+        return _snapshot(_stats.get(widget, {}))
+
+    snapshot = {recorded_widget: _snapshot(stats) for recorded_widget, stats in _stats.items()}
+    if _process_stats:
+        snapshot[None] = _snapshot(_process_stats)
+    return snapshot
+
+
+def reset_instrumentation_stats():
+    """Remove all recorded stats"""
+
+    _stats.clear()
+    _process_stats.clear()
+
+
+def _snapshot(stats: dict) -> dict:
+    """Copies recorded stats
+
+    :param stats: dict mapping event names to lists of count and seconds
+    :return: dict mapping event names to dicts containing 'count' and 'seconds'
+    """
+
+    return {event: {'count': count, 'seconds': seconds} for event, (count, seconds) in stats.items()}
+
+
+def _wrap_method(cls, name: str, event: str):
+    """Replaces a method with a version recording its calls and durations
+
+    :param cls: class defining the method
+    :param name: method name
+    :param event: event name
+    """
+
+    function = cls.__dict__[name]
+    _originals[(cls, name)] = function
+
+    @functools.wraps(function)
+    def instrumented(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            record(self, event, time.perf_counter() - start)
+
+    setattr(cls, name, instrumented)
+
+
+def _connect_signals(widget):
+    """Connects counters to the registered signals of a widget
+
+    :param widget: widget to connect
+    """
+
+    if widget in _connections:
+        return
+
+    widget_ref = weakref.ref(widget)
+    connections = []
+    for cls in type(widget).__mro__:
+        for signal_name in _signals.get(cls, ()):
+            slot = functools.partial(_handle_signal, widget_ref, 'signal.' + signal_name)
+            getattr(widget, signal_name).connect(slot)
+            connections.append((signal_name, slot))
+    _connections[widget] = connections
+
+
+def _handle_signal(widget_ref, event: str, *args):
+    """Records a signal emission
+
+    :param widget_ref: weak reference to the emitting widget
+    :param event: event name
+    """
+
+    widget = widget_ref()
+    if widget is not None:
+        record(widget, event)
@@ -1,9 +1,14 @@
+from contextlib import contextmanager
 from qtpy import QtCore
-from qtpy.QtCore import QMargins, Signal
-from qtpy.QtGui import QColor, QPalette, QFont
+from qtpy.QtCore import QMargins, Signal, QTimer
+from qtpy.QtGui import QColor, QPalette, QFont, QValidator
 from qtpy.QtWidgets import QWidget, QLineEdit
+from .core import get_phone_number
 from .country_dropdown import CountryDropdown
+from .instrumentation import register_instrumented, track_widget
 from .phone_line_edit import PhoneLineEdit
+from .style_sheets import (line_edit_style_sheet, phone_code_style_sheet, combobox_style_sheet,
+                           STATE_PROPERTY, STATE_NORMAL, STATE_FOCUSED)
 
 
 class PhoneInput(QWidget):
@@ -12,13 +17,17 @@ class PhoneInput(QWidget):
     country_changed = Signal()
     number_changed = Signal()
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, lazy: bool = False, shared_popup: bool = False):
         """Create a new PhoneInput instance
 
         :param parent: the parent widget
+        :param lazy: whether the country dropdown should only be populated once it is first opened
+        :param shared_popup: whether the dropdown should borrow the popup shared by all dropdowns
+            (saves the memory of a popup per instance, i.e. for forms with many phone inputs)
         """
 
         super(PhoneInput, self).__init__(parent)
+        track_widget(self)
 
         # Styling options
         self.__color = QColor(0, 0, 0)
@@ -41,20 +50,47 @@ class PhoneInput(QWidget):
         self.__dropdown_item_selection_background_color = self.palette().color(QPalette.ColorRole.Highlight)
         self.__dropdown_border_color = None
 
+        # Nesting depth of beginUpdate() calls and stylesheet updates deferred until endUpdate()
+        self.__update_depth = 0
+        self.__line_edit_style_sheet_pending = False
+        self.__combobox_style_sheet_pending = False
+
+        # Restyling after resize events is deferred until no resize event occurred for the delay (ms)
+        # (independently of the beginUpdate() depth)
+        self.__resize_restyle_deferred = False
+        self.__resize_restyle_timer = QTimer(self)
+        self.__resize_restyle_timer.setSingleShot(True)
+        self.__resize_restyle_timer.setInterval(50)
+        self.__resize_restyle_timer.timeout.connect(self.__handle_resize_settled)
+
+        # Current state (selects the focused style through a dynamic property)
+        self.__state = STATE_NORMAL
+
+        # Number of stylesheet updates that were applied or skipped (unchanged stylesheet)
+        # and number of state changes that only required a repolish
+        self.__style_sheet_stats = {'applied': 0, 'skipped': 0, 'repolished': 0}
+
         # Phone number LineEdit
         self.__phone_line_edit = PhoneLineEdit(self)
         self.__phone_line_edit.setBorderWidth(self.__border_width)
         self.__phone_line_edit.setCurrentBorderColor(self.__border_color)
 
+        # Focus given to the widget (i.e. as item view editor) goes to the LineEdit
+        self.setFocusProxy(self.__phone_line_edit)
+
         # Phone code LineEdit
         self.__phone_code_line_edit = QLineEdit(self)
         self.__phone_code_line_edit.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
 
+        # Initial state used by the stylesheets
+        self.__phone_line_edit.setProperty(STATE_PROPERTY, self.__state)
+        self.__phone_code_line_edit.setProperty(STATE_PROPERTY, self.__state)
+
         # Dropdown
-        self.__country_dropdown = CountryDropdown(self)
+        self.__country_dropdown = CountryDropdown(self, lazy, shared_popup)
         self.__country_dropdown.setBorderWidth(self.__border_width)
         self.__country_dropdown.setPhoneCodeLineEdit(self.__phone_code_line_edit)
-        self.__country_dropdown.currentIndexChanged.connect(self.__handle_country_changed)
+        self.__country_dropdown.country_changed.connect(self.__handle_country_changed)
         self.__country_dropdown.show_popup.connect(self.__handle_popup_opened)
         self.__country_dropdown.hide_popup.connect(self.__handle_popup_closed)
         self.__country_dropdown.geometry_changed.connect(self.__update_line_edit_style_sheet)
@@ -76,10 +112,9 @@ class PhoneInput(QWidget):
         self.__phone_line_edit.setFixedSize(self.width(), self.height())
         self.__phone_code_line_edit.setFixedHeight(self.height())
         self.__country_dropdown.setFixedHeight(self.height())
-        self.__country_dropdown.view().setFixedWidth(self.__country_dropdown.minimumSizeHint().width())
 
     def __handle_country_changed(self):
-        """Emits country_changed event when dropdown index changes"""
+        """Emits country_changed event when dropdown country changes"""
 
         self.country_changed.emit()
 
@@ -91,52 +126,21 @@ class PhoneInput(QWidget):
     def __handle_popup_opened(self):
         """Handles dropdown popup being opened"""
 
-        selection_foreground_color = None
-        if self.__selection_foreground_color:
-            selection_foreground_color = self.__selection_foreground_color
-        elif self.__focused_color:
-            selection_foreground_color = self.__focused_color
-        else:
-            selection_foreground_color = self.__color
-
-        self.__phone_line_edit.setStyleSheet('QLineEdit {'
-                           'color: %s;'
-                           'background-color: %s;'
-                           'border: %dpx solid %s;'
-                           'border-radius: %dpx;'
-                           'padding: %d %d %d %dpx;'
-                           'selection-color: %s;'
-                           'selection-background-color: %s;'
-                           '}'
-                           % (self.__color.name() if self.__focused_color is None else self.__focused_color.name(),
-                              self.__background_color.name() if self.__focused_background_color is None else self.__focused_background_color.name(),
-                              self.__border_width,
-                              self.__border_color.name() if self.__focused_border_color is None else self.__focused_border_color.name(),
-                              self.__border_radius,
-                              self.__padding.top(),
-                              self.__padding.right(),
-                              self.__padding.bottom(),
-                              self.__padding.left() + self.__country_dropdown.width(),
-                              selection_foreground_color.name(),
-                              self.__selection_background_color.name()))
-
-        self.__update_phone_code_line_edit_focused()
+        self.__set_state(STATE_FOCUSED)
         self.__phone_line_edit.setCurrentBorderColor(
             self.__border_color if self.__focused_border_color is None else self.__focused_border_color)
 
     def __handle_popup_closed(self):
         """Handles dropdown popup being closed"""
 
-        self.__update_line_edit_style_sheet()
         if not self.__phone_line_edit.hasFocus():
+            self.__set_state(STATE_NORMAL)
             self.__phone_line_edit.setCurrentBorderColor(self.__border_color)
-        else:
-            self.__update_phone_code_line_edit_focused()
 
     def __handle_focus_in(self):
         """Handles LineEdit being focused"""
 
-        self.__update_phone_code_line_edit_focused()
+        self.__set_state(STATE_FOCUSED)
         self.__phone_line_edit.setCurrentBorderColor(
             self.__border_color if self.__focused_border_color is None else self.__focused_border_color)
 
@@ -144,80 +148,64 @@ class PhoneInput(QWidget):
         """Handles LineEdit losing focus"""
 
         if not self.__country_dropdown.isDropdownOpen():
+            self.__set_state(STATE_NORMAL)
             self.__phone_line_edit.setCurrentBorderColor(self.__border_color)
-            self.__update_line_edit_style_sheet()
+
+    def __set_state(self, state: str):
+        """Sets the state property used by the stylesheets (only repolishes, no new stylesheet)
+
+        :param state: new state (STATE_NORMAL or STATE_FOCUSED)
+        """
+
+        if state == self.__state:
+            return
+
+        self.__state = state
+        for widget in (self.__phone_line_edit, self.__phone_code_line_edit):
+            widget.setProperty(STATE_PROPERTY, state)
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+        self.__style_sheet_stats['repolished'] += 1
 
     def __update_line_edit_style_sheet(self):
         """Updates the LineEdit stylesheet according to the current values"""
 
-        selection_foreground_color = None
-        if self.__selection_foreground_color:
-            selection_foreground_color = self.__selection_foreground_color
-        elif self.__focused_color:
-            selection_foreground_color = self.__focused_color
-        else:
-            selection_foreground_color = self.__color
-
-        self.__phone_line_edit.setStyleSheet('QLineEdit {'
-                           'color: %s;'
-                           'background-color: %s;'
-                           'border: %dpx solid %s;'
-                           'border-radius: %dpx;'
-                           'padding: %d %d %d %dpx;'
-                           'selection-color: %s;'
-                           'selection-background-color: %s;'
-                           '}'
-                           'QLineEdit:focus {'
-                           'color: %s;'
-                           'background-color: %s;'
-                           'border: %dpx solid %s;'
-                           '}'
-                           'QLineEdit:disabled {'
-                           'color: %s;'
-                           'background-color: %s;'
-                           'border: %dpx solid %s;'
-                           '}'
-                           % (self.__color.name(),
-                              self.__background_color.name(),
-                              self.__border_width,
-                              self.__border_color.name(),
-                              self.__border_radius,
-                              self.__padding.top(),
-                              self.__padding.right(),
-                              self.__padding.bottom(),
-                              self.__padding.left() + self.__country_dropdown.width(),
-                              selection_foreground_color.name(),
-                              self.__selection_background_color.name(),
-                              self.__color.name() if self.__focused_color is None else self.__focused_color.name(),
-                              self.__background_color.name() if self.__focused_background_color is None else self.__focused_background_color.name(),
-                              self.__border_width,
-                              self.__border_color.name() if self.__focused_border_color is None else self.__focused_border_color.name(),
-                              self.__color.name() if self.__disabled_color is None else self.__disabled_color.name(),
-                              self.__background_color.name() if self.__disabled_background_color is None else self.__disabled_background_color.name(),
-                              self.__border_width,
-                              self.__border_color.name() if self.__disabled_border_color is None else self.__disabled_border_color.name()))
-
-        if not self.__phone_line_edit.hasFocus() and not self.__country_dropdown.isDropdownOpen():
-            self.__phone_code_line_edit.setStyleSheet('QLineEdit {'
-                                                      'color: %s;'
-                                                      'background-color: transparent;'
-                                                      'border: %dpx solid transparent;'
-                                                      'border-radius: %dpx;'
-                                                      'padding: %d 0 %d 0px;'
-                                                      '}'
-                                                      'QLineEdit:disabled {'
-                                                      'color: %s;'
-                                                      '}'
-                                                      % (self.__color.name(),
-                                                         self.__border_width,
-                                                         self.__border_radius,
-                                                         self.__padding.top(),
-                                                         self.__padding.bottom(),
-                                                         self.__color.name() if self.__disabled_color is None else self.__disabled_color.name()))
+        if self.__update_depth > 0 or self.__resize_restyle_deferred:
+            self.__line_edit_style_sheet_pending = True
+            return
+
+        self.__apply_style_sheet(self.__phone_line_edit, line_edit_style_sheet(
+            self.__color.name(),
+            self.__background_color.name(),
+            self.__border_width,
+            self.__border_color.name(),
+            self.__border_radius,
+            self.__padding_values(),
+            self.__get_selection_foreground_color().name(),
+            self.__selection_background_color.name(),
+            self.__state_color_name(self.__focused_color, self.__color),
+            self.__state_color_name(self.__focused_background_color, self.__background_color),
+            self.__state_color_name(self.__focused_border_color, self.__border_color),
+            self.__state_color_name(self.__disabled_color, self.__color),
+            self.__state_color_name(self.__disabled_background_color, self.__background_color),
+            self.__state_color_name(self.__disabled_border_color, self.__border_color)))
+
+        self.__apply_style_sheet(self.__phone_code_line_edit, phone_code_style_sheet(
+            self.__color.name(),
+            self.__border_width,
+            self.__border_radius,
+            self.__padding.top(),
+            self.__padding.bottom(),
+            self.__state_color_name(self.__focused_color, self.__color),
+            self.__state_color_name(self.__disabled_color, self.__color)))
 
     def __update_combobox_style_sheet(self):
         """Updates the dropdown stylesheet according to the current values"""
 
+        if self.__update_depth > 0 or self.__resize_restyle_deferred:
+            self.__combobox_style_sheet_pending = True
+            return
+
         dropdown_item_selection_color = None
         if self.__dropdown_item_selection_color:
             dropdown_item_selection_color = self.__dropdown_item_selection_color
@@ -234,42 +222,75 @@ class PhoneInput(QWidget):
         else:
             dropdown_border_color = self.__border_color
 
-        self.__country_dropdown.setStyleSheet('QComboBox QAbstractItemView {'
-                                       'outline: none;'
-                                       'border: %dpx solid %s;'
-                                       '}'
-                                       'QListView::item {'
-                                       'height: %dpx;'
-                                       'color: %s;'
-                                       'background-color: %s;'
-                                       'border: none;'
-                                       '}'
-                                       'QListView::item:focus {'
-                                       'height: %dpx;'
-                                       'color: %s;'
-                                       'background-color: %s;'
-                                       'border: none;'
-                                       '}'
-                                       % (self.__border_width,
-                                          dropdown_border_color.name(),
-                                          self.height() if self.__dropdown_item_height_dynamic else self.__dropdown_item_height,
-                                          self.__color.name() if self.__focused_color is None else self.__focused_color.name(),
-                                          self.__background_color.name() if self.__focused_background_color is None else self.__focused_background_color.name(),
-                                          self.height() if self.__dropdown_item_height_dynamic else self.__dropdown_item_height,
-                                          dropdown_item_selection_color.name(),
-                                          self.__dropdown_item_selection_background_color.name()))
-
-    def __update_phone_code_line_edit_focused(self):
-        self.__phone_code_line_edit.setStyleSheet('color: %s;'
-                                                  'background-color: transparent;'
-                                                  'border: %dpx solid transparent;'
-                                                  'border-radius: %dpx;'
-                                                  'padding: %d 0 %d 0px;'
-                                                  % (self.__color.name() if self.__focused_color is None else self.__focused_color.name(),
-                                                     self.__border_width,
-                                                     self.__border_radius,
-                                                     self.__padding.top(),
-                                                     self.__padding.bottom()))
+        style_sheet = combobox_style_sheet(
+            self.__border_width,
+            dropdown_border_color.name(),
+            self.height() if self.__dropdown_item_height_dynamic else self.__dropdown_item_height,
+            self.__state_color_name(self.__focused_color, self.__color),
+            self.__state_color_name(self.__focused_background_color, self.__background_color),
+            dropdown_item_selection_color.name(),
+            self.__dropdown_item_selection_background_color.name())
+
+        # A stylesheet on the dropdown itself would make QComboBox create its own popup
+        if self.__country_dropdown.isSharedPopup():
+            self.__country_dropdown.setPopupStyleSheet(style_sheet)
+        else:
+            self.__apply_style_sheet(self.__country_dropdown, style_sheet)
+
+    def __apply_style_sheet(self, widget: QWidget, style_sheet: str):
+        """Sets the stylesheet of a widget if it changed (every change forces Qt to repolish the widget)
+
+        :param widget: widget
+        :param style_sheet: new stylesheet
+        """
+
+        if widget.styleSheet() == style_sheet:
+            self.__style_sheet_stats['skipped'] += 1
+            return
+
+        self.__set_style_sheet(widget, style_sheet)
+
+    def __set_style_sheet(self, widget: QWidget, style_sheet: str):
+        """Sets the stylesheet of a widget (only called for changed stylesheets)
+
+        :param widget: widget
+        :param style_sheet: new stylesheet
+        """
+
+        widget.setStyleSheet(style_sheet)
+        self.__style_sheet_stats['applied'] += 1
+
+    def __get_selection_foreground_color(self) -> QColor:
+        """Gets the text selection foreground color that is actually used
+
+        :return: text selection foreground color
+        """
+
+        if self.__selection_foreground_color:
+            return self.__selection_foreground_color
+        elif self.__focused_color:
+            return self.__focused_color
+        return self.__color
+
+    def __padding_values(self) -> tuple:
+        """Gets the LineEdit padding (including the space for the dropdown) as a tuple
+
+        :return: tuple of top, right, bottom and left padding
+        """
+
+        return (self.__padding.top(), self.__padding.right(), self.__padding.bottom(),
+                self.__padding.left() + self.__country_dropdown.width())
+
+    @staticmethod
+    def __state_color_name(state_color: QColor, color: QColor) -> str:
+        """Gets the name of a state color (focused or disabled), falling back to the regular color
+
+        :param state_color: state color (can be None)
+        :param color: regular color
+        :return: color name
+        """
+
+        return color.name() if state_color is None else state_color.name()
 
     def resizeEvent(self, event):
         """Method that gets called every time the widget is resized
@@ -277,10 +298,94 @@ class PhoneInput(QWidget):
         :param event: event sent by PyQt
         """
 
+        # Restyle immediately if the widget isn't visible yet (i.e. initial resize when shown)
+        if not self.isVisible() or self.__resize_restyle_timer.interval() == 0:
+            self.__calculate_geometry()
+            self.__update_line_edit_style_sheet()
+            self.__update_combobox_style_sheet()
+            return
+
+        # Geometry is updated immediately, stylesheets once resize events settle
+        self.__resize_restyle_deferred = True
+        self.__resize_restyle_timer.start()
+
         self.__calculate_geometry()
         self.__update_line_edit_style_sheet()
         self.__update_combobox_style_sheet()
 
+    def __handle_resize_settled(self):
+        """Applies the stylesheet updates deferred while the widget was being resized"""
+
+        self.__resize_restyle_deferred = False
+        if self.__update_depth == 0:
+            self.__apply_pending_style_sheets()
+
+    def beginUpdate(self):
+        """Defer all stylesheet updates until the matching endUpdate() call, so that
+        any number of setter calls results in at most one update per stylesheet"""
+
+        self.__update_depth += 1
+
+    def endUpdate(self):
+        """Apply the stylesheet updates deferred since the matching beginUpdate() call"""
+
+        if self.__update_depth == 0:
+            return
+
+        self.__update_depth -= 1
+        if self.__update_depth == 0 and not self.__resize_restyle_deferred:
+            self.__apply_pending_style_sheets()
+
+    def __apply_pending_style_sheets(self):
+        """Applies the stylesheet updates that were deferred"""
+
+        if self.__line_edit_style_sheet_pending:
+            self.__line_edit_style_sheet_pending = False
+            self.__update_line_edit_style_sheet()
+        if self.__combobox_style_sheet_pending:
+            self.__combobox_style_sheet_pending = False
+            self.__update_combobox_style_sheet()
+
+    @contextmanager
+    def batchUpdate(self):
+        """Context manager calling beginUpdate() on enter and endUpdate() on exit
+
+        :return: context manager yielding the widget
+        """
+
+        self.beginUpdate()
+        try:
+            yield self
+        finally:
+            self.endUpdate()
+
+    def isUpdating(self) -> bool:
+        """Get whether stylesheet updates are currently deferred
+
+        :return: whether stylesheet updates are currently deferred
+        """
+
+        return self.__update_depth > 0
+
+    def getResizeRestyleDelay(self) -> int:
+        """Get the delay after the last resize event before stylesheets are updated
+
+        :return: delay in milliseconds (0 if stylesheets are updated on every resize event)
+        """
+
+        return self.__resize_restyle_timer.interval()
+
+    def setResizeRestyleDelay(self, delay: int):
+        """Set the delay after the last resize event before stylesheets are updated
+
+        :param delay: new delay in milliseconds (0 to update stylesheets on every resize event)
+        """
+
+        self.__resize_restyle_timer.setInterval(delay)
+        if delay == 0 and self.__resize_restyle_timer.isActive():
+            self.__resize_restyle_timer.stop()
+            self.__handle_resize_settled()
+
     def getCountry(self) -> str:
         """Get the current country
 
@@ -308,10 +413,27 @@ class PhoneInput(QWidget):
     def getPhoneNumber(self) -> str:
         """Get the current phone number (no blank spaces)
 
-        :return: phone number
+        :return: phone number or None while a typed international phone code is incomplete
+        """
+
+        return get_phone_number(self.getCountry(), self.__phone_line_edit.text())
+
+    def getValidationState(self) -> QValidator.State:
+        """Get whether the current input is a complete number of the current country
+        (checked against the length and leading digit rules of the country)
+
+        :return: Acceptable if the number is complete, Intermediate if it can still become valid or Invalid
         """
 
-        return self.getCountryPhoneCode() + self.__phone_line_edit.text().replace(' ', '')
+        return self.__phone_line_edit.getValidationState()
+
+    def getInput(self) -> str:
+        """Get the LineEdit's input
+
+        :return: current input
+        """
+
+        return self.__phone_line_edit.text()
 
     def setInput(self, input_number: str):
         """Set the LineEdit's input
@@ -356,7 +478,6 @@ class PhoneInput(QWidget):
         self.__country_dropdown.setDisabled(disabled)
 
         if disabled:
-            self.__update_line_edit_style_sheet()
             self.__phone_line_edit.setCurrentBorderColor(
                 self.__border_color if self.__disabled_border_color is None else self.__disabled_border_color)
         else:
@@ -714,6 +835,7 @@ class PhoneInput(QWidget):
 
         self.__phone_line_edit.setFont(font)
         self.__phone_code_line_edit.setFont(font)
+        self.__country_dropdown.updatePhoneCodeFont()
 
     def getDropdownFont(self) -> QFont:
         """Get the current font used for dropdown items
@@ -730,3 +852,20 @@ class PhoneInput(QWidget):
         """
 
         self.__country_dropdown.setFont(font)
+        self.__country_dropdown.updatePopupWidth()
+
+    def getStyleSheetStats(self) -> dict:
+        """Get how many stylesheet updates were applied, how many were skipped because
+        the stylesheet didn't change and how many state changes only required a repolish
+
+        :return: dict containing the number of applied, skipped and repolished updates
+        """
+
+        return dict(self.__style_sheet_stats)
+
+
+# Hot paths measured while instrumentation is enabled
+register_instrumented(PhoneInput, {
+    '_PhoneInput__set_style_sheet': 'style_sheet',
+    '_PhoneInput__calculate_geometry': 'geometry'
+}, ('country_changed', 'number_changed'))
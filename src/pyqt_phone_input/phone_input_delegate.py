@@ -0,0 +1,186 @@
+from qtpy.QtCore import Qt, QModelIndex, QRect, QSize
+from qtpy.QtGui import QPalette
+from qtpy.QtWidgets import QStyledItemDelegate, QStyle, QStyleOptionViewItem, QApplication
+from .core import get_phone_code, split_phone_number
+from .flag_cache import get_scaled_flag_pixmap
+from .phone_input import PhoneInput
+
+
+class PhoneInputDelegate(QStyledItemDelegate):
+
+    def __init__(self, parent=None, country_role: int = None):
+        """Create a new PhoneInputDelegate instance. Cells are painted directly from the model data
+        (flag, phone code and local number) and a PhoneInput is only created while a cell is edited,
+        so views with any number of rows don't need a widget per row.
+
+        :param parent: the parent object
+        :param country_role: item data role storing the country of a cell (optional, resolves shared
+            phone codes like '+1' to the stored country instead of the default country)
+        """
+
+        super(PhoneInputDelegate, self).__init__(parent)
+
+        self.__country_role = country_role
+
+        # Spacing between flag, phone code and local number
+        self.__spacing = 4
+
+    def paint(self, painter, option: QStyleOptionViewItem, index: QModelIndex):
+        """Paint a cell (background, flag, phone code and local number)
+
+        :param painter: painter of the view
+        :param option: style options of the cell
+        :param index: model index of the cell
+        """
+
+        option = QStyleOptionViewItem(option)
+        self.initStyleOption(option, index)
+        widget = option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+
+        # Draw background, selection and focus without the text
+        text = option.text
+        option.text = ''
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, option, painter, widget)
+
+        rect = option.rect.adjusted(self.__spacing, 0, -self.__spacing, 0)
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.setPen(option.palette.color(QPalette.ColorRole.HighlightedText))
+        else:
+            painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+        painter.setFont(option.font)
+
+        parts = self.__split(text, index)
+        if parts is None:
+            painter.drawText(rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
+                             option.fontMetrics.elidedText(text, Qt.TextElideMode.ElideRight, rect.width()))
+            return
+
+        country, local_number = parts
+        icon_size = min(option.decorationSize.height(), rect.height())
+
+        # Draw country flag icon (pre-scaled and shared with the dropdowns)
+        if icon_size > 0:
+            device_pixel_ratio = painter.device().devicePixelRatioF()
+            painter.drawPixmap(rect.left(), rect.top() + (rect.height() - icon_size) // 2,
+                               get_scaled_flag_pixmap(country, icon_size, device_pixel_ratio))
+            rect.setLeft(rect.left() + icon_size + self.__spacing)
+
+        # Draw phone code and local number
+        phone_code = get_phone_code(country)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, phone_code)
+        rect.setLeft(rect.left() + option.fontMetrics.horizontalAdvance(phone_code) + self.__spacing)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
+                         option.fontMetrics.elidedText(local_number, Qt.TextElideMode.ElideRight, rect.width()))
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        """Get the size needed to show a cell
+
+        :param option: style options of the cell
+        :param index: model index of the cell
+        :return: size hint
+        """
+
+        option = QStyleOptionViewItem(option)
+        self.initStyleOption(option, index)
+        icon_size = option.decorationSize.height()
+        text_width = option.fontMetrics.horizontalAdvance(option.text)
+        width = icon_size + text_width + 4 * self.__spacing
+        return QSize(width, max(icon_size, option.fontMetrics.height()) + 2)
+
+    def createEditor(self, parent, option: QStyleOptionViewItem, index: QModelIndex) -> PhoneInput:
+        """Create the PhoneInput used to edit a cell (deleted by the view once editing is finished)
+
+        :param parent: parent widget (viewport of the view)
+        :param option: style options of the cell
+        :param index: model index of the cell
+        :return: new PhoneInput
+        """
+
+        return PhoneInput(parent, lazy=True)
+
+    def setEditorData(self, editor: PhoneInput, index: QModelIndex):
+        """Set the country and input of the editor from the model data
+
+        :param editor: PhoneInput created by createEditor
+        :param index: model index of the cell
+        """
+
+        # Models can store numbers as any type (i.e. int)
+        text = index.data(Qt.ItemDataRole.EditRole)
+        text = '' if text is None else str(text)
+        parts = self.__split(text, index)
+        if parts is not None:
+            editor.setCountry(parts[0])
+            editor.setInput(parts[1])
+            return
+
+        country = self.__get_country(index)
+        if country is not None:
+            editor.setCountry(country)
+        editor.setInput(text)
+
+    def setModelData(self, editor: PhoneInput, model, index: QModelIndex):
+        """Store the phone number of the editor in the model (empty if nothing was entered,
+        unchanged if an international number's phone code is still incomplete)
+
+        :param editor: PhoneInput created by createEditor
+        :param model: model of the view
+        :param index: model index of the cell
+        """
+
+        phone_number = editor.getPhoneNumber() if editor.getInput().strip() else ''
+        if phone_number is None:
+            return
+        model.setData(index, phone_number, Qt.ItemDataRole.EditRole)
+        if self.__country_role is not None:
+            model.setData(index, editor.getCountry(), self.__country_role)
+
+    def updateEditorGeometry(self, editor: PhoneInput, option: QStyleOptionViewItem, index: QModelIndex):
+        """Place the editor over the cell
+
+        :param editor: PhoneInput created by createEditor
+        :param option: style options of the cell
+        :param index: model index of the cell
+        """
+
+        editor.setGeometry(QRect(option.rect))
+
+    def getCountryRole(self) -> int:
+        """Get the item data role storing the country of a cell
+
+        :return: item data role or None
+        """
+
+        return self.__country_role
+
+    def setCountryRole(self, role: int):
+        """Set the item data role storing the country of a cell
+
+        :param role: item data role or None
+        """
+
+        self.__country_role = role
+
+    def __get_country(self, index: QModelIndex) -> str:
+        """Get the country stored in the country role of a cell
+
+        :param index: model index of the cell
+        :return: country code or None
+        """
+
+        if self.__country_role is None:
+            return None
+        return index.data(self.__country_role)
+
+    def __split(self, text: str, index: QModelIndex):
+        """Split the phone number of a cell into its country and local number
+
+        :param text: phone number of the cell (i.e. '+4915112345678')
+        :param index: model index of the cell
+        :return: tuple of country code and local number or None
+        """
+
+        if not text:
+            return None
+        return split_phone_number(text, self.__get_country(index))
@@ -1,7 +1,10 @@
-from qtpy.QtCore import Signal, QRegularExpression
-from qtpy.QtGui import QPainter, QColor, QRegularExpressionValidator
+from qtpy.QtCore import Signal
+from qtpy.QtGui import QPainter, QColor, QValidator
 from qtpy.QtWidgets import QLineEdit
 from .country_dropdown import CountryDropdown
+from .core import DialCodeTrie
+from .instrumentation import register_instrumented, track_widget
+from .phone_number_validator import PhoneNumberValidator
 
 
 class PhoneLineEdit(QLineEdit):
@@ -17,14 +20,19 @@ class PhoneLineEdit(QLineEdit):
         """
 
         super(PhoneLineEdit, self).__init__(parent)
+        track_widget(self)
 
         # Connected country dropdown
         self.__country_dropdown = None
         self.__border_color_current = None
         self.__border_width = 0
 
-        # Set validator to only allow numbers and spaces as input
-        self.setValidator(QRegularExpressionValidator(QRegularExpression('[0-9 ]*')))
+        # Set validator to only allow numbers matching the length and leading digit rules
+        # of the current country (and international numbers starting with '+', whose
+        # phone code is used to select the country)
+        self.__validator = PhoneNumberValidator(parent=self)
+        self.setValidator(self.__validator)
+        self.textChanged.connect(self.__handle_text_changed)
 
     def paintEvent(self, event):
         """Method that gets called every time the widget needs to be updated.
@@ -76,7 +84,16 @@ class PhoneLineEdit(QLineEdit):
         :param country_dropdown: new country dropdown
         """
 
+        if self.__country_dropdown is not None:
+            self.__country_dropdown.country_changed.disconnect(self.__handle_country_changed)
+
         self.__country_dropdown = country_dropdown
+        if country_dropdown is not None:
+            country_dropdown.country_changed.connect(self.__handle_country_changed)
+            self.__handle_country_changed()
+        else:
+            self.__validator.setCountry(None)
+            self.__validator.revalidate(self)
 
     def getCurrentBorderColor(self) -> QColor:
         """Get the current border color
@@ -111,3 +128,64 @@ class PhoneLineEdit(QLineEdit):
 
         self.__border_width = width
         self.update()
+
+    def getPhoneNumberValidator(self) -> PhoneNumberValidator:
+        """Get the validator checking the input against the rules of the current country
+
+        :return: phone number validator
+        """
+
+        return self.__validator
+
+    def getValidationState(self) -> QValidator.State:
+        """Get whether the current input is a complete number of the current country
+
+        :return: Acceptable if the number is complete, Intermediate if it can still become valid or Invalid
+        """
+
+        return self.__validator.getState(self.text())
+
+    def getDialCodeTrie(self) -> DialCodeTrie:
+        """Get the trie used to detect the country of international numbers
+
+        :return: dial code trie
+        """
+
+        return self.__validator.getDialCodeTrie()
+
+    def setDialCodeTrie(self, dial_code_trie: DialCodeTrie):
+        """Set the trie used to detect the country of international numbers
+
+        :param dial_code_trie: new dial code trie (None to disable detection, any digits
+            can then follow the '+')
+        """
+
+        self.__validator.setDialCodeTrie(dial_code_trie)
+
+    def __handle_country_changed(self):
+        """Switches the validation rules to the country of the dropdown"""
+
+        if self.__country_dropdown.getCountry() is not None:
+            self.__validator.setCountry(self.__country_dropdown.getCountry())
+            self.__validator.revalidate(self)
+
+    def __handle_text_changed(self, text: str):
+        """Selects the country of international numbers and removes their phone code
+
+        :param text: new text
+        """
+
+        if not self.__country_dropdown:
+            return
+
+        result = self.__validator.splitPhoneNumber(text, self.__country_dropdown.getCountry())
+        if result:
+            country, number = result
+            self.__country_dropdown.setCountry(country)
+            self.setText(number)
+
+
+# Hot paths measured while instrumentation is enabled
+register_instrumented(PhoneLineEdit, {
+    'paintEvent': 'paint'
+}, ('focus_in', 'focus_out'))
@@ -0,0 +1,174 @@
+from .countries import countries
+from .dial_code_trie import DialCodeTrie
+
+
+# Maximum number of digits of a phone number (E.164, without the '+')
+MAX_PHONE_NUMBER_LENGTH = 15
+
+# Validation states (same values as QValidator.State)
+INVALID = 0
+INTERMEDIATE = 1
+ACCEPTABLE = 2
+
+# Minimum number of digits of national numbers of countries without specific rules
+DEFAULT_MIN_LENGTH = 4
+
+# Rule used if no country is given (any digits up to the maximum E.164 length)
+_default_rule = (DEFAULT_MIN_LENGTH, MAX_PHONE_NUMBER_LENGTH, frozenset('0123456789'))
+
+# Rules of the national significant numbers (without trunk prefix like the leading '0' of
+# national dialing) as tuple of minimum length, maximum length and allowed leading digits.
+# Phone code rules apply to every country using the phone code (unless it has its own rule).
+phone_code_number_rules = {
+    '+1': (10, 10, '23456789'),
+    '+7': (10, 10, '346789'),
+    '+39': (6, 11, '013589')
+}
+country_number_rules = {
+    'at': (4, 13, '123456789'),
+    'au': (9, 9, '23478'),
+    'be': (8, 9, '123456789'),
+    'br': (10, 11, '123456789'),
+    'ch': (9, 9, '2345789'),
+    'cn': (7, 12, '123456789'),
+    'de': (6, 13, '123456789'),
+    'dk': (8, 8, '23456789'),
+    'es': (9, 9, '56789'),
+    'fr': (9, 9, '123456789'),
+    'gb': (9, 10, '1235789'),
+    'hk': (8, 8, '2345679'),
+    'ie': (7, 9, '12456789'),
+    'in': (10, 10, '123456789'),
+    'jp': (9, 10, '123456789'),
+    'kr': (8, 10, '123456789'),
+    'mx': (10, 10, '123456789'),
+    'nl': (9, 9, '123456789'),
+    'no': (8, 8, '23456789'),
+    'nz': (8, 10, '234679'),
+    'pl': (9, 9, '123456789'),
+    'pt': (9, 9, '2789'),
+    'se': (7, 9, '123456789'),
+    'sg': (8, 8, '3689'),
+    'tr': (10, 10, '2345689'),
+    'ua': (9, 9, '3456789'),
+    'za': (9, 9, '123456789')
+}
+
+
+class PhoneNumberRules:
+
+    def __init__(self, rules: dict = None):
+        """Create a new PhoneNumberRules instance. The rules of all countries are compiled once
+        into a table keyed by country code, so validating a number only needs a single lookup.
+        Countries without specific rules accept any digits up to the maximum E.164 length.
+
+        :param rules: dict mapping country codes to tuples of minimum length, maximum length and
+            allowed leading digits (the rules above by default)
+        """
+
+        self.__rules = {}
+        for country, (name, phone_code) in countries.items():
+            rule = phone_code_number_rules.get(phone_code)
+            if rule is None:
+                rule = (DEFAULT_MIN_LENGTH, MAX_PHONE_NUMBER_LENGTH - len(phone_code) + 1, '0123456789')
+            self.__rules[country] = self.__compile(*rule)
+
+        for country, rule in (country_number_rules if rules is None else rules).items():
+            self.setRule(country, *rule)
+
+    def validate(self, country: str, number: str, dial_code_trie: DialCodeTrie = None) -> int:
+        """Validate a local number (as it is typed) against the rules of a country
+
+        :param country: country code (i.e. 'us', None to only check for digits and the maximum length)
+        :param number: local number (i.e. '212 555 0123', spaces are ignored)
+        :param dial_code_trie: trie of the known phone codes international numbers have to start with
+            (or with a prefix of one, None to accept any digits after the '+')
+        :return: ACCEPTABLE if the number is complete, INTERMEDIATE if it can still become valid
+            (including international numbers starting with '+') or INVALID
+        """
+
+        if country is None:
+            rule = _default_rule
+        else:
+            rule = self.__rules.get(country)
+            if rule is None:
+                return INVALID
+
+        digits = number.replace(' ', '')
+        if not digits:
+            return INTERMEDIATE
+
+        # International numbers select their country once the phone code is complete
+        if digits[0] == '+':
+            digits = digits[1:]
+            if digits and not (digits.isascii() and digits.isdigit()):
+                return INVALID
+            if len(digits) > MAX_PHONE_NUMBER_LENGTH:
+                return INVALID
+            if dial_code_trie is not None and not (dial_code_trie.isPrefix('+' + digits) or
+                                                   dial_code_trie.match('+' + digits)):
+                return INVALID
+            return INTERMEDIATE
+
+        min_length, max_length, leading_digits = rule
+        if not (digits.isascii() and digits.isdigit()) or digits[0] not in leading_digits or len(digits) > max_length:
+            return INVALID
+        return ACCEPTABLE if len(digits) >= min_length else INTERMEDIATE
+
+    def getRule(self, country: str):
+        """Get the rule of a country
+
+        :param country: country code (i.e. 'us')
+        :return: tuple of minimum length, maximum length and allowed leading digits or None
+        """
+
+        rule = self.__rules.get(country.lower())
+        if rule is None:
+            return None
+        min_length, max_length, leading_digits = rule
+        return min_length, max_length, ''.join(sorted(leading_digits))
+
+    def setRule(self, country: str, min_length: int, max_length: int, leading_digits: str = '0123456789'):
+        """Set the rule of a country
+
+        :param country: country code (i.e. 'us')
+        :param min_length: minimum number of digits of the national number
+        :param max_length: maximum number of digits of the national number
+        :param leading_digits: digits the national number can start with
+        """
+
+        country = country.lower()
+        if country not in countries:
+            raise KeyError('Unknown country {!r}'.format(country))
+        self.__rules[country] = self.__compile(min_length, max_length, leading_digits)
+
+    @staticmethod
+    def __compile(min_length: int, max_length: int, leading_digits: str) -> tuple:
+        """Compiles a rule into the form used for validation
+
+        :param min_length: minimum number of digits
+        :param max_length: maximum number of digits
+        :param leading_digits: digits the number can start with
+        :return: tuple of minimum length, maximum length and set of leading digits
+        """
+
+        if not 0 < min_length <= max_length:
+            raise ValueError('Invalid length range {}-{}'.format(min_length, max_length))
+        return min_length, max_length, frozenset(leading_digits)
+
+
+# Rules instance shared by all validators
+_shared_rules = None
+
+
+def get_shared_phone_number_rules() -> PhoneNumberRules:
+    """Get the PhoneNumberRules instance shared by all validators (created on first use)
+
+    :return: shared PhoneNumberRules
+    """
+
+    global _shared_rules
+
+    if _shared_rules is None:
+        _shared_rules = PhoneNumberRules()
+    return _shared_rules
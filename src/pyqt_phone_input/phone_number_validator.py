@@ -0,0 +1,133 @@
+from qtpy.QtGui import QValidator
+from qtpy.QtWidgets import QLineEdit
+from .core import split_phone_number
+from .dial_code_trie import DialCodeTrie, get_shared_dial_code_trie
+from .phone_number_rules import PhoneNumberRules, get_shared_phone_number_rules
+
+
+# Validator states in the order of the states of PhoneNumberRules (INVALID, INTERMEDIATE, ACCEPTABLE)
+_states = (QValidator.State.Invalid, QValidator.State.Intermediate, QValidator.State.Acceptable)
+
+
+class PhoneNumberValidator(QValidator):
+
+    def __init__(self, country: str = None, rules: PhoneNumberRules = None, parent=None):
+        """Create a new PhoneNumberValidator instance validating local numbers against
+        the length and leading digit rules of the current country
+
+        :param country: country code (i.e. 'us'), only digits are checked until a country is set
+        :param rules: rules used for validation (shared rules by default)
+        :param parent: the parent object
+        """
+
+        super(PhoneNumberValidator, self).__init__(parent)
+
+        self.__country = None if country is None else country.lower()
+        self.__rules = get_shared_phone_number_rules() if rules is None else rules
+        self.__dial_code_trie = get_shared_dial_code_trie()
+
+    def validate(self, text: str, pos: int) -> tuple:
+        """Validate the input of a LineEdit (called by Qt for every change)
+
+        :param text: input
+        :param pos: cursor position
+        :return: tuple of state, input and cursor position
+        """
+
+        return self.getState(text), text, pos
+
+    def getState(self, text: str) -> QValidator.State:
+        """Get the state of a number for the current country
+
+        :param text: local number (i.e. '212 555 0123')
+        :return: Acceptable if the number is complete, Intermediate if it can still become valid or Invalid
+        """
+
+        return _states[self.__rules.validate(self.__country, text, self.__dial_code_trie)]
+
+    def revalidate(self, line_edit: QLineEdit):
+        """Validate the text of a LineEdit using this validator again. QLineEdit only rejects edits
+        that turn valid text invalid, so text that became invalid (i.e. after a country change)
+        can be edited until it is valid again.
+
+        :param line_edit: LineEdit using this validator
+        """
+
+        text = line_edit.text()
+        if self.getState(text) != QValidator.State.Invalid:
+            return
+
+        cursor_position = line_edit.cursorPosition()
+        line_edit.blockSignals(True)
+        line_edit.setText('')
+        line_edit.setText(text)
+        line_edit.setCursorPosition(cursor_position)
+        line_edit.blockSignals(False)
+
+    def splitPhoneNumber(self, text: str, current_country: str = None):
+        """Split a typed or pasted international number into its country and local number
+        using the dial code trie
+
+        :param text: input (i.e. '+44 20 7946 0958')
+        :param current_country: country that is kept if it uses the number's phone code
+        :return: tuple of country code and local number or None if the input is no international
+            number with a known phone code (always None without a dial code trie)
+        """
+
+        if not text.startswith('+') or not self.__dial_code_trie:
+            return None
+        return split_phone_number(text, current_country, self.__dial_code_trie)
+
+    def getCountry(self) -> str:
+        """Get the country whose rules are used
+
+        :return: country code (i.e. 'us')
+        """
+
+        return self.__country
+
+    def setCountry(self, country: str):
+        """Set the country whose rules are used
+
+        :param country: new country code (None to only check for digits and the maximum length)
+        """
+
+        if country is not None:
+            country = country.lower()
+        if country != self.__country:
+            self.__country = country
+            self.changed.emit()
+
+    def getRules(self) -> PhoneNumberRules:
+        """Get the rules used for validation
+
+        :return: phone number rules
+        """
+
+        return self.__rules
+
+    def setRules(self, rules: PhoneNumberRules):
+        """Set the rules used for validation
+
+        :param rules: new phone number rules
+        """
+
+        self.__rules = rules
+        self.changed.emit()
+
+    def getDialCodeTrie(self) -> DialCodeTrie:
+        """Get the trie of the phone codes international numbers have to start with
+
+        :return: dial code trie
+        """
+
+        return self.__dial_code_trie
+
+    def setDialCodeTrie(self, dial_code_trie: DialCodeTrie):
+        """Set the trie of the phone codes international numbers have to start with
+
+        :param dial_code_trie: new dial code trie (None to accept any digits after the '+')
+        """
+
+        self.__dial_code_trie = dial_code_trie
+        self.changed.emit()
@@ -0,0 +1,107 @@
+from functools import lru_cache
+
+
+# Style sheets are generated from plain values (color names and integers), so every
+# generated string is cached by its input values and shared between all widgets
+CACHE_SIZE = 256
+
+# Dynamic property used to select the focused style (set while the LineEdit has focus
+# or the dropdown is open), so state changes don't require a new stylesheet
+STATE_PROPERTY = 'phoneState'
+STATE_NORMAL = 'normal'
+STATE_FOCUSED = 'focused'
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def line_edit_style_sheet(color: str, background_color: str, border_width: int, border_color: str,
+                          border_radius: int, padding: tuple, selection_color: str,
+                          selection_background_color: str, focused_color: str,
+                          focused_background_color: str, focused_border_color: str, disabled_color: str,
+                          disabled_background_color: str, disabled_border_color: str) -> str:
+    """Get the style sheet of the phone number LineEdit
+
+    :param padding: tuple of top, right, bottom and left padding
+    :return: style sheet
+    """
+
+    return ('QLineEdit {'
+            'color: %s;'
+            'background-color: %s;'
+            'border: %dpx solid %s;'
+            'border-radius: %dpx;'
+            'padding: %d %d %d %dpx;'
+            'selection-color: %s;'
+            'selection-background-color: %s;'
+            '}'
+            'QLineEdit:focus, QLineEdit[%s="%s"] {'
+            'color: %s;'
+            'background-color: %s;'
+            'border: %dpx solid %s;'
+            '}'
+            'QLineEdit:disabled {'
+            'color: %s;'
+            'background-color: %s;'
+            'border: %dpx solid %s;'
+            '}'
+            % (color, background_color, border_width, border_color, border_radius, *padding,
+               selection_color, selection_background_color, STATE_PROPERTY, STATE_FOCUSED,
+               focused_color, focused_background_color, border_width, focused_border_color,
+               disabled_color, disabled_background_color, border_width, disabled_border_color))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def phone_code_style_sheet(color: str, border_width: int, border_radius: int, padding_top: int,
+                           padding_bottom: int, focused_color: str, disabled_color: str) -> str:
+    """Get the style sheet of the phone code LineEdit
+
+    :return: style sheet
+    """
+
+    return ('QLineEdit {'
+            'color: %s;'
+            'background-color: transparent;'
+            'border: %dpx solid transparent;'
+            'border-radius: %dpx;'
+            'padding: %d 0 %d 0px;'
+            '}'
+            'QLineEdit[%s="%s"] {'
+            'color: %s;'
+            '}'
+            'QLineEdit:disabled {'
+            'color: %s;'
+            '}'
+            % (color, border_width, border_radius, padding_top, padding_bottom,
+               STATE_PROPERTY, STATE_FOCUSED, focused_color, disabled_color))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def combobox_style_sheet(border_width: int, border_color: str, item_height: int, item_color: str,
+                         item_background_color: str, item_selection_color: str,
+                         item_selection_background_color: str) -> str:
+    """Get the style sheet of the country dropdown (uses a list popup instead of the
+    style's menu popup, which measures the text and icon of every row when opened)
+
+    :return: style sheet
+    """
+
+    return ('QComboBox {'
+            'combobox-popup: 0;'
+            '}'
+            'QComboBox QAbstractItemView, CountryPopup QAbstractItemView {'
+            'outline: none;'
+            'border: %dpx solid %s;'
+            '}'
+            'QListView::item {'
+            'height: %dpx;'
+            'color: %s;'
+            'background-color: %s;'
+            'border: none;'
+            '}'
+            'QListView::item:focus {'
+            'height: %dpx;'
+            'color: %s;'
+            'background-color: %s;'
+            'border: none;'
+            '}'
+            % (border_width, border_color, item_height, item_color, item_background_color,
+               item_height, item_selection_color, item_selection_background_color))
@@ -0,0 +1,162 @@
+from PyQt6.QtCore import QObject, Qt, QPoint
+from PyQt6.QtGui import QFont, QValidator
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtTest import QTest
+from src.pyqt_phone_input import country_dropdown as country_dropdown_module
+from src.pyqt_phone_input.compact_phone_input import CompactPhoneInput
+from src.pyqt_phone_input.country_dropdown import CountryDropdown, clear_popup_width_cache
+from src.pyqt_phone_input.country_popup import get_shared_country_popup
+from src.pyqt_phone_input.phone_input import PhoneInput
+
+
+def test_initial_values(qtbot):
+    """Test initial values after instantiating"""
+
+    phone_input = CompactPhoneInput()
+    qtbot.addWidget(phone_input)
+
+    assert phone_input.getCountry() == 'af'
+    assert phone_input.getCountryPhoneCode() == '+93'
+    assert phone_input.getInput() == ''
+    assert not phone_input.isDropdownOpen()
+    assert not phone_input.isDisabled()
+    assert not phone_input.findChildren(QWidget)
+    assert phone_input.styleSheet() == ''
+
+
+def test_set_country_and_input(qtbot):
+    """Test setting the country and input text"""
+
+    phone_input = CompactPhoneInput()
+    qtbot.addWidget(phone_input)
+
+    with qtbot.waitSignal(phone_input.country_changed):
+        phone_input.setCountry('US')
+    with qtbot.waitSignal(phone_input.number_changed):
+        phone_input.setInput('123456789')
+
+    assert phone_input.getCountry() == 'us'
+    assert phone_input.getCountryPhoneCode() == '+1'
+    assert phone_input.getPhoneNumber() == '+1123456789'
+
+    # Unknown countries are ignored
+    phone_input.setCountry('xx')
+    assert phone_input.getCountry() == 'us'
+
+
+def test_international_number(qtbot):
+    """Test that entering an international number selects its country"""
+
+    phone_input = CompactPhoneInput()
+    qtbot.addWidget(phone_input)
+
+    phone_input.setInput('+44 20 7946 0958')
+    assert phone_input.getCountry() == 'gb'
+    assert phone_input.getInput() == '20 7946 0958'
+
+    phone_input.setDialCodeTrie(None)
+    assert phone_input.getDialCodeTrie() is None
+    phone_input.setInput('+49')
+    assert phone_input.getCountry() == 'gb'
+
+
+def test_validation_state(qtbot):
+    """Test that the input is validated against the rules of the current country"""
+
+    phone_input = CompactPhoneInput()
+    qtbot.addWidget(phone_input)
+    phone_input.setCountry('us')
+
+    qtbot.keyClicks(phone_input, '1212555012345')
+    assert phone_input.getInput() == '2125550123'
+    assert phone_input.getValidationState() == QValidator.State.Acceptable
+
+    phone_input.setCountry('fr')
+    assert phone_input.getValidationState() == QValidator.State.Invalid
+
+    # Input that became invalid can still be edited
+    phone_input.setCountry('gb')
+    phone_input.selectAll()
+    qtbot.keyClicks(phone_input, '2079460958')
+    phone_input.setCountry('es')
+    qtbot.keyClick(phone_input, Qt.Key.Key_Backspace)
+    assert phone_input.getInput() == '207946095'
+    assert phone_input.getValidationState() == QValidator.State.Invalid
+
+
+def test_text_margin(qtbot):
+    """Test that the text starts after the painted flag and phone code"""
+
+    phone_input = CompactPhoneInput()
+    qtbot.addWidget(phone_input)
+    phone_input.resize(200, 30)
+
+    margin = phone_input.textMargins().left()
+    assert margin > phone_input.fontMetrics().horizontalAdvance('+93')
+
+    phone_input.setCountry('ae')
+    assert phone_input.textMargins().left() > margin
+
+    phone_input.setFont(QFont('Arial', 30))
+    assert phone_input.textMargins().left() > margin
+
+
+def test_popup(qtbot):
+    """Test opening the shared popup by clicking the flag and selecting a country"""
+
+    phone_input = CompactPhoneInput()
+    qtbot.addWidget(phone_input)
+    phone_input.resize(200, 30)
+    with qtbot.waitExposed(phone_input):
+        phone_input.show()
+    popup = get_shared_country_popup()
+
+    QTest.mouseClick(phone_input, Qt.MouseButton.LeftButton, pos=QPoint(5, 15))
+    assert phone_input.isDropdownOpen()
+    assert popup.getDropdown() is phone_input
+    assert popup.getListView().currentIndex().row() == phone_input.currentIndex()
+    assert popup.getListView().width() == phone_input.getPopupWidth()
+
+    QTest.keyClicks(popup.getSearchLineEdit(), 'germ')
+    QTest.keyClick(popup.getSearchLineEdit(), Qt.Key.Key_Return)
+    assert phone_input.getCountry() == 'de'
+    assert not phone_input.isDropdownOpen()
+
+    # Clicking the text doesn't open the popup
+    QTest.mouseClick(phone_input, Qt.MouseButton.LeftButton, pos=QPoint(190, 15))
+    assert not phone_input.isDropdownOpen()
+
+    QTest.keyClick(phone_input, Qt.Key.Key_F4)
+    assert phone_input.isDropdownOpen()
+    phone_input.hidePopup()
+    assert not popup.isVisible()
+
+
+def test_popup_width(qtbot):
+    """Test that the popup width is measured and cached like the popup of CountryDropdown"""
+
+    clear_popup_width_cache()
+    country_dropdown = CountryDropdown()
+    qtbot.addWidget(country_dropdown)
+    country_dropdown.updatePopupWidth()
+    assert len(country_dropdown_module._popup_widths) == 1
+
+    phone_input = CompactPhoneInput()
+    qtbot.addWidget(phone_input)
+    assert phone_input.getPopupWidth() == country_dropdown.getPopupWidth()
+    assert len(country_dropdown_module._popup_widths) == 1
+
+    phone_input.setFont(QFont('Arial', 30))
+    assert phone_input.getPopupWidth() > country_dropdown.getPopupWidth()
+    assert len(country_dropdown_module._popup_widths) == 2
+
+
+def test_footprint(qtbot):
+    """Test that a CompactPhoneInput needs fewer objects than a PhoneInput"""
+
+    window = QWidget()
+    qtbot.addWidget(window)
+    phone_input = PhoneInput(window, shared_popup=True)
+    compact_phone_input = CompactPhoneInput(window)
+
+    assert len(compact_phone_input.findChildren(QObject)) < len(phone_input.findChildren(QObject)) / 2
@@ -0,0 +1,80 @@
+import subprocess
+import sys
+import pytest
+from src.pyqt_phone_input import core
+
+
+def test_country_lookups():
+    """Test looking up country names and phone codes"""
+
+    assert core.is_country('US')
+    assert not core.is_country('xx')
+    assert core.get_country_name('gb') == 'United Kingdom'
+    assert core.get_country_name('xx') is None
+    assert core.get_phone_code('GB') == '+44'
+    assert core.get_phone_code('xx') is None
+    assert core.get_countries_by_phone_code('+7') == ['kz', 'ru']
+    assert core.get_countries_by_phone_code('+999') == []
+    assert core.search_countries('united st') == ['us']
+    assert core.search_countries('xyz') == []
+
+
+def test_get_phone_number():
+    """Test building phone numbers"""
+
+    assert core.get_phone_number('us', '123 456 789') == '+1123456789'
+    assert core.get_phone_number('xx', '123') is None
+    assert core.get_phone_number('af', '+9') is None
+
+
+def test_split_phone_number():
+    """Test splitting international numbers"""
+
+    assert core.split_phone_number('+44 20 7946 0958') == ('gb', '20 7946 0958')
+    assert core.split_phone_number('+1 555', 'ca') == ('ca', '555')
+    assert core.split_phone_number('+1 555') == ('us', '555')
+    assert core.split_phone_number('555') is None
+
+
+def test_validate_phone_number():
+    """Test validating local numbers against the rules of a country"""
+
+    assert core.validate_phone_number('US', '212 555 0123') == core.ACCEPTABLE
+    assert core.validate_phone_number('us', '212') == core.INTERMEDIATE
+    assert core.validate_phone_number('gb', '020 7946 0958') == core.INVALID
+    assert core.validate_phone_number('gb', '+0') == core.INVALID
+
+
+def test_no_qt_import():
+    """Test that importing the core module doesn't import Qt"""
+
+    code = ('import sys; import src.pyqt_phone_input.core; '
+            'sys.exit(any(module.split(".")[0] in ("qtpy", "PyQt5", "PyQt6", "PySide2", "PySide6") '
+            'for module in sys.modules))')
+    assert subprocess.run([sys.executable, '-c', code]).returncode == 0
+
+
+def test_no_numpy_import():
+    """Test that NumPy is only imported once normalize_many is used"""
+
+    code = ('import sys; import src.pyqt_phone_input.core as core; '
+            'assert "numpy" not in sys.modules; core.normalize_many(["us"], ["212 555 0123"])')
+    assert subprocess.run([sys.executable, '-c', code]).returncode == 0
+
+
+def test_normalize_many(monkeypatch):
+    """Test normalizing many numbers at once (with and without NumPy)"""
+
+    country_list = ['us', 'GB', 'xx', 'de', 'us', 'us']
+    number_list = ['123 456 789', '20 7946 0958', '123', '12a', '', '1234567890123456']
+    expected_numbers = ['+1123456789', '+442079460958', '', '', '', '']
+    expected_valid = [True, True, False, False, False, False]
+
+    for numpy in {core._get_numpy(), None}:
+        monkeypatch.setattr(core, '_get_numpy', lambda: numpy)
+        phone_numbers, valid = core.normalize_many(country_list, number_list)
+        assert list(phone_numbers) == expected_numbers
+        assert list(valid) == expected_valid
+
+    with pytest.raises(ValueError):
+        core.normalize_many(['us'], [])
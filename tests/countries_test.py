@@ -0,0 +1,19 @@
+from src.pyqt_phone_input.countries import countries, country_codes, country_rows, phone_code_rows
+
+
+def test_country_indexes():
+    """Test the country code and row indexes"""
+
+    assert len(country_codes) == len(countries)
+
+    for row, country in enumerate(countries):
+        assert country_codes[row] == country
+        assert country_rows[country] == row
+
+
+def test_phone_code_rows():
+    """Test the phone code to rows index"""
+
+    assert [country_codes[row] for row in phone_code_rows['+44']] == ['gb']
+    assert {country_codes[row] for row in phone_code_rows['+7']} == {'kz', 'ru'}
+    assert sum(len(rows) for rows in phone_code_rows.values()) == len(countries)
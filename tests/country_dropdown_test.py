@@ -3,7 +3,12 @@ from PyQt6.QtGui import QFont, QPaintEvent
 from PyQt6.QtWidgets import QLineEdit
 from PyQt6.QtTest import QTest
 from pytestqt.qt_compat import qt_api
+from src.pyqt_phone_input.countries import countries
+from src.pyqt_phone_input.core import search_countries
 from src.pyqt_phone_input.country_dropdown import CountryDropdown
+from src.pyqt_phone_input.country_list_model import CountryListModel
+from src.pyqt_phone_input.country_list_view import CountryListView
+from src.pyqt_phone_input.flag_cache import clear_flag_cache, get_flag_cache_stats
 
 
 def test_initial_values(qtbot):
@@ -50,3 +55,159 @@ def test_set_border_width(qtbot):
 
     country_dropdown.setBorderWidth(5)
     assert country_dropdown.getBorderWidth() == 5
+
+
+def test_lazy_population(qtbot):
+    """Test that a lazy dropdown only contains all countries once opened"""
+
+    country_dropdown = CountryDropdown(lazy=True)
+    qtbot.addWidget(country_dropdown)
+
+    assert not country_dropdown.isPopulated()
+    assert country_dropdown.count() == 1
+    assert country_dropdown.getCountry() == 'af'
+    assert country_dropdown.getCountryPhoneCode() == '+93'
+
+    with qtbot.waitSignal(country_dropdown.country_changed):
+        country_dropdown.setCountry('gb')
+
+    assert country_dropdown.count() == 1
+    assert country_dropdown.getCountry() == 'gb'
+    assert country_dropdown.getCountryPhoneCode() == '+44'
+
+    country_dropdown.showPopup()
+    country_dropdown.hidePopup()
+
+    assert country_dropdown.isPopulated()
+    assert country_dropdown.count() > 1
+    assert country_dropdown.getCountry() == 'gb'
+    assert country_dropdown.getCountryPhoneCode() == '+44'
+
+    country_dropdown.setCountry('us')
+    assert country_dropdown.getCountry() == 'us'
+
+
+def test_set_every_country(qtbot):
+    """Test setting and getting every available country"""
+
+    country_dropdown = CountryDropdown()
+    qtbot.addWidget(country_dropdown)
+
+    for country in countries:
+        country_dropdown.setCountry(country.upper())
+        assert country_dropdown.getCountry() == country
+        assert country_dropdown.getCountryPhoneCode() == countries[country][1]
+
+    # Unknown countries are ignored
+    country_dropdown.setCountry('xx')
+    assert country_dropdown.getCountry() == 'zw'
+
+
+def test_phone_code_widths(qtbot):
+    """Test that the phone code width follows the phone code LineEdit's font"""
+
+    country_dropdown = CountryDropdown()
+    qtbot.addWidget(country_dropdown)
+
+    phone_code_line_edit = QLineEdit()
+    qtbot.addWidget(phone_code_line_edit)
+    country_dropdown.setPhoneCodeLineEdit(phone_code_line_edit)
+
+    country_dropdown.setCountry('us')
+    small_width = phone_code_line_edit.width()
+    assert small_width == phone_code_line_edit.fontMetrics().tightBoundingRect('+1').width() + 8
+
+    phone_code_line_edit.setFont(QFont('Arial', 30))
+    country_dropdown.updatePhoneCodeFont()
+    assert phone_code_line_edit.width() == phone_code_line_edit.fontMetrics().tightBoundingRect('+1').width() + 8
+    assert phone_code_line_edit.width() > small_width
+
+
+def test_popup_width(qtbot):
+    """Test that the popup width fits the countries, follows the font and is cached"""
+
+    country_dropdown = CountryDropdown()
+    qtbot.addWidget(country_dropdown)
+    country_dropdown.setPhoneCodeLineEdit(QLineEdit())
+    country_dropdown.setBorderWidth(1)
+
+    small_width = country_dropdown.view().width()
+    longest_text = max((country_dropdown.itemText(i) for i in range(country_dropdown.count())),
+                       key=country_dropdown.fontMetrics().horizontalAdvance)
+    assert small_width > country_dropdown.fontMetrics().horizontalAdvance(longest_text)
+    assert abs(small_width - country_dropdown.minimumSizeHint().width()) <= 2
+
+    country_dropdown.setFont(QFont('Arial', 30))
+    country_dropdown.updatePopupWidth()
+    assert country_dropdown.view().width() > small_width
+
+    # Other dropdowns with the same font reuse the cached width
+    other_dropdown = CountryDropdown()
+    qtbot.addWidget(other_dropdown)
+    other_dropdown.setPhoneCodeLineEdit(QLineEdit())
+    other_dropdown.setBorderWidth(1)
+    assert other_dropdown.view().width() == small_width
+
+    # Models with other countries don't reuse the width of replaced models
+    other_dropdown.setModel(CountryListModel(['us'], other_dropdown))
+    other_dropdown.updatePopupWidth()
+    short_width = other_dropdown.view().width()
+    assert short_width < small_width
+
+    other_dropdown.setModel(CountryListModel(['io'], other_dropdown))
+    other_dropdown.updatePopupWidth()
+    assert other_dropdown.view().width() > short_width
+
+
+def test_paint_uses_scaled_flag(qtbot):
+    """Test that repaints draw the cached pre-scaled flag"""
+
+    country_dropdown = CountryDropdown()
+    qtbot.addWidget(country_dropdown)
+    country_dropdown.setPhoneCodeLineEdit(QLineEdit())
+    country_dropdown.setFixedHeight(30)
+    with qtbot.waitExposed(country_dropdown):
+        country_dropdown.show()
+
+    clear_flag_cache()
+    for i in range(3):
+        country_dropdown.repaint()
+
+    stats = get_flag_cache_stats()
+    assert stats['scaled_misses'] == 1
+    assert stats['scaled_hits'] == 2
+
+
+def test_search(qtbot):
+    """Test searching the popup by typing into the search field and selecting a match"""
+
+    country_dropdown = CountryDropdown()
+    qtbot.addWidget(country_dropdown)
+    country_dropdown.setPhoneCodeLineEdit(QLineEdit())
+    country_dropdown.show()
+    country_dropdown.showPopup()
+
+    search_line_edit = country_dropdown.getSearchLineEdit()
+    QTest.keyClicks(search_line_edit, 'germ')
+    assert country_dropdown.getSearchText() == 'germ'
+
+    # Country list is replaced by the matching countries
+    results_view = [view for view in country_dropdown.findChildren(CountryListView)
+                    if view is not country_dropdown.view()][0]
+    assert country_dropdown.view().isHidden()
+    assert not results_view.isHidden()
+    assert results_view.model().rowCount() == 1
+    assert results_view.model().data(results_view.currentIndex()) == 'Germany (+49)'
+
+    country_dropdown.setSearchText('g')
+    assert results_view.model().rowCount() == len(search_countries('g'))
+
+    country_dropdown.setSearchText('+44')
+    QTest.keyClick(search_line_edit, qt_api.QtCore.Qt.Key.Key_Return)
+    assert country_dropdown.getCountry() == 'gb'
+    assert not country_dropdown.isDropdownOpen()
+
+    # Search is reset once the popup is closed
+    assert country_dropdown.getSearchText() == ''
+    assert not country_dropdown.view().isHidden()
+    assert results_view.isHidden()
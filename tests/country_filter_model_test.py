@@ -0,0 +1,31 @@
+from src.pyqt_phone_input.country_filter_model import CountryFilterModel
+from src.pyqt_phone_input.country_list_model import CountryListModel
+
+
+def test_rows(qtbot):
+    """Test showing a subset of the source rows"""
+
+    source_model = CountryListModel(['de', 'gb', 'us'])
+    filter_model = CountryFilterModel(source_model)
+    assert filter_model.rowCount() == 0
+
+    filter_model.setRows([2, 0])
+    assert filter_model.getRows() == [2, 0]
+    assert filter_model.rowCount() == 2
+    assert filter_model.data(filter_model.index(0, 0)) == 'United States (+1)'
+    assert filter_model.data(filter_model.index(1, 0), CountryListModel.CountryRole) == 'de'
+    assert filter_model.data(filter_model.index(2, 0)) is None
+    assert filter_model.mapToSource(1) == 0
+    assert filter_model.mapToSource(2) == -1
+
+
+def test_set_source_model(qtbot):
+    """Test that changing the source model removes all rows"""
+
+    filter_model = CountryFilterModel(CountryListModel(['de']))
+    filter_model.setRows([0])
+
+    source_model = CountryListModel(['us'])
+    filter_model.setSourceModel(source_model)
+    assert filter_model.getSourceModel() is source_model
+    assert filter_model.rowCount() == 0
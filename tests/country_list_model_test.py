@@ -0,0 +1,36 @@
+from PyQt6.QtCore import Qt
+from src.pyqt_phone_input.countries import countries
+from src.pyqt_phone_input.country_dropdown import CountryDropdown
+from src.pyqt_phone_input.country_list_model import CountryListModel, get_shared_country_list_model
+
+
+def test_rows_and_roles(qtbot):
+    """Test the row count and the data returned for every role"""
+
+    model = CountryListModel()
+    assert model.rowCount() == len(countries)
+
+    index = model.index(list(countries).index('us'), 0)
+    assert model.data(index) == 'United States (+1)'
+    assert model.data(index, CountryListModel.CountryRole) == 'us'
+    assert model.data(index, CountryListModel.NameRole) == 'United States'
+    assert model.data(index, CountryListModel.PhoneCodeRole) == '+1'
+    assert not model.data(index, CountryListModel.FlagRole).isNull()
+    assert not model.data(index, Qt.ItemDataRole.DecorationRole).isNull()
+
+
+def test_shared_model(qtbot):
+    """Test that all dropdowns are attached to the same model"""
+
+    first_dropdown = CountryDropdown()
+    second_dropdown = CountryDropdown()
+    qtbot.addWidget(first_dropdown)
+    qtbot.addWidget(second_dropdown)
+
+    assert first_dropdown.model() is get_shared_country_list_model()
+    assert second_dropdown.model() is get_shared_country_list_model()
+
+    # Selection is still independent for every dropdown
+    first_dropdown.setCountry('us')
+    assert first_dropdown.getCountry() == 'us'
+    assert second_dropdown.getCountry() == 'af'
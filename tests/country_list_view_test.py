@@ -0,0 +1,30 @@
+from PyQt6.QtWidgets import QListView
+from src.pyqt_phone_input.country_list_model import CountryListModel
+from src.pyqt_phone_input.country_list_view import CountryListView
+
+
+def test_initial_settings(qtbot):
+    """Test that the view is configured as a uniform, batched view"""
+
+    country_list_view = CountryListView()
+    qtbot.addWidget(country_list_view)
+
+    assert country_list_view.uniformItemSizes()
+    assert country_list_view.layoutMode() == QListView.LayoutMode.Batched
+
+
+def test_scroll_to_row_not_laid_out(qtbot):
+    """Test scrolling to a row before the batched layout reached it"""
+
+    country_list_view = CountryListView()
+    qtbot.addWidget(country_list_view)
+    country_list_view.setModel(CountryListModel())
+    country_list_view.resize(200, 100)
+
+    with qtbot.waitExposed(country_list_view):
+        country_list_view.show()
+
+    last_index = country_list_view.model().index(country_list_view.model().rowCount() - 1, 0)
+    country_list_view.scrollTo(last_index)
+    qtbot.waitUntil(lambda: country_list_view.viewport().rect().contains(
+        country_list_view.visualRect(last_index)))
@@ -0,0 +1,148 @@
+from PyQt6.QtCore import QObject
+from PyQt6.QtWidgets import QLineEdit, QWidget, QVBoxLayout
+from PyQt6.QtTest import QTest
+from pytestqt.qt_compat import qt_api
+from src.pyqt_phone_input import PhoneInput
+from src.pyqt_phone_input.country_dropdown import CountryDropdown
+from src.pyqt_phone_input.country_list_view import CountryListView
+from src.pyqt_phone_input.country_popup import CountryPopup, get_shared_country_popup
+
+
+def create_dropdown(qtbot) -> CountryDropdown:
+    """Create a shown CountryDropdown using the shared popup
+
+    :param qtbot: qtbot fixture
+    :return: dropdown
+    """
+
+    country_dropdown = CountryDropdown(shared_popup=True)
+    qtbot.addWidget(country_dropdown)
+    country_dropdown.setPhoneCodeLineEdit(QLineEdit())
+    country_dropdown.show()
+    return country_dropdown
+
+
+def test_shared_instance(qtbot):
+    """Test that the shared popup is only created once"""
+
+    popup = get_shared_country_popup()
+    assert isinstance(popup, CountryPopup)
+    assert get_shared_country_popup() is popup
+
+
+def test_no_own_popup(qtbot):
+    """Test that a dropdown using the shared popup doesn't create its own views or search field"""
+
+    country_dropdown = create_dropdown(qtbot)
+
+    assert country_dropdown.isSharedPopup()
+    assert not country_dropdown.findChildren(CountryListView)
+    assert country_dropdown.getSearchLineEdit() is get_shared_country_popup().getSearchLineEdit()
+    assert not CountryDropdown().isSharedPopup()
+
+
+def test_show_and_hide(qtbot):
+    """Test borrowing the shared popup and releasing it again"""
+
+    country_dropdown = create_dropdown(qtbot)
+    country_dropdown.setCountry('de')
+    country_dropdown.setPopupStyleSheet('QListView::item {height: 20px;}')
+    popup = get_shared_country_popup()
+
+    with qtbot.waitSignal(country_dropdown.show_popup):
+        country_dropdown.showPopup()
+    assert country_dropdown.isDropdownOpen()
+    assert popup.isVisible()
+    assert popup.getDropdown() is country_dropdown
+    assert popup.styleSheet() == country_dropdown.getPopupStyleSheet()
+    assert popup.getListView().currentIndex().row() == country_dropdown.currentIndex()
+    assert popup.getListView().width() == country_dropdown.getPopupWidth()
+
+    with qtbot.waitSignal(country_dropdown.hide_popup):
+        country_dropdown.hidePopup()
+    assert not country_dropdown.isDropdownOpen()
+    assert not popup.isVisible()
+    assert popup.getDropdown() is None
+
+
+def test_retarget(qtbot):
+    """Test that opening the popup for another dropdown closes it for the first one"""
+
+    first_dropdown = create_dropdown(qtbot)
+    second_dropdown = create_dropdown(qtbot)
+    second_dropdown.setCountry('gb')
+    popup = get_shared_country_popup()
+
+    first_dropdown.showPopup()
+    with qtbot.waitSignal(first_dropdown.hide_popup):
+        second_dropdown.showPopup()
+    assert not first_dropdown.isDropdownOpen()
+    assert second_dropdown.isDropdownOpen()
+    assert popup.getDropdown() is second_dropdown
+    assert popup.getListView().currentIndex().row() == second_dropdown.currentIndex()
+    second_dropdown.hidePopup()
+
+
+def test_search_and_select(qtbot):
+    """Test that searching the shared popup selects the country in the borrowing dropdown"""
+
+    first_dropdown = create_dropdown(qtbot)
+    second_dropdown = create_dropdown(qtbot)
+    second_dropdown.showPopup()
+
+    QTest.keyClicks(second_dropdown.getSearchLineEdit(), 'germ')
+    results_view = get_shared_country_popup().getSearchResultsView()
+    assert not results_view.isHidden()
+    assert results_view.model().rowCount() == 1
+
+    QTest.keyClick(second_dropdown.getSearchLineEdit(), qt_api.QtCore.Qt.Key.Key_Return)
+    assert second_dropdown.getCountry() == 'de'
+    assert first_dropdown.getCountry() == 'af'
+    assert not second_dropdown.isDropdownOpen()
+    assert second_dropdown.getSearchText() == ''
+    assert results_view.isHidden()
+
+
+def test_hidden_externally(qtbot):
+    """Test that hiding the popup directly (i.e. clicking outside of it) closes the dropdown"""
+
+    country_dropdown = create_dropdown(qtbot)
+    country_dropdown.showPopup()
+
+    with qtbot.waitSignal(country_dropdown.hide_popup):
+        get_shared_country_popup().hide()
+    assert not country_dropdown.isDropdownOpen()
+
+
+def test_dropdown_deleted(qtbot):
+    """Test that deleting the dropdown showing the popup releases it"""
+
+    country_dropdown = CountryDropdown(shared_popup=True)
+    country_dropdown.show()
+    country_dropdown.showPopup()
+    popup = get_shared_country_popup()
+
+    with qtbot.waitSignal(country_dropdown.destroyed):
+        country_dropdown.deleteLater()
+    assert popup.getDropdown() is None
+    assert not popup.isVisible()
+
+
+def test_footprint(qtbot):
+    """Test the per-instance footprint of 1,000 PhoneInputs with and without the shared popup"""
+
+    objects_per_instance = {}
+    for shared_popup in (False, True):
+        window = QWidget()
+        qtbot.addWidget(window)
+        layout = QVBoxLayout(window)
+        for _ in range(1000):
+            layout.addWidget(PhoneInput(window, shared_popup=shared_popup))
+        objects_per_instance[shared_popup] = len(window.findChildren(QObject)) / 1000
+
+        # No popup views or search fields exist per instance
+        if shared_popup:
+            assert not window.findChildren(CountryListView)
+            assert len(window.findChildren(QLineEdit)) == 2000
+
+    assert objects_per_instance[True] <= objects_per_instance[False] * 0.7
@@ -0,0 +1,57 @@
+from src.pyqt_phone_input.countries import countries
+from src.pyqt_phone_input.country_search_index import CountrySearchIndex, get_shared_country_search_index
+
+
+def search(query: str) -> list:
+    """Search the shared index and return the matching country codes"""
+
+    country_codes = list(countries)
+    return [country_codes[row] for row in get_shared_country_search_index().search(query)]
+
+
+def test_search_by_name():
+    """Test searching by the start of the words of a country name"""
+
+    assert search('united st') == ['us']
+    assert search('UNITED STATES') == ['us']
+    assert search('states united') == ['us']
+    assert 'gb' in search('united')
+    assert search('zealand') == ['nz']
+
+
+def test_search_ignores_accents_and_punctuation():
+    """Test that accents and punctuation don't have to be typed"""
+
+    assert search('reunion') == ['re']
+    assert search('Réunion') == ['re']
+    assert search('cote') == ['ci']
+    assert search('ivoire') == ['ci']
+    assert search("d'ivoire") == ['ci']
+    assert 'vi' in search('u.s.')
+
+
+def test_search_by_codes():
+    """Test searching by country code and phone code"""
+
+    assert 'de' in search('de')
+    assert 'gb' in search('+44')
+    assert search('+49') == search('49') == ['de']
+
+
+def test_empty_and_unknown_queries():
+    """Test that an empty query matches everything and unknown words nothing"""
+
+    assert search('') == list(countries)
+    assert search('  ') == list(countries)
+    assert search('xyz') == []
+    assert search('united xyz') == []
+
+
+def test_custom_rows():
+    """Test an index of custom countries (rows refer to the given list)"""
+
+    search_index = CountrySearchIndex(['de', 'us', 'de'])
+
+    assert search_index.search('germany') == [0, 2]
+    assert search_index.match('+1') == frozenset([1])
+    assert search_index.getCountryCodes() == ['de', 'us', 'de']
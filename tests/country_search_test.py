@@ -0,0 +1,119 @@
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QLineEdit
+from PyQt6.QtTest import QTest
+from src.pyqt_phone_input.compact_phone_input import CompactPhoneInput
+from src.pyqt_phone_input.country_dropdown import CountryDropdown
+from src.pyqt_phone_input.country_list_view import CountryListView
+from src.pyqt_phone_input.country_popup import get_shared_country_popup
+from src.pyqt_phone_input.country_search import CountrySearch
+
+
+def test_search_and_select(qtbot):
+    """Test searching the countries of a dropdown and selecting a match"""
+
+    phone_input = CompactPhoneInput()
+    qtbot.addWidget(phone_input)
+    list_view = CountryListView()
+    qtbot.addWidget(list_view)
+    search = CountrySearch(list_view)
+    qtbot.addWidget(search)
+    search_line_edit = search.getSearchLineEdit()
+    results_view = search.getSearchResultsView()
+
+    # Nothing is searched without a dropdown
+    QTest.keyClicks(search_line_edit, 'germ')
+    assert results_view.isHidden()
+    assert results_view.model().rowCount() == 0
+
+    # Setting the dropdown applies the current search text
+    search.setDropdown(phone_input)
+    assert search.getDropdown() is phone_input
+    assert list_view.isHidden()
+    assert not results_view.isHidden()
+    assert results_view.model().data(results_view.currentIndex()) == 'Germany (+49)'
+
+    QTest.keyClick(search_line_edit, Qt.Key.Key_Return)
+    assert phone_input.getCountry() == 'de'
+
+    search.clear()
+    assert search_line_edit.text() == ''
+    assert not list_view.isHidden()
+    assert results_view.isHidden()
+
+
+def test_dropdown_not_kept_alive(qtbot):
+    """Test that the search doesn't keep a deleted dropdown alive"""
+
+    list_view = CountryListView()
+    qtbot.addWidget(list_view)
+    search = CountrySearch(list_view)
+    qtbot.addWidget(search)
+
+    country_dropdown = CountryDropdown()
+    search.setDropdown(country_dropdown)
+    del country_dropdown
+    assert search.getDropdown() is None
+
+
+def test_own_and_shared_popup(qtbot):
+    """Test that the own popup and the shared popup use the same search"""
+
+    country_dropdown = CountryDropdown()
+    qtbot.addWidget(country_dropdown)
+    search = country_dropdown.view().parentWidget().findChild(CountrySearch)
+    assert search.getListView() is country_dropdown.view()
+    assert search.getSearchLineEdit() is country_dropdown.getSearchLineEdit()
+
+    popup = get_shared_country_popup()
+    assert popup.getSearch().getListView() is popup.getListView()
+    assert popup.getSearch().getSearchLineEdit() is popup.getSearchLineEdit()
+
+
+def test_popup_size(qtbot):
+    """Test that searching doesn't change the size of the popups"""
+
+    country_dropdown = CountryDropdown()
+    qtbot.addWidget(country_dropdown)
+    country_dropdown.setPhoneCodeLineEdit(QLineEdit())
+    country_dropdown.show()
+    country_dropdown.showPopup()
+    search = country_dropdown.view().parentWidget().findChild(CountrySearch)
+
+    # Only as high as the search field while the country list is shown
+    assert search.height() == search.getSearchLineEdit().height()
+    country_dropdown.hidePopup()
+
+    shared_dropdown = CountryDropdown(shared_popup=True)
+    qtbot.addWidget(shared_dropdown)
+    shared_dropdown.setPhoneCodeLineEdit(QLineEdit())
+    shared_dropdown.show()
+    shared_dropdown.showPopup()
+    popup = get_shared_country_popup()
+    size = popup.size()
+
+    QTest.keyClicks(popup.getSearchLineEdit(), 'g')
+    qtbot.wait(10)
+    assert popup.size() == size
+    QTest.keyClick(popup.getSearchLineEdit(), Qt.Key.Key_Backspace)
+    qtbot.wait(10)
+    assert popup.size() == size
+    shared_dropdown.hidePopup()
+
+
+def test_lazy_dropdown(qtbot):
+    """Test that a lazy dropdown is only searched once its popup is populated"""
+
+    country_dropdown = CountryDropdown(lazy=True)
+    qtbot.addWidget(country_dropdown)
+    country_dropdown.setPhoneCodeLineEdit(QLineEdit())
+    country_dropdown.show()
+    search = country_dropdown.view().parentWidget().findChild(CountrySearch)
+
+    country_dropdown.setSearchText('germ')
+    assert search.getDropdown() is None
+    assert search.getSearchResultsView().model().rowCount() == 0
+
+    country_dropdown.showPopup()
+    assert search.getDropdown() is country_dropdown
+    assert search.getSearchResultsView().model().rowCount() == 1
+    country_dropdown.hidePopup()
@@ -0,0 +1,42 @@
+from src.pyqt_phone_input.dial_code_trie import DialCodeTrie
+
+
+def test_match():
+    """Test matching the phone code of international numbers"""
+
+    dial_code_trie = DialCodeTrie()
+
+    assert dial_code_trie.match('+44 20 7946 0958') == ('+44', '20 7946 0958')
+    assert dial_code_trie.match('+3 51 912345678') == ('+351', '912345678')
+    assert dial_code_trie.match('+1') == ('+1', '')
+    assert dial_code_trie.match('+4') is None
+    assert dial_code_trie.match('+999') is None
+    assert dial_code_trie.match('44 20 7946 0958') is None
+
+
+def test_is_prefix():
+    """Test checking whether a number could still become a phone code"""
+
+    dial_code_trie = DialCodeTrie()
+
+    assert dial_code_trie.isPrefix('+')
+    assert dial_code_trie.isPrefix('+35')
+    assert not dial_code_trie.isPrefix('+351')
+    assert not dial_code_trie.isPrefix('+999')
+
+
+def test_get_country():
+    """Test resolving phone codes to countries"""
+
+    dial_code_trie = DialCodeTrie()
+
+    assert dial_code_trie.getCountry('+44') == 'gb'
+    assert dial_code_trie.getCountry('+1') == 'us'
+    assert dial_code_trie.getCountry('+7') == 'ru'
+    assert dial_code_trie.getCountry('+1', 'ca') == 'ca'
+    assert dial_code_trie.getCountry('+1', 'gb') == 'us'
+    assert dial_code_trie.getCountry('+999') is None
+
+    dial_code_trie.setDefaultCountry('+1', 'CA')
+    assert dial_code_trie.getDefaultCountry('+1') == 'ca'
+    assert DialCodeTrie({'+7': 'kz'}).getCountry('+7') == 'kz'
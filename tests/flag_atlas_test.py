@@ -0,0 +1,39 @@
+from src.pyqt_phone_input.countries import countries
+from src.pyqt_phone_input.flag_atlas import FLAG_SIZES, get_flag_size, build_flag_atlas, load_flag_atlas
+
+
+def test_build_and_load(qtbot, tmp_path):
+    """Test that a built atlas contains every flag and its index"""
+
+    path = build_flag_atlas(16, str(tmp_path / 'flags_16.png'))
+    atlas, index = load_flag_atlas(16, path)
+
+    assert set(index) == set(countries)
+    assert index['us'].width() == 16
+    assert atlas.rect().contains(index['us'])
+    assert len({(rect.x(), rect.y()) for rect in index.values()}) == len(countries)
+
+
+def test_shipped_atlases(qtbot):
+    """Test that the shipped atlases are up to date"""
+
+    for flag_size in FLAG_SIZES:
+        atlas, index = load_flag_atlas(flag_size)
+        assert set(index) == set(countries)
+        assert index['us'].width() == flag_size
+
+
+def test_flag_size(qtbot):
+    """Test picking the nearest larger flag size"""
+
+    assert get_flag_size(10) == 16
+    assert get_flag_size(16) == 16
+    assert get_flag_size(21) == 24
+    assert get_flag_size(42) == 48
+    assert get_flag_size(500) == 96
+
+
+def test_missing_atlas(qtbot, tmp_path):
+    """Test loading an atlas that doesn't exist"""
+
+    assert load_flag_atlas(16, str(tmp_path / 'missing.png')) is None
@@ -0,0 +1,231 @@
+import pytest
+from PyQt6.QtCore import Qt, QThreadPool
+from src.pyqt_phone_input.countries import countries
+from src.pyqt_phone_input.country_dropdown import CountryDropdown
+from src.pyqt_phone_input import flag_cache
+from src.pyqt_phone_input.country_list_model import CountryListModel
+from src.pyqt_phone_input.flag_cache import (get_flag_icon, get_flag_pixmap, get_scaled_flag_pixmap,
+                                             warm_up_flag_cache, clear_flag_cache, get_flag_cache_stats,
+                                             get_flag_loader, preload_flags, is_preloading_flags)
+
+
+def test_flag_loaded_once(qtbot):
+    """Test that a flag is only loaded from disk once"""
+
+    clear_flag_cache()
+
+    pixmap = get_flag_pixmap('us')
+    assert not pixmap.isNull()
+    assert get_flag_pixmap('us') is pixmap
+    assert get_flag_icon('us') is get_flag_icon('us')
+
+    stats = get_flag_cache_stats()
+    assert stats['loads'] == 1
+    assert stats['cached'] == 1
+
+    # Icons and pixmaps are counted separately (creating the icon looks up the pixmap)
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
+    assert stats['icon_hits'] == 1
+    assert stats['icon_misses'] == 1
+
+
+def test_warm_up_and_clear(qtbot):
+    """Test warming up and clearing the cache"""
+
+    clear_flag_cache()
+
+    warm_up_flag_cache()
+    assert get_flag_cache_stats()['loads'] == 1
+    assert get_flag_cache_stats()['cached'] == len(countries)
+
+    clear_flag_cache()
+    assert get_flag_cache_stats() == {'loads': 0, 'hits': 0, 'misses': 0, 'icon_hits': 0, 'icon_misses': 0,
+                                      'scaled_hits': 0, 'scaled_misses': 0, 'cached': 0, 'scaled_cached': 0}
+
+
+def test_instances_share_flags(qtbot):
+    """Test that further CountryDropdown instances do no file I/O"""
+
+    clear_flag_cache()
+
+    def request_flags(country_dropdown):
+        # Paint the selected flag and get the item icons like the popup does
+        country_dropdown.resize(60, 30)
+        country_dropdown.grab()
+        model = country_dropdown.model()
+        for row in range(model.rowCount()):
+            assert model.data(model.index(row, 0), Qt.ItemDataRole.DecorationRole) is not None
+
+    first_dropdown = CountryDropdown()
+    qtbot.addWidget(first_dropdown)
+    request_flags(first_dropdown)
+    stats = get_flag_cache_stats()
+    assert stats['loads'] > 0
+    assert stats['icon_misses'] == len(countries)
+    assert stats['scaled_misses'] == 1
+
+    for i in range(5):
+        country_dropdown = CountryDropdown()
+        qtbot.addWidget(country_dropdown)
+        request_flags(country_dropdown)
+
+    new_stats = get_flag_cache_stats()
+    assert new_stats['loads'] == stats['loads']
+    assert new_stats['icon_misses'] == stats['icon_misses']
+    assert new_stats['scaled_misses'] == stats['scaled_misses']
+    assert new_stats['icon_hits'] == 5 * len(countries)
+
+
+def test_missing_atlas(qtbot, monkeypatch):
+    """Test that a missing atlas raises an error instead of falling back to the (unshipped) loose icons"""
+
+    monkeypatch.setattr(flag_cache, 'load_flag_atlas', lambda flag_size: None)
+    clear_flag_cache()
+
+    with pytest.raises(FileNotFoundError):
+        get_flag_pixmap('us')
+    assert get_flag_cache_stats()['loads'] == 0
+    monkeypatch.undo()
+
+    warm_up_flag_cache()
+    assert get_flag_cache_stats()['loads'] == 1
+    assert get_flag_pixmap('us').width() == flag_cache.ICON_FLAG_SIZE
+    assert get_flag_pixmap('xx').isNull()
+    clear_flag_cache()
+
+
+def test_scaled_flags(qtbot):
+    """Test that flags are scaled once per size and device pixel ratio"""
+
+    clear_flag_cache()
+
+    pixmap = get_scaled_flag_pixmap('us', 20)
+    assert pixmap.width() == 20
+    assert get_flag_cache_stats()['loads'] == 1
+    assert get_scaled_flag_pixmap('us', 20) is pixmap
+
+    high_dpi_pixmap = get_scaled_flag_pixmap('us', 20, 2.0)
+    assert high_dpi_pixmap is not pixmap
+    assert high_dpi_pixmap.width() == 40
+    assert high_dpi_pixmap.devicePixelRatio() == 2.0
+    assert get_scaled_flag_pixmap('us', 20, 2.0) is high_dpi_pixmap
+
+    stats = get_flag_cache_stats()
+    assert stats['scaled_hits'] == 2
+    assert stats['scaled_misses'] == 2
+    assert stats['scaled_cached'] == 2
+
+    # Scaled from the 24 px and 48 px atlases
+    assert stats['loads'] == 2
+
+    # Sizes that have their own atlas don't have to be scaled
+    assert get_scaled_flag_pixmap('us', 24).toImage() == get_flag_pixmap('us', 24).toImage()
+
+
+def test_scaled_flags_evicted(qtbot, monkeypatch):
+    """Test that the least recently used scaled flag is removed once the cache is full"""
+
+    clear_flag_cache()
+    monkeypatch.setattr(flag_cache, 'SCALED_CACHE_SIZE', 2)
+
+    first_pixmap = get_scaled_flag_pixmap('us', 20)
+    second_pixmap = get_scaled_flag_pixmap('de', 20)
+    assert get_scaled_flag_pixmap('us', 20) is first_pixmap
+    get_scaled_flag_pixmap('fr', 20)
+
+    assert get_flag_cache_stats()['scaled_cached'] == 2
+    assert get_scaled_flag_pixmap('us', 20) is first_pixmap
+    assert get_scaled_flag_pixmap('de', 20) is not second_pixmap
+
+
+def test_preload_flags(qtbot):
+    """Test decoding the flags in the background"""
+
+    clear_flag_cache()
+
+    with qtbot.waitSignal(get_flag_loader().flags_loaded) as blocker:
+        preload_flags([flag_cache.ICON_FLAG_SIZE])
+        assert is_preloading_flags()
+        assert is_preloading_flags(flag_cache.ICON_FLAG_SIZE)
+    assert blocker.args == [flag_cache.ICON_FLAG_SIZE]
+
+    assert not is_preloading_flags()
+    assert get_flag_cache_stats()['loads'] == 1
+
+    # Loaded flags are used without decoding again
+    preload_flags([flag_cache.ICON_FLAG_SIZE])
+    assert not is_preloading_flags()
+    assert not get_flag_pixmap('us').isNull()
+    assert get_flag_cache_stats()['loads'] == 1
+
+
+def test_model_filled_progressively(qtbot):
+    """Test that the model shows no flags while they are decoded and updates them afterwards"""
+
+    clear_flag_cache()
+    model = CountryListModel()
+    index = model.index(0, 0)
+
+    with qtbot.waitSignal(model.dataChanged) as blocker:
+        preload_flags()
+        assert model.data(index, CountryListModel.FlagRole) is None
+    assert blocker.args[0].row() == 0
+    assert blocker.args[1].row() == model.rowCount() - 1
+
+    qtbot.waitUntil(lambda: not is_preloading_flags())
+    assert not model.data(index, CountryListModel.FlagRole).isNull()
+
+
+def test_model_flag_loader_connections(qtbot):
+    """Test that only models waiting for flags are connected to the flag loader"""
+
+    flag_loader = get_flag_loader()
+    receivers = flag_loader.receivers(flag_loader.flags_loaded)
+    models = [CountryListModel(['us']) for i in range(5)]
+    assert flag_loader.receivers(flag_loader.flags_loaded) == receivers
+
+    clear_flag_cache()
+    with qtbot.waitSignal(models[0].dataChanged):
+        preload_flags([flag_cache.ICON_FLAG_SIZE])
+        models[0].data(models[0].index(0, 0), CountryListModel.FlagRole)
+        models[0].data(models[0].index(0, 0), CountryListModel.FlagRole)
+        assert flag_loader.receivers(flag_loader.flags_loaded) == receivers + 1
+    assert flag_loader.receivers(flag_loader.flags_loaded) == receivers
+
+
+def test_clear_while_preloading(qtbot):
+    """Test that clearing the cache doesn't block preloading until the stale decoder finishes"""
+
+    clear_flag_cache()
+    preload_flags([flag_cache.ICON_FLAG_SIZE])
+    assert is_preloading_flags(flag_cache.ICON_FLAG_SIZE)
+
+    clear_flag_cache()
+    assert not is_preloading_flags()
+
+    with qtbot.waitSignal(get_flag_loader().flags_loaded):
+        preload_flags([flag_cache.ICON_FLAG_SIZE])
+        assert is_preloading_flags(flag_cache.ICON_FLAG_SIZE)
+    qtbot.waitUntil(lambda: not is_preloading_flags())
+    assert not get_flag_pixmap('us').isNull()
+
+
+def test_stale_preload_dropped(qtbot):
+    """Test that an atlas decoded before the cache was cleared isn't added to the cleared cache"""
+
+    clear_flag_cache()
+    thread_pool = QThreadPool()
+    loaded = []
+    get_flag_loader().flags_loaded.connect(loaded.append)
+
+    preload_flags([flag_cache.ICON_FLAG_SIZE], thread_pool)
+    clear_flag_cache()
+    preload_flags([flag_cache.ICON_FLAG_SIZE], thread_pool)
+    thread_pool.waitForDone()
+    qtbot.waitUntil(lambda: not is_preloading_flags())
+    get_flag_loader().flags_loaded.disconnect(loaded.append)
+
+    # Only the atlas of the second preload is used
+    assert loaded == [flag_cache.ICON_FLAG_SIZE]
+    assert get_flag_cache_stats()['loads'] == 1
@@ -0,0 +1,90 @@
+from PyQt6.QtGui import QColor
+from src.pyqt_phone_input import instrumentation
+from src.pyqt_phone_input.country_dropdown import CountryDropdown
+from src.pyqt_phone_input.flag_cache import clear_flag_cache, get_flag_pixmap
+from src.pyqt_phone_input.instrumentation import (enable_instrumentation, disable_instrumentation,
+                                                  is_instrumentation_enabled, get_instrumentation_stats,
+                                                  reset_instrumentation_stats)
+from src.pyqt_phone_input.phone_input import PhoneInput
+from src.pyqt_phone_input.phone_line_edit import PhoneLineEdit
+
+
+def test_disabled_by_default(qtbot):
+    """Test that nothing is wrapped or recorded while instrumentation is disabled"""
+
+    assert not is_instrumentation_enabled()
+    assert PhoneLineEdit.__dict__['paintEvent'].__name__ == 'paintEvent'
+    assert not hasattr(PhoneLineEdit.__dict__['paintEvent'], '__wrapped__')
+
+    reset_instrumentation_stats()
+    phone_input = PhoneInput()
+    qtbot.addWidget(phone_input)
+    phone_input.setColor(QColor(255, 0, 0))
+    assert get_instrumentation_stats() == {}
+
+
+def test_stats_per_instance(qtbot):
+    """Test counting and timing the hot paths of every widget"""
+
+    existing_input = PhoneInput()
+    qtbot.addWidget(existing_input)
+
+    events = []
+    reset_instrumentation_stats()
+    enable_instrumentation(lambda widget, event, seconds: events.append((widget, event)))
+    try:
+        phone_input = PhoneInput()
+        qtbot.addWidget(phone_input)
+        with qtbot.waitExposed(phone_input):
+            phone_input.show()
+        phone_input.setColor(QColor(255, 0, 0))
+        phone_input.setColor(QColor(255, 0, 0))
+        phone_input.setCountry('de')
+        existing_input.setCountry('gb')
+
+        country_dropdown = phone_input.findChild(CountryDropdown)
+        phone_line_edit = phone_input.findChild(PhoneLineEdit)
+        country_dropdown.repaint()
+        phone_line_edit.repaint()
+
+        clear_flag_cache()
+        events.clear()
+        get_flag_pixmap('us')
+        assert events == [(None, 'icon_load')]
+    finally:
+        disable_instrumentation()
+
+    stats = get_instrumentation_stats(phone_input)
+    assert stats['style_sheet']['count'] > 0
+    assert stats['style_sheet']['seconds'] > 0
+    # Skipped (unchanged) stylesheets aren't counted
+    assert phone_input.getStyleSheetStats()['skipped'] > 0
+    assert stats['style_sheet']['count'] == phone_input.getStyleSheetStats()['applied']
+    assert stats['geometry']['count'] > 0
+    assert stats['signal.country_changed']['count'] == 1
+    assert get_instrumentation_stats(country_dropdown)['paint']['count'] > 0
+    # Initial country and 'de'
+    assert get_instrumentation_stats(country_dropdown)['signal.country_changed']['count'] == 2
+    assert get_instrumentation_stats(phone_line_edit)['paint']['count'] > 0
+    assert get_instrumentation_stats()[None]['icon_load']['count'] > 0
+
+    # Widgets created before enabling are instrumented too
+    assert get_instrumentation_stats(existing_input)['signal.country_changed']['count'] == 1
+
+
+def test_disable_restores_methods(qtbot):
+    """Test that disabling restores the original methods and disconnects the signals"""
+
+    paint_event = PhoneLineEdit.__dict__['paintEvent']
+    phone_input = PhoneInput()
+    qtbot.addWidget(phone_input)
+
+    enable_instrumentation()
+    assert PhoneLineEdit.__dict__['paintEvent'] is not paint_event
+    disable_instrumentation()
+    assert PhoneLineEdit.__dict__['paintEvent'] is paint_event
+
+    reset_instrumentation_stats()
+    phone_input.setCountry('de')
+    assert get_instrumentation_stats() == {}
+    assert not instrumentation._connections
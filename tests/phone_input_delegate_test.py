@@ -0,0 +1,169 @@
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QStandardItemModel, QStandardItem
+from PyQt6.QtWidgets import QApplication, QAbstractItemView, QTableView, QStyleOptionViewItem
+from src.pyqt_phone_input.phone_input import PhoneInput
+from src.pyqt_phone_input.flag_cache import get_flag_cache_stats
+from src.pyqt_phone_input.phone_input_delegate import PhoneInputDelegate
+
+# Role storing the country of a cell in the tests
+COUNTRY_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+def create_view(qtbot, numbers: list, country_role: int = None) -> tuple:
+    """Create a shown QTableView using a PhoneInputDelegate
+
+    :param qtbot: qtbot fixture
+    :param numbers: phone numbers of the rows
+    :param country_role: item data role storing the country of a cell
+    :return: tuple of view, model and delegate
+    """
+
+    model = QStandardItemModel(len(numbers), 1)
+    for row, number in enumerate(numbers):
+        model.setItem(row, 0, QStandardItem(number))
+
+    view = QTableView()
+    delegate = PhoneInputDelegate(view, country_role)
+    view.setItemDelegate(delegate)
+    view.setModel(model)
+    view.resize(300, 200)
+    qtbot.addWidget(view)
+    with qtbot.waitExposed(view):
+        view.show()
+    return view, model, delegate
+
+
+def test_paint_without_widgets(qtbot):
+    """Test that painting many rows doesn't create a widget per row"""
+
+    view, model, delegate = create_view(qtbot, ['+4915112345678'] * 1000)
+    scaled_hits = get_flag_cache_stats()['scaled_hits']
+    view.viewport().repaint()
+
+    assert not view.findChildren(PhoneInput)
+    assert get_flag_cache_stats()['scaled_hits'] > scaled_hits
+
+
+def test_size_hint(qtbot):
+    """Test that the size hint fits flag and text"""
+
+    view, model, delegate = create_view(qtbot, ['+4915112345678', '+44'])
+    option = QStyleOptionViewItem()
+    option.initFrom(view)
+    long_hint = delegate.sizeHint(option, model.index(0, 0))
+    short_hint = delegate.sizeHint(option, model.index(1, 0))
+
+    assert long_hint.width() > short_hint.width()
+    assert long_hint.height() >= view.fontMetrics().height()
+
+
+def test_editor_only_while_editing(qtbot):
+    """Test that a PhoneInput only exists while a cell is edited"""
+
+    view, model, delegate = create_view(qtbot, ['+4915112345678', '+442079460958'])
+    view.edit(model.index(1, 0))
+    editors = view.findChildren(PhoneInput)
+    assert len(editors) == 1
+    assert editors[0].getCountry() == 'gb'
+    assert editors[0].getInput() == '2079460958'
+
+    editors[0].setInput('20 7946 0000')
+    delegate.commitData.emit(editors[0])
+    delegate.closeEditor.emit(editors[0])
+    qtbot.waitUntil(lambda: not view.findChildren(PhoneInput))
+    assert model.data(model.index(1, 0)) == '+442079460000'
+
+
+def test_editor_keyboard_input(qtbot):
+    """Test that the opened editor receives keyboard input, including the key starting the edit"""
+
+    view, model, delegate = create_view(qtbot, ['+4915112345678', '+442079460958'])
+    view.activateWindow()
+    view.edit(model.index(0, 0))
+    editor = view.findChild(PhoneInput)
+    qtbot.waitUntil(lambda: QApplication.focusWidget() is not None)
+    assert QApplication.focusWidget() is not editor
+    assert editor.isAncestorOf(QApplication.focusWidget())
+
+    qtbot.keyClick(QApplication.focusWidget(), Qt.Key.Key_End)
+    qtbot.keyClicks(QApplication.focusWidget(), '9')
+    assert editor.getInput() == '151123456789'
+    delegate.closeEditor.emit(editor)
+    qtbot.waitUntil(lambda: not view.findChildren(PhoneInput))
+
+    view.setEditTriggers(QAbstractItemView.EditTrigger.AnyKeyPressed)
+    view.setCurrentIndex(model.index(1, 0))
+    view.setFocus()
+    qtbot.keyClicks(view, '7')
+    editor = view.findChild(PhoneInput)
+    assert editor is not None
+    assert '7' in editor.getInput()
+
+
+def test_set_model_data_empty(qtbot):
+    """Test that an empty input is stored as empty phone number"""
+
+    view, model, delegate = create_view(qtbot, ['+4915112345678'])
+    editor = delegate.createEditor(view.viewport(), QStyleOptionViewItem(), model.index(0, 0))
+    delegate.setEditorData(editor, model.index(0, 0))
+    assert editor.getCountry() == 'de'
+
+    editor.setInput('')
+    delegate.setModelData(editor, model, model.index(0, 0))
+    assert model.data(model.index(0, 0)) == ''
+    editor.deleteLater()
+
+
+def test_set_editor_data_non_string(qtbot):
+    """Test that numbers stored as other types than str are edited as text"""
+
+    view, model, delegate = create_view(qtbot, [''], COUNTRY_ROLE)
+    model.setData(model.index(0, 0), 2079460958, Qt.ItemDataRole.EditRole)
+    model.setData(model.index(0, 0), 'gb', COUNTRY_ROLE)
+
+    editor = delegate.createEditor(view.viewport(), QStyleOptionViewItem(), model.index(0, 0))
+    delegate.setEditorData(editor, model.index(0, 0))
+    assert editor.getCountry() == 'gb'
+    assert editor.getInput() == '2079460958'
+    editor.deleteLater()
+
+
+def test_set_model_data_incomplete_international_number(qtbot):
+    """Test that an international number with an incomplete phone code doesn't change the model"""
+
+    view, model, delegate = create_view(qtbot, ['+4915112345678'])
+    editor = delegate.createEditor(view.viewport(), QStyleOptionViewItem(), model.index(0, 0))
+    delegate.setEditorData(editor, model.index(0, 0))
+
+    editor.setInput('+4')
+    delegate.setModelData(editor, model, model.index(0, 0))
+    assert model.data(model.index(0, 0)) == '+4915112345678'
+    editor.deleteLater()
+
+
+def test_country_role(qtbot):
+    """Test that the country role resolves shared phone codes"""
+
+    view, model, delegate = create_view(qtbot, ['+16135550123'], COUNTRY_ROLE)
+    model.setData(model.index(0, 0), 'ca', COUNTRY_ROLE)
+    assert delegate.getCountryRole() == COUNTRY_ROLE
+
+    editor = delegate.createEditor(view.viewport(), QStyleOptionViewItem(), model.index(0, 0))
+    delegate.setEditorData(editor, model.index(0, 0))
+    assert editor.getCountry() == 'ca'
+
+    editor.setCountry('us')
+    delegate.setModelData(editor, model, model.index(0, 0))
+    assert model.data(model.index(0, 0), COUNTRY_ROLE) == 'us'
+    editor.deleteLater()
+
+    delegate.setCountryRole(None)
+    assert delegate.getCountryRole() is None
+
+
+def test_paint_invalid_number(qtbot):
+    """Test that numbers without a known phone code are painted as text"""
+
+    view, model, delegate = create_view(qtbot, ['12345', ''])
+    view.viewport().repaint()
+    assert not view.findChildren(PhoneInput)
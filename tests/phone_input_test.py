@@ -1,6 +1,9 @@
-from PyQt6.QtCore import QMargins
-from PyQt6.QtGui import QColor, QPalette, QFont
+from PyQt6.QtCore import Qt, QMargins
+from PyQt6.QtGui import QColor, QPalette, QFont, QValidator
+from src.pyqt_phone_input.country_dropdown import CountryDropdown
+from src.pyqt_phone_input.flag_cache import clear_flag_cache, get_flag_cache_stats
 from src.pyqt_phone_input.phone_input import PhoneInput
+from src.pyqt_phone_input.phone_line_edit import PhoneLineEdit
 
 
 def test_initial_values(qtbot):
@@ -46,6 +49,19 @@ def test_set_country_and_input(qtbot):
     assert phone_input.getPhoneNumber() == '+1123456789'
 
 
+def test_incomplete_international_number(qtbot):
+    """Test that the '+' of an international number without a matching phone code is ignored"""
+
+    phone_input = PhoneInput()
+    qtbot.addWidget(phone_input)
+    phone_line_edit = phone_input.findChild(PhoneLineEdit)
+
+    qtbot.keyClicks(phone_line_edit, '+9')
+    assert phone_input.getCountry() == 'af'
+    assert phone_input.getInput() == '+9'
+    assert phone_input.getPhoneNumber() is None
+
+
 def test_set_placeholder_text(qtbot):
     """Test setting the placeholder text"""
 
@@ -297,3 +313,214 @@ def test_set_dropdown_font(qtbot):
     font = QFont('Arial', 14)
     phone_input.setDropdownFont(font)
     assert phone_input.getDropdownFont() == font
+
+
+def test_lazy_set_country(qtbot):
+    """Test setting the country of a lazy widget"""
+
+    phone_input = PhoneInput(lazy=True)
+    qtbot.addWidget(phone_input)
+
+    with qtbot.waitSignal(phone_input.country_changed):
+        phone_input.setCountry('us')
+    phone_input.setInput('123456789')
+
+    assert phone_input.getCountry() == 'us'
+    assert phone_input.getPhoneNumber() == '+1123456789'
+
+
+def test_style_sheet_change_detection(qtbot):
+    """Test that stylesheets are only applied if they change"""
+
+    phone_input = PhoneInput()
+    qtbot.addWidget(phone_input)
+    phone_line_edit = phone_input.findChild(PhoneLineEdit)
+
+    # Focus changes of an unchanged widget don't apply any stylesheets
+    applied = phone_input.getStyleSheetStats()['applied']
+    for i in range(10):
+        phone_line_edit.focus_in.emit()
+        phone_line_edit.focus_out.emit()
+    assert phone_input.getStyleSheetStats()['applied'] == applied
+
+    phone_input.setColor(QColor(255, 0, 0))
+    applied = phone_input.getStyleSheetStats()['applied']
+    assert applied > 0
+
+    phone_input.setColor(QColor(255, 0, 0))
+    assert phone_input.getStyleSheetStats()['applied'] == applied
+
+
+def test_state_changes_without_style_sheets(qtbot):
+    """Test that focus and popup state changes only set a property"""
+
+    phone_input = PhoneInput()
+    qtbot.addWidget(phone_input)
+    phone_input.setFocusedColor(QColor(255, 0, 0))
+    phone_line_edit = phone_input.findChild(PhoneLineEdit)
+
+    applied = phone_input.getStyleSheetStats()['applied']
+    repolished = phone_input.getStyleSheetStats()['repolished']
+
+    phone_line_edit.focus_in.emit()
+    assert phone_line_edit.property('phoneState') == 'focused'
+    phone_line_edit.focus_out.emit()
+    assert phone_line_edit.property('phoneState') == 'normal'
+    phone_input.setDisabled(True)
+    phone_input.setDisabled(False)
+
+    assert phone_input.getStyleSheetStats()['applied'] == applied
+    assert phone_input.getStyleSheetStats()['repolished'] == repolished + 2
+
+
+def test_batch_update(qtbot):
+    """Test that setter calls inside a batch update apply every stylesheet once"""
+
+    phone_input = PhoneInput()
+    qtbot.addWidget(phone_input)
+
+    applied = phone_input.getStyleSheetStats()['applied']
+
+    with phone_input.batchUpdate():
+        phone_input.setColor(QColor(255, 0, 0))
+        phone_input.setBackgroundColor(QColor(250, 250, 250))
+        phone_input.setBorderColor(QColor(0, 0, 255))
+        phone_input.setBorderWidth(2)
+        phone_input.setBorderRadius(5)
+        phone_input.setPadding(QMargins(5, 0, 0, 0))
+        phone_input.setFocusedColor(QColor(0, 255, 0))
+        phone_input.setFocusedBorderColor(QColor(0, 0, 0))
+        phone_input.setDisabledColor(QColor(100, 100, 100))
+        phone_input.setTextSelectionBackgroundColor(QColor(0, 0, 100))
+
+        # Nested updates are only applied by the outermost endUpdate()
+        phone_input.beginUpdate()
+        phone_input.setDisabledBorderColor(QColor(200, 200, 200))
+        phone_input.endUpdate()
+
+        assert phone_input.isUpdating()
+        assert phone_input.getStyleSheetStats()['applied'] == applied
+
+    # LineEdit, phone code LineEdit and dropdown
+    assert not phone_input.isUpdating()
+    assert phone_input.getStyleSheetStats()['applied'] == applied + 3
+    assert phone_input.getBorderWidth() == 2
+
+
+def test_resize_restyle_coalescing(qtbot):
+    """Test that stylesheets are only updated once resize events settle"""
+
+    phone_input = PhoneInput()
+    qtbot.addWidget(phone_input)
+    phone_input.show()
+    qtbot.waitExposed(phone_input)
+
+    applied = phone_input.getStyleSheetStats()['applied']
+
+    for height in range(30, 50):
+        phone_input.resize(200, height)
+        assert phone_input.findChild(PhoneLineEdit).height() == height
+    assert phone_input.getStyleSheetStats()['applied'] == applied
+
+    # The deferral doesn't touch the beginUpdate() depth
+    assert not phone_input.isUpdating()
+    phone_input.endUpdate()
+    assert phone_input.getStyleSheetStats()['applied'] == applied
+
+    # Stylesheets are applied once resize events settle, and not while a batch update is running
+    phone_input.beginUpdate()
+    qtbot.wait(phone_input.getResizeRestyleDelay() * 3)
+    assert phone_input.getStyleSheetStats()['applied'] == applied
+    phone_input.endUpdate()
+    assert applied < phone_input.getStyleSheetStats()['applied'] <= applied + 3
+    assert not phone_input.isUpdating()
+
+
+def test_set_resize_restyle_delay(qtbot):
+    """Test setting the resize restyle delay"""
+
+    phone_input = PhoneInput()
+    qtbot.addWidget(phone_input)
+    phone_input.show()
+    qtbot.waitExposed(phone_input)
+
+    assert phone_input.getResizeRestyleDelay() == 50
+
+    phone_input.setResizeRestyleDelay(0)
+    assert phone_input.getResizeRestyleDelay() == 0
+
+    applied = phone_input.getStyleSheetStats()['applied']
+    phone_input.resize(200, 60)
+    assert not phone_input.isUpdating()
+    assert phone_input.getStyleSheetStats()['applied'] > applied
+
+
+def test_popup_fetches_visible_flags(qtbot):
+    """Test that opening the dropdown only fetches the flags of the visible rows"""
+
+    phone_input = PhoneInput()
+    qtbot.addWidget(phone_input)
+    phone_input.resize(300, 30)
+    phone_input.setCountry('zw')
+    with qtbot.waitExposed(phone_input):
+        phone_input.show()
+
+    clear_flag_cache()
+    country_dropdown = phone_input.findChild(CountryDropdown)
+    country_dropdown.showPopup()
+    qtbot.waitUntil(lambda: country_dropdown.view().isVisible())
+    qtbot.wait(50)
+
+    # Visible rows and the selected country's flag
+    assert 0 < get_flag_cache_stats()['cached'] <= country_dropdown.maxVisibleItems() + 2
+    assert country_dropdown.view().visualRect(country_dropdown.view().currentIndex()).bottom() <= \
+        country_dropdown.view().viewport().height()
+    country_dropdown.hidePopup()
+
+
+def test_validation_state(qtbot):
+    """Test that the input is validated against the rules of the current country"""
+
+    phone_input = PhoneInput()
+    qtbot.addWidget(phone_input)
+    phone_line_edit = phone_input.findChild(PhoneLineEdit)
+    phone_input.setCountry('gb')
+
+    # Trunk prefix and digits beyond the maximum length are rejected while typing
+    qtbot.keyClicks(phone_line_edit, '020 7946 09581')
+    assert phone_input.getInput() == '20 7946 0958'
+    assert phone_input.getValidationState() == QValidator.State.Acceptable
+
+    # Rules switch with the country
+    phone_input.setCountry('fr')
+    assert phone_line_edit.getPhoneNumberValidator().getCountry() == 'fr'
+    assert phone_input.getValidationState() == QValidator.State.Invalid
+
+    phone_input.setInput('612')
+    assert phone_input.getValidationState() == QValidator.State.Intermediate
+
+
+def test_edit_after_country_change(qtbot):
+    """Test that input which became invalid through a country change can still be edited"""
+
+    phone_input = PhoneInput()
+    qtbot.addWidget(phone_input)
+    phone_line_edit = phone_input.findChild(PhoneLineEdit)
+    phone_input.setCountry('gb')
+
+    qtbot.keyClicks(phone_line_edit, '20 7946 0958')
+    phone_input.setCountry('es')
+    assert phone_input.getInput() == '20 7946 0958'
+    assert phone_input.getValidationState() == QValidator.State.Invalid
+
+    qtbot.keyClick(phone_line_edit, Qt.Key.Key_Backspace)
+    assert phone_input.getInput() == '20 7946 095'
+    qtbot.keyClick(phone_line_edit, Qt.Key.Key_Home)
+    qtbot.keyClick(phone_line_edit, Qt.Key.Key_Delete)
+    assert phone_input.getInput() == '0 7946 095'
+
+    # Rules apply again once the input is valid
+    phone_line_edit.selectAll()
+    qtbot.keyClicks(phone_line_edit, '612 345 6789')
+    assert phone_input.getInput() == '612 345 678'
+    assert phone_input.getValidationState() == QValidator.State.Acceptable
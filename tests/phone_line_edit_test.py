@@ -17,6 +17,25 @@ def test_initial_values(qtbot):
     assert phone_line_edit.getBorderWidth() == 0
 
 
+def test_input_without_country_dropdown(qtbot):
+    """Test that digits can be typed without a country dropdown"""
+
+    phone_line_edit = PhoneLineEdit()
+    qtbot.addWidget(phone_line_edit)
+
+    qtbot.keyClicks(phone_line_edit, '012 34a')
+    assert phone_line_edit.text() == '012 34'
+
+    country_dropdown = CountryDropdown()
+    phone_line_edit.setCountryDropdown(country_dropdown)
+    assert phone_line_edit.getPhoneNumberValidator().getCountry() == country_dropdown.getCountry()
+
+    phone_line_edit.setCountryDropdown(None)
+    assert phone_line_edit.getPhoneNumberValidator().getCountry() is None
+    qtbot.keyClicks(phone_line_edit, '5')
+    assert phone_line_edit.text() == '012 345'
+
+
 def test_set_country_dropdown(qtbot):
     """Test setting the country dropdown"""
 
@@ -70,3 +89,36 @@ def test_paint_event(qtbot):
     assert phone_line_edit.getCountryDropdown() == country_dropdown
     assert phone_line_edit.getBorderWidth() == 5
     assert phone_line_edit.getCurrentBorderColor() == color
+
+
+def test_international_number(qtbot):
+    """Test that typing or pasting an international number selects its country"""
+
+    phone_line_edit = PhoneLineEdit()
+    qtbot.addWidget(phone_line_edit)
+
+    country_dropdown = CountryDropdown()
+    phone_line_edit.setCountryDropdown(country_dropdown)
+
+    phone_line_edit.insert('+44 20 7946 0958')
+    assert country_dropdown.getCountry() == 'gb'
+    assert phone_line_edit.text() == '20 7946 0958'
+
+    # Digits that can't start a phone code are rejected
+    phone_line_edit.clear()
+    qtbot.keyClicks(phone_line_edit, '+0')
+    assert phone_line_edit.text() == '+'
+
+    phone_line_edit.clear()
+    qtbot.keyClicks(phone_line_edit, '+35')
+    assert country_dropdown.getCountry() == 'gb'
+    assert phone_line_edit.text() == '+35'
+
+    qtbot.keyClicks(phone_line_edit, '1')
+    assert country_dropdown.getCountry() == 'pt'
+    assert phone_line_edit.text() == ''
+
+    phone_line_edit.setDialCodeTrie(None)
+    phone_line_edit.insert('+1')
+    assert country_dropdown.getCountry() == 'pt'
+    assert phone_line_edit.text() == '+1'
@@ -0,0 +1,93 @@
+import pytest
+from src.pyqt_phone_input.dial_code_trie import get_shared_dial_code_trie
+from src.pyqt_phone_input.phone_number_rules import (PhoneNumberRules, get_shared_phone_number_rules,
+                                                     INVALID, INTERMEDIATE, ACCEPTABLE)
+
+
+def test_validate():
+    """Test validating numbers against the length and leading digit rules"""
+
+    rules = PhoneNumberRules()
+
+    assert rules.validate('us', '') == INTERMEDIATE
+    assert rules.validate('us', '212') == INTERMEDIATE
+    assert rules.validate('us', '212 555 0123') == ACCEPTABLE
+    assert rules.validate('us', '212 555 01234') == INVALID
+    assert rules.validate('us', '112 555 0123') == INVALID
+    assert rules.validate('gb', '20 7946 0958') == ACCEPTABLE
+    assert rules.validate('gb', '020 7946 0958') == INVALID
+    assert rules.validate('it', '06 1234 5678') == ACCEPTABLE
+    assert rules.validate('us', '212-555') == INVALID
+    assert rules.validate('us', '２１２') == INVALID
+    assert rules.validate('xx', '212 555 0123') == INVALID
+
+    # Without a country only digits and the maximum length are checked
+    assert rules.validate(None, '012') == INTERMEDIATE
+    assert rules.validate(None, '0123 4567') == ACCEPTABLE
+    assert rules.validate(None, '1' * 16) == INVALID
+    assert rules.validate(None, '12a') == INVALID
+
+
+def test_shared_phone_codes():
+    """Test that phone code rules apply to every country using the phone code"""
+
+    rules = PhoneNumberRules()
+
+    assert rules.getRule('ca') == rules.getRule('us') == (10, 10, '23456789')
+    assert rules.getRule('va') == rules.getRule('it')
+    assert rules.getRule('kz') == rules.getRule('ru')
+
+
+def test_default_rule():
+    """Test that countries without specific rules accept any digits up to the E.164 length"""
+
+    rules = PhoneNumberRules()
+
+    assert rules.getRule('af') == (4, 13, '0123456789')
+    assert rules.validate('af', '012') == INTERMEDIATE
+    assert rules.validate('af', '0123') == ACCEPTABLE
+    assert rules.validate('af', '0' * 14) == INVALID
+    assert rules.getRule('xx') is None
+
+
+def test_international_numbers():
+    """Test that international numbers stay intermediate until their country is selected"""
+
+    rules = PhoneNumberRules()
+
+    assert rules.validate('us', '+') == INTERMEDIATE
+    assert rules.validate('us', '+44 20') == INTERMEDIATE
+    assert rules.validate('us', '+' + '1' * 16) == INVALID
+    assert rules.validate('us', '+44+') == INVALID
+
+    # Only known phone codes (or prefixes of them) are accepted if a dial code trie is given
+    dial_code_trie = get_shared_dial_code_trie()
+    assert rules.validate('us', '+', dial_code_trie) == INTERMEDIATE
+    assert rules.validate('us', '+4', dial_code_trie) == INTERMEDIATE
+    assert rules.validate('us', '+44 20', dial_code_trie) == INTERMEDIATE
+    assert rules.validate('us', '+0', dial_code_trie) == INVALID
+    assert rules.validate('us', '+999', dial_code_trie) == INVALID
+    assert rules.validate('us', '+999') == INTERMEDIATE
+
+
+def test_set_rule():
+    """Test replacing the rule of a country"""
+
+    rules = PhoneNumberRules({'de': (3, 5, '9')})
+    assert rules.getRule('de') == (3, 5, '9')
+    assert rules.validate('de', '912') == ACCEPTABLE
+
+    rules.setRule('DE', 6, 6)
+    assert rules.getRule('de') == (6, 6, '0123456789')
+    assert rules.validate('de', '912') == INTERMEDIATE
+
+    with pytest.raises(KeyError):
+        rules.setRule('xx', 1, 2)
+    with pytest.raises(ValueError):
+        rules.setRule('de', 5, 4)
+
+
+def test_shared_instance():
+    """Test that the shared rules are only created once"""
+
+    assert get_shared_phone_number_rules() is get_shared_phone_number_rules()
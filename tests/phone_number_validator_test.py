@@ -0,0 +1,104 @@
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QValidator
+from PyQt6.QtWidgets import QLineEdit
+from src.pyqt_phone_input.dial_code_trie import get_shared_dial_code_trie
+from src.pyqt_phone_input.phone_number_rules import PhoneNumberRules
+from src.pyqt_phone_input.phone_number_validator import PhoneNumberValidator
+
+
+def test_states(qtbot):
+    """Test the validator states for the current country"""
+
+    validator = PhoneNumberValidator('US')
+    assert validator.getCountry() == 'us'
+
+    assert validator.validate('212', 3) == (QValidator.State.Intermediate, '212', 3)
+    assert validator.getState('212 555 0123') == QValidator.State.Acceptable
+    assert validator.getState('112') == QValidator.State.Invalid
+
+    # No country set (only digits are checked)
+    assert PhoneNumberValidator().getState('') == QValidator.State.Intermediate
+    assert PhoneNumberValidator().getState('012') == QValidator.State.Intermediate
+    assert PhoneNumberValidator().getState('12a') == QValidator.State.Invalid
+
+    validator.setCountry(None)
+    assert validator.getCountry() is None
+    assert validator.getState('112') == QValidator.State.Intermediate
+
+
+def test_set_country(qtbot):
+    """Test switching the rules by changing the country"""
+
+    validator = PhoneNumberValidator('us')
+
+    with qtbot.waitSignal(validator.changed):
+        validator.setCountry('gb')
+    assert validator.getCountry() == 'gb'
+    assert validator.getState('20 7946 0958') == QValidator.State.Acceptable
+    assert validator.getState('212 555 01234') == QValidator.State.Invalid
+
+
+def test_set_rules(qtbot):
+    """Test using custom rules"""
+
+    rules = PhoneNumberRules({'us': (3, 3, '1')})
+    validator = PhoneNumberValidator('us')
+    validator.setRules(rules)
+
+    assert validator.getRules() is rules
+    assert validator.getState('112') == QValidator.State.Acceptable
+
+
+def test_set_dial_code_trie(qtbot):
+    """Test that international numbers have to start with a known phone code"""
+
+    validator = PhoneNumberValidator('us')
+    assert validator.getDialCodeTrie() is get_shared_dial_code_trie()
+    assert validator.getState('+4') == QValidator.State.Intermediate
+    assert validator.getState('+0') == QValidator.State.Invalid
+
+    with qtbot.waitSignal(validator.changed):
+        validator.setDialCodeTrie(None)
+    assert validator.getDialCodeTrie() is None
+    assert validator.getState('+0') == QValidator.State.Intermediate
+
+
+def test_line_edit(qtbot):
+    """Test that invalid keystrokes are rejected by a LineEdit"""
+
+    line_edit = QLineEdit()
+    qtbot.addWidget(line_edit)
+    line_edit.setValidator(PhoneNumberValidator('us'))
+
+    qtbot.keyClicks(line_edit, '1212555012345')
+    assert line_edit.text() == '2125550123'
+    assert line_edit.hasAcceptableInput()
+
+
+def test_revalidate(qtbot):
+    """Test that text which became invalid stays editable after revalidating"""
+
+    line_edit = QLineEdit()
+    qtbot.addWidget(line_edit)
+    validator = PhoneNumberValidator('gb')
+    line_edit.setValidator(validator)
+    qtbot.keyClicks(line_edit, '2079460958')
+
+    validator.setCountry('es')
+    validator.revalidate(line_edit)
+    qtbot.keyClick(line_edit, Qt.Key.Key_Backspace)
+    assert line_edit.text() == '207946095'
+    assert validator.getState(line_edit.text()) == QValidator.State.Invalid
+
+
+def test_split_phone_number(qtbot):
+    """Test splitting international numbers with the dial code trie"""
+
+    validator = PhoneNumberValidator('us')
+    assert validator.splitPhoneNumber('+44 20 7946 0958') == ('gb', '20 7946 0958')
+    assert validator.splitPhoneNumber('+1 555', 'ca') == ('ca', '555')
+    assert validator.splitPhoneNumber('+4') is None
+    assert validator.splitPhoneNumber('44 20') is None
+
+    validator.setDialCodeTrie(None)
+    assert validator.splitPhoneNumber('+44 20 7946 0958') is None